@@ -209,6 +209,20 @@ def register_core_options():
         help_msg=help_msg,
     )
 
+    help_msg = (
+        "Number of processes used to resolve the test references. "
+        "The default, 1, resolves them on the Avocado process itself. "
+        "With 0, it is chosen based on the number of CPUs and of "
+        "references"
+    )
+    stgs.register_option(
+        section="resolver",
+        key="workers",
+        key_type=int,
+        default=1,
+        help_msg=help_msg,
+    )
+
     help_msg = (
         "Selects the runner implementation from one of the "
         "installed and active implementations.  You can run "
@@ -34,7 +34,7 @@ import tempfile
 import time
 import warnings
 
-from avocado.core import exit_codes, job_id
+from avocado.core import exit_codes, job_id, jobindex
 from avocado.core.output import LOG_JOB, LOG_UI
 from avocado.core.settings import settings
 from avocado.utils import path as utils_path
@@ -325,6 +325,22 @@ def clean_tmp_files():
         pass
 
 
+def _find_job_results_dirs(logs_dir, job_ref):
+    """
+    Finds the job results directories by (a partial) job ID, without an index.
+    """
+    short_jobid = job_ref[:7]
+    if len(short_jobid) < 7:
+        short_jobid += "*"
+    idfile_pattern = os.path.join(logs_dir, f"job-*-{short_jobid}", "id")
+    matches = []
+    for id_file in glob.glob(idfile_pattern):
+        with open(id_file, "r", encoding="utf-8") as fid:
+            if fid.read().strip("\n").startswith(job_ref):
+                matches.append(os.path.dirname(id_file))
+    return matches
+
+
 def get_job_results_dir(job_ref, logs_dir=None):
     """
     Get the job results directory from a job reference.
@@ -368,22 +384,16 @@ def get_job_results_dir(job_ref, logs_dir=None):
         except IOError:
             return None
 
-    matches = 0
-    short_jobid = job_ref[:7]
-    if len(short_jobid) < 7:
-        short_jobid += "*"
-    idfile_pattern = os.path.join(logs_dir, f"job-*-{short_jobid}", "id")
-    match_file = None
-    for id_file in glob.glob(idfile_pattern):
-        with open(id_file, "r", encoding="utf-8") as fid:
-            line = fid.read().strip("\n")
-            if line.startswith(job_ref):
-                match_file = id_file
-                matches += 1
-            if matches > 1:
-                raise ValueError(f"hash '{job_ref}' is not unique enough")
-    if matches == 1:
-        return os.path.dirname(match_file)
+    matches = []
+    if jobindex.is_usable(logs_dir):
+        matches = jobindex.find(logs_dir, job_ref)
+    # the index may miss the jobs created while it was being written
+    if not matches:
+        matches = _find_job_results_dirs(logs_dir, job_ref)
+    if len(matches) > 1:
+        raise ValueError(f"hash '{job_ref}' is not unique enough")
+    if matches:
+        return matches[0]
     return None
 
 
@@ -1,11 +1,17 @@
 # The sqlite based backend is the only implementation
+from avocado.core.dependencies.requirements.cache.asynchronous import (
+    AsyncRequirementCache,
+)
 from avocado.core.dependencies.requirements.cache.backends.sqlite import (
+    clear,
+    close,
     delete_environment,
     delete_requirement,
     get_all_environments_with_requirement,
     is_environment_prepared,
     is_requirement_in_cache,
     set_requirement,
+    set_requirements,
     update_environment,
     update_requirement_status,
 )
@@ -0,0 +1,156 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright: Red Hat Inc. 2026
+
+"""
+Access to the requirements cache that does not block the event loop.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from avocado.core.dependencies.requirements.cache.backends import sqlite
+
+_EXECUTOR = None
+_EXECUTOR_PID = None
+
+
+def _get_executor():
+    global _EXECUTOR, _EXECUTOR_PID  # pylint: disable=W0603
+    # the thread of an executor created by a parent process is not there
+    if _EXECUTOR is None or _EXECUTOR_PID != os.getpid():
+        # the backend serializes the access to its connection anyway
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="requirements-cache"
+        )
+        _EXECUTOR_PID = os.getpid()
+    return _EXECUTOR
+
+
+class AsyncRequirementCache:
+    """Requirements cache, with coroutines run by a thread of their own.
+
+    Requirements found to be saved in the cache are remembered by each
+    instance (usually one per job), and are not looked up again, unless
+    they're changed or removed through that same instance.  Requirements
+    not yet in the cache, or not yet saved, are always looked up, as those
+    may be changed at any time by other jobs.
+    """
+
+    def __init__(self):
+        self._saved = set()
+
+    @staticmethod
+    async def _run(function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_executor(), functools.partial(function, *args)
+        )
+
+    def _forget(self, environment_type, environment, *requirement):
+        key = (environment_type, environment) + requirement
+        self._saved = {saved for saved in self._saved if saved[: len(key)] != key}
+
+    async def is_requirement_in_cache(
+        self, environment_type, environment, requirement_type, requirement
+    ):
+        """Asynchronous version of :func:`sqlite.is_requirement_in_cache`."""
+        key = (environment_type, environment, requirement_type, requirement)
+        if key in self._saved:
+            return True
+        result = await self._run(sqlite.is_requirement_in_cache, *key)
+        if result:
+            self._saved.add(key)
+        return result
+
+    async def set_requirement(
+        self, environment_type, environment, requirement_type, requirement, saved=True
+    ):
+        """Asynchronous version of :func:`sqlite.set_requirement`."""
+        await self._run(
+            sqlite.set_requirement,
+            environment_type,
+            environment,
+            requirement_type,
+            requirement,
+            saved,
+        )
+
+    async def set_requirements(
+        self, environment_type, environment, requirements, saved=True
+    ):
+        """Asynchronous version of :func:`sqlite.set_requirements`."""
+        await self._run(
+            sqlite.set_requirements, environment_type, environment, requirements, saved
+        )
+
+    async def update_requirement_status(
+        self, environment_type, environment, requirement_type, requirement, new_status
+    ):
+        """Asynchronous version of :func:`sqlite.update_requirement_status`."""
+        self._forget(environment_type, environment, requirement_type, requirement)
+        return await self._run(
+            sqlite.update_requirement_status,
+            environment_type,
+            environment,
+            requirement_type,
+            requirement,
+            new_status,
+        )
+
+    async def delete_requirement(
+        self, environment_type, environment, requirement_type, requirement
+    ):
+        """Asynchronous version of :func:`sqlite.delete_requirement`."""
+        self._forget(environment_type, environment, requirement_type, requirement)
+        return await self._run(
+            sqlite.delete_requirement,
+            environment_type,
+            environment,
+            requirement_type,
+            requirement,
+        )
+
+    async def is_environment_prepared(self, environment):
+        """Asynchronous version of :func:`sqlite.is_environment_prepared`."""
+        return await self._run(sqlite.is_environment_prepared, environment)
+
+    async def update_environment(
+        self, environment_type, old_environment, new_environment
+    ):
+        """Asynchronous version of :func:`sqlite.update_environment`."""
+        self._forget(environment_type, old_environment)
+        return await self._run(
+            sqlite.update_environment,
+            environment_type,
+            old_environment,
+            new_environment,
+        )
+
+    async def delete_environment(self, environment_type, environment):
+        """Asynchronous version of :func:`sqlite.delete_environment`."""
+        self._forget(environment_type, environment)
+        return await self._run(sqlite.delete_environment, environment_type, environment)
+
+    async def get_all_environments_with_requirement(
+        self, environment_type, requirement_type, requirement
+    ):
+        """Asynchronous version of
+        :func:`sqlite.get_all_environments_with_requirement`."""
+        return await self._run(
+            sqlite.get_all_environments_with_requirement,
+            environment_type,
+            requirement_type,
+            requirement,
+        )
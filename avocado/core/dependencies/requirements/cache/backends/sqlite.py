@@ -18,12 +18,16 @@ Test requirements module.
 
 import os
 import sqlite3
+import threading
 
 from avocado.core.data_dir import get_datafile_path
 
 #: The location of the requirements cache database
 CACHE_DATABASE_PATH = get_datafile_path("cache", "requirements.sqlite")
 
+#: Seconds to wait for other processes (jobs) holding a lock on the database
+CACHE_DATABASE_TIMEOUT = 30.0
+
 sqlite3.register_adapter(bool, int)
 sqlite3.register_converter("BOOLEAN", lambda v: bool(int(v)))
 
@@ -62,34 +66,153 @@ SCHEMA = [
 ]
 
 
-def _create_requirement_cache_db():
-    os.makedirs(os.path.dirname(CACHE_DATABASE_PATH), exist_ok=True)
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        for entry in SCHEMA:
-            _ = cursor.execute(entry)
-        conn.commit()
+class _Connection:
+    """A connection to the cache database, kept open and reused.
+
+    Opening a connection (and parsing the schema) on every access is
+    expensive, so a single connection is used, as long as it's still
+    connected to the file at :data:`CACHE_DATABASE_PATH`.  It is
+    reopened when that file is replaced (such as when the cache is
+    cleared), and on child processes.  The connection uses the
+    Write-Ahead Log journal mode, so jobs reading the cache don't
+    block on jobs writing to it, and SQLite's statement cache, so
+    statements are prepared only once.
+    """
+
+    def __init__(self):
+        #: Serializes the use of the connection among threads
+        self.lock = threading.RLock()
+        self._connection = None
+        self._identity = None
+        self._pid = None
+
+    def get(self, create=False):
+        """Returns the connection, or None if the database does not exist.
+
+        Must be called with :attr:`lock` held.
+
+        :param create: whether to create the database if it does not exist
+        """
+        identity = self._get_identity()
+        if identity is None:
+            if not create:
+                return None
+            os.makedirs(os.path.dirname(CACHE_DATABASE_PATH), exist_ok=True)
+        if self._connection is None or self._identity != identity:
+            self.close()
+            self._connection = self._connect()
+            self._identity = self._get_identity()
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _get_identity():
+        try:
+            stat = os.stat(CACHE_DATABASE_PATH)
+        except FileNotFoundError:
+            return None
+        return (CACHE_DATABASE_PATH, stat.st_dev, stat.st_ino, os.getpid())
+
+    @staticmethod
+    def _connect():
+        connection = sqlite3.connect(
+            CACHE_DATABASE_PATH,
+            timeout=CACHE_DATABASE_TIMEOUT,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            for entry in SCHEMA:
+                connection.execute(entry)
+        return connection
+
+    def close(self):
+        with self.lock:
+            # a connection inherited from the parent process is not closed,
+            # as that could affect the parent's use of it
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._identity = None
+
+
+_CONNECTION = _Connection()
+
+
+def close():
+    """Closes the connection to the cache database, if open."""
+    _CONNECTION.close()
+
+
+def clear():
+    """Removes the cache database, with all its content."""
+    with _CONNECTION.lock:
+        _CONNECTION.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(CACHE_DATABASE_PATH + suffix)
+            except FileNotFoundError:
+                pass
+
+
+def _set_requirement(
+    conn, environment_type, environment, requirement_type, requirement, saved
+):
+    sql = "INSERT OR IGNORE INTO environment_type VALUES (?)"
+    conn.execute(sql, (environment_type,))
+    sql = "INSERT OR IGNORE INTO environment VALUES (?, ?)"
+    conn.execute(sql, (environment_type, environment))
+    sql = "INSERT OR IGNORE INTO requirement_type VALUES (?)"
+    conn.execute(sql, (requirement_type,))
+    sql = "INSERT OR IGNORE INTO requirement VALUES (?, ?, ?, ?, ?)"
+    conn.execute(
+        sql, (environment_type, environment, requirement_type, requirement, saved)
+    )
 
 
 def set_requirement(
     environment_type, environment, requirement_type, requirement, saved=True
 ):
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        _create_requirement_cache_db()
-
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        sql = "INSERT OR IGNORE INTO environment_type VALUES (?)"
-        cursor.execute(sql, (environment_type,))
-        sql = "INSERT OR IGNORE INTO environment VALUES (?, ?)"
-        cursor.execute(sql, (environment_type, environment))
-        sql = "INSERT OR IGNORE INTO requirement_type VALUES (?)"
-        cursor.execute(sql, (requirement_type,))
-        sql = "INSERT OR IGNORE INTO requirement VALUES (?, ?, ?, ?, ?)"
-        cursor.execute(
-            sql, (environment_type, environment, requirement_type, requirement, saved)
-        )
-        conn.commit()
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get(create=True)
+        with conn:
+            _set_requirement(
+                conn,
+                environment_type,
+                environment,
+                requirement_type,
+                requirement,
+                saved,
+            )
+
+
+def set_requirements(environment_type, environment, requirements, saved=True):
+    """Sets many requirements of one environment, in a single transaction.
+
+    :param environment_type: Type of environment
+    :type environment_type: str
+    :param environment: Environment where the requirements are
+    :type environment: str
+    :param requirements: the requirements, as (requirement_type,
+                         requirement) tuples
+    :type requirements: list
+    :param saved: whether the requirements are already saved
+    :type saved: bool
+    """
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get(create=True)
+        with conn:
+            for requirement_type, requirement in requirements:
+                _set_requirement(
+                    conn,
+                    environment_type,
+                    environment,
+                    requirement_type,
+                    requirement,
+                    saved,
+                )
 
 
 def is_requirement_in_cache(
@@ -101,9 +224,6 @@ def is_requirement_in_cache(
             False if requirement is not in cache
             None if requirement is in cache but it is not saved yet.
     """
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return False
-
     sql = (
         "SELECT r.saved FROM requirement r WHERE ("
         "environment_type = ? AND "
@@ -112,25 +232,24 @@ def is_requirement_in_cache(
         "requirement = ?)"
     )
 
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return False
+        result = conn.execute(
             sql, (environment_type, environment, requirement_type, requirement)
         )
         row = result.fetchone()
-        if row is not None:
-            if row[0]:
-                return True
-            return None
+    if row is not None:
+        if row[0]:
+            return True
+        return None
     return False
 
 
 def is_environment_prepared(environment):
     """Checks if environment has all requirements saved."""
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return False
-
     sql = (
         "SELECT COUNT(*) FROM requirement r JOIN "
         "environment e ON e.environment = r.environment "
@@ -138,15 +257,13 @@ def is_environment_prepared(environment):
         "r.saved = 0)"
     )
 
-    with sqlite3.connect(
-        CACHE_DATABASE_PATH, detect_types=sqlite3.PARSE_DECLTYPES
-    ) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(sql, (environment,))
-
-        row = result.fetchone()
-        if row is not None:
-            return row[0] == 0
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return False
+        row = conn.execute(sql, (environment,)).fetchone()
+    if row is not None:
+        return row[0] == 0
     return False
 
 
@@ -163,30 +280,29 @@ def update_environment(environment_type, old_environment, new_environment):
                             old one.
     :type environment: str
     """
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return False
-
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        sql = "INSERT OR IGNORE INTO environment VALUES (?, ?)"
-        cursor.execute(sql, (environment_type, new_environment))
-
-        sql = (
-            "UPDATE requirement SET environment = ? WHERE ("
-            "environment_type = ? AND "
-            "environment = ? )"
-        )
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return False
+        with conn:
+            sql = "INSERT OR IGNORE INTO environment VALUES (?, ?)"
+            conn.execute(sql, (environment_type, new_environment))
+
+            sql = (
+                "UPDATE requirement SET environment = ? WHERE ("
+                "environment_type = ? AND "
+                "environment = ? )"
+            )
 
-        cursor.execute(sql, (new_environment, environment_type, old_environment))
+            conn.execute(sql, (new_environment, environment_type, old_environment))
 
-        sql = (
-            "DELETE FROM environment WHERE ("
-            "environment_type = ? AND "
-            "environment = ? )"
-        )
+            sql = (
+                "DELETE FROM environment WHERE ("
+                "environment_type = ? AND "
+                "environment = ? )"
+            )
 
-        cursor.execute(sql, (environment_type, old_environment))
-        conn.commit()
+            conn.execute(sql, (environment_type, old_environment))
 
 
 def update_requirement_status(
@@ -208,9 +324,6 @@ def update_requirement_status(
     :type new_status: bool
     """
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return False
-
     sql = (
         "UPDATE requirement SET saved = ? WHERE ("
         "environment_type = ? AND "
@@ -219,13 +332,21 @@ def update_requirement_status(
         "requirement = ?)"
     )
 
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            sql,
-            (new_status, environment_type, environment, requirement_type, requirement),
-        )
-        conn.commit()
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return False
+        with conn:
+            conn.execute(
+                sql,
+                (
+                    new_status,
+                    environment_type,
+                    environment,
+                    requirement_type,
+                    requirement,
+                ),
+            )
 
     return True
 
@@ -239,24 +360,23 @@ def delete_environment(environment_type, environment):
     :type environment: str
     """
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return False
-
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        sql = (
-            "DELETE FROM requirement WHERE ("
-            "environment_type = ? AND "
-            "environment = ? )"
-        )
-        cursor = conn.cursor()
-        cursor.execute(sql, (environment_type, environment))
-        sql = (
-            "DELETE FROM environment WHERE ("
-            "environment_type = ? AND "
-            "environment = ? )"
-        )
-        cursor.execute(sql, (environment_type, environment))
-        conn.commit()
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return False
+        with conn:
+            sql = (
+                "DELETE FROM requirement WHERE ("
+                "environment_type = ? AND "
+                "environment = ? )"
+            )
+            conn.execute(sql, (environment_type, environment))
+            sql = (
+                "DELETE FROM environment WHERE ("
+                "environment_type = ? AND "
+                "environment = ? )"
+            )
+            conn.execute(sql, (environment_type, environment))
 
 
 def delete_requirement(environment_type, environment, requirement_type, requirement):
@@ -272,22 +392,21 @@ def delete_requirement(environment_type, environment, requirement_type, requirem
     :type requirement: str
     """
 
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return False
-
-    with sqlite3.connect(CACHE_DATABASE_PATH) as conn:
-        sql = (
-            "DELETE FROM requirement WHERE ("
-            "environment_type = ? AND "
-            "environment = ? AND "
-            "requirement_type = ? AND "
-            "requirement = ?)"
-        )
-        cursor = conn.cursor()
-        cursor.execute(
-            sql, (environment_type, environment, requirement_type, requirement)
-        )
-        conn.commit()
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return False
+        with conn:
+            sql = (
+                "DELETE FROM requirement WHERE ("
+                "environment_type = ? AND "
+                "environment = ? AND "
+                "requirement_type = ? AND "
+                "requirement = ?)"
+            )
+            conn.execute(
+                sql, (environment_type, environment, requirement_type, requirement)
+            )
 
 
 def get_all_environments_with_requirement(
@@ -305,9 +424,6 @@ def get_all_environments_with_requirement(
 
     """
     requirements = {}
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return requirements
-
     environment_select = (
         "SELECT e.environment FROM requirement r JOIN "
         "environment e ON e.environment = r.environment "
@@ -321,17 +437,19 @@ def get_all_environments_with_requirement(
         f"WHERE r.environment = e.environment"
     )
 
-    with sqlite3.connect(
-        CACHE_DATABASE_PATH, detect_types=sqlite3.PARSE_DECLTYPES
-    ) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(sql, (environment_type, requirement_type, requirement))
-
-        for row in result.fetchall():
-            if row[0] in requirements:
-                requirements[row[0]].append((row[1], row[2]))
-            else:
-                requirements[row[0]] = [(row[1], row[2])]
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return requirements
+        rows = conn.execute(
+            sql, (environment_type, requirement_type, requirement)
+        ).fetchall()
+
+    for row in rows:
+        if row[0] in requirements:
+            requirements[row[0]].append((row[1], row[2]))
+        else:
+            requirements[row[0]] = [(row[1], row[2])]
     return requirements
 
 
@@ -342,26 +460,23 @@ def get_all_requirements():
 
     """
     requirements = {}
-    if not os.path.exists(CACHE_DATABASE_PATH):
-        return requirements
-
     sql = "SELECT * FROM requirement"
 
-    with sqlite3.connect(
-        CACHE_DATABASE_PATH, detect_types=sqlite3.PARSE_DECLTYPES
-    ) as conn:
-        cursor = conn.cursor()
-        result = cursor.execute(sql)
-
-        for row in result.fetchall():
-            environment_type = row[0]
-            if environment_type not in requirements:
-                requirements[environment_type] = []
-            requirements[environment_type].append(
-                {
-                    "environment": row[1],
-                    "requirement_type": row[2],
-                    "requirement": row[3],
-                }
-            )
+    with _CONNECTION.lock:
+        conn = _CONNECTION.get()
+        if conn is None:
+            return requirements
+        rows = conn.execute(sql).fetchall()
+
+    for row in rows:
+        environment_type = row[0]
+        if environment_type not in requirements:
+            requirements[environment_type] = []
+        requirements[environment_type].append(
+            {
+                "environment": row[1],
+                "requirement_type": row[2],
+                "requirement": row[3],
+            }
+        )
     return requirements
@@ -36,6 +36,7 @@ from avocado.core import (
     exceptions,
     exit_codes,
     jobdata,
+    jobindex,
     output,
     result,
     version,
@@ -650,6 +651,10 @@ class Job:
                 self._time_end = time.monotonic()
             self.time_elapsed = self._time_end - self._time_start
             self.render_results()
+            try:
+                jobindex.record(self)
+            except OSError as details:
+                LOG_JOB.warning("Unable to update the jobs index: %s", details)
             pre_post_dispatcher.map_method("post", self)
 
     def run_tests(self):
@@ -0,0 +1,248 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright: Red Hat Inc. 2026
+
+"""
+Index of the jobs in a job results (logs) directory
+
+The index is a JSON Lines file, at the top of the job results
+directory, with one entry per job: its ID, the name of its results
+directory, its start time and the count of test results (named as in
+"results.json").  Jobs add their entries, in a single append, when they
+finish.  The directories not found in the index (such as the ones of
+jobs that are still running or were killed) are added to it, by reading
+them from disk, whenever the job results directory has changed after
+the index was last written.
+"""
+
+import json
+import os
+
+INDEX_FILENAME = "jobs-index.jsonl"
+
+#: The counters of test results kept on each entry, and the respective
+#: attributes of :class:`avocado.core.result.Result`
+COUNTERS = (
+    ("total", "tests_total"),
+    ("pass", "passed"),
+    ("skip", "skipped"),
+    ("errors", "errors"),
+    ("failures", "failed"),
+    ("warn", "warned"),
+    ("interrupt", "interrupted"),
+    ("cancel", "cancelled"),
+)
+
+
+def _get_index_path(logs_dir):
+    return os.path.join(logs_dir, INDEX_FILENAME)
+
+
+def _read(index_path, job_ref=None):
+    """
+    Reads the entries on the index, by the name of the job directory.
+
+    Entries that can not be read are ignored, and later entries for the
+    same directory replace (and move to the end) the previous ones.  If
+    `job_ref` is given, only lines containing it are parsed.
+    """
+    entries = {}
+    with open(index_path, "r", encoding="utf-8") as index:
+        for line in index:
+            if job_ref is not None and job_ref not in line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict) or not {"id", "path"} <= entry.keys():
+                continue
+            entries.pop(entry["path"], None)
+            entries[entry["path"]] = entry
+    return entries
+
+
+def _read_job_dir(logs_dir, name):
+    job_dir = os.path.join(logs_dir, name)
+    try:
+        with open(os.path.join(job_dir, "id"), "r", encoding="utf-8") as id_file:
+            entry = {"id": id_file.read().strip(), "path": name, "start": None}
+    except OSError:
+        return None
+    try:
+        with open(
+            os.path.join(job_dir, "results.json"), "r", encoding="utf-8"
+        ) as results_file:
+            results = json.load(results_file)
+    except (OSError, ValueError):
+        return entry
+    entry["start"] = results.get("start")
+    for key, _ in COUNTERS:
+        entry[key] = results.get(key)
+    return entry
+
+
+def _write(index_path, entries):
+    tmp_path = f"{index_path}.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as index:
+        for entry in entries:
+            index.write(f"{json.dumps(entry)}\n")
+    os.replace(tmp_path, index_path)
+    # the replacement changes the directory, so the index must look newer
+    os.utime(index_path)
+
+
+def _is_current(logs_dir, index_path):
+    try:
+        return os.stat(logs_dir).st_mtime_ns <= os.stat(index_path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def is_usable(logs_dir):
+    """
+    Tells whether an index exists, or can be created, on a directory.
+    """
+    return os.path.isfile(_get_index_path(logs_dir)) or os.access(logs_dir, os.W_OK)
+
+
+def load(logs_dir, rebuild=False):
+    """
+    Returns the entries of the jobs in a job results directory.
+
+    The index is brought up to date with the job directories first, if
+    needed.  When the index can not be written, the entries are still
+    returned, but the job directories will be read again next time.
+
+    :param logs_dir: the job results directory
+    :param rebuild: whether to discard the current index, and read all
+                    job directories again
+    :returns: the entries, from the least to the most recently finished
+              (or found) job
+    :rtype: list of dict
+    """
+    index_path = _get_index_path(logs_dir)
+    entries = {}
+    if not rebuild:
+        try:
+            entries = _read(index_path)
+        except FileNotFoundError:
+            rebuild = True
+    if not rebuild and _is_current(logs_dir, index_path):
+        return list(entries.values())
+
+    try:
+        with os.scandir(logs_dir) as scanned:
+            job_dirs = {
+                dir_entry.name: dir_entry
+                for dir_entry in scanned
+                if dir_entry.name.startswith("job-")
+                and dir_entry.is_dir(follow_symlinks=False)
+            }
+    except FileNotFoundError:
+        return []
+
+    entries = {path: entry for path, entry in entries.items() if path in job_dirs}
+    for name in sorted(
+        job_dirs.keys() - entries.keys(), key=lambda n: job_dirs[n].stat().st_mtime
+    ):
+        entry = _read_job_dir(logs_dir, name)
+        if entry is not None:
+            entries[name] = entry
+    try:
+        _write(index_path, entries.values())
+    except OSError:
+        pass
+    return list(entries.values())
+
+
+def _append(logs_dir, entry):
+    """
+    Appends an entry to the index, in a single write.
+
+    Concurrent jobs can then append their entries safely.  If there's no
+    index yet, nothing is done, because the index will be created
+    (including the directory of the given entry) the next time it's
+    loaded.
+
+    The modification time of the index tells when the job directories
+    were last read, so it's kept as it was: otherwise, the directories
+    created since then (such as the ones of running or killed jobs)
+    would never be added to the index.
+    """
+    index_path = _get_index_path(logs_dir)
+    try:
+        fd = os.open(index_path, os.O_WRONLY | os.O_APPEND)
+    except FileNotFoundError:
+        return
+    try:
+        stat = os.fstat(fd)
+        os.write(fd, f"{json.dumps(entry)}\n".encode("utf-8"))
+        os.utime(fd, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    finally:
+        os.close(fd)
+
+
+def find(logs_dir, job_ref):
+    """
+    Finds the results directories of jobs by (a partial) job ID.
+
+    :param logs_dir: the job results directory
+    :param job_ref: the beginning of the job ID
+    :returns: the paths of the results directories of the jobs whose
+              ID start with `job_ref`
+    :rtype: list of str
+    """
+    index_path = _get_index_path(logs_dir)
+    if _is_current(logs_dir, index_path):
+        entries = _read(index_path, job_ref).values()
+    else:
+        entries = load(logs_dir)
+    return [
+        os.path.join(logs_dir, entry["path"])
+        for entry in entries
+        if entry["id"].startswith(job_ref)
+    ]
+
+
+def record(job):
+    """
+    Adds the entry of a finished job to the index.
+
+    :param job: a finished job
+    :type job: :class:`avocado.core.job.Job`
+    """
+    logs_dir, name = os.path.split(job.logdir)
+    entry = {
+        "id": job.unique_id,
+        "path": name,
+        "start": str(job.result.job_start_date_time),
+    }
+    if job.result.tests_total:
+        for key, attribute in COUNTERS:
+            entry[key] = getattr(job.result, attribute)
+    _append(logs_dir, entry)
+
+
+def update(job_dir):
+    """
+    Updates the entry of a job on the index, by reading its directory.
+
+    This is useful when the results of a job are changed after it
+    finished, such as when they're regenerated.
+
+    :param job_dir: the results directory of the job
+    """
+    logs_dir, name = os.path.split(os.path.abspath(job_dir))
+    entry = _read_job_dir(logs_dir, name)
+    if entry is not None:
+        _append(logs_dir, entry)
@@ -12,9 +12,11 @@
 # Copyright: Red Hat Inc. 2021
 # Authors: Jan Richter <jarichte@redhat.com>
 
+import locale
 import logging
 import os
 import time
+from collections import OrderedDict
 
 from avocado.core.nrunner.task import TASK_DEFAULT_CATEGORY
 from avocado.core.output import LOG_UI
@@ -22,6 +24,91 @@ from avocado.core.test_id import TestID
 
 DEFAULT_LOG_FILE = "debug.log"
 
+#: The maximum number of files kept open by a :class:`FileHandlePool`
+DEFAULT_FILE_HANDLE_POOL_SIZE = 128
+
+#: The maximum size of an incomplete line kept, for each task, while
+#: waiting for its end.  Longer lines are saved as they are
+MAX_LINE_BUFFER_SIZE = 2**16
+
+
+class FileHandlePool:
+    """
+    Bounded pool of open files, used to save the task messages.
+
+    Files are kept open, in append mode, between messages, so that each
+    message does not cost an open and close of the file.  When the limit
+    of open files is reached, the least recently used file is closed.
+    Files are keyed by the task they belong to, so that they can be
+    closed (and their content flushed) once the task finishes.
+    """
+
+    def __init__(self, max_size=DEFAULT_FILE_HANDLE_POOL_SIZE):
+        """
+        :param max_size: maximum number of files kept open at once
+        :type max_size: int
+        """
+        self.max_size = max_size
+        self._files = OrderedDict()
+        #: Number of writes to files that were already open
+        self.hits = 0
+        #: Number of writes that required opening the file
+        self.misses = 0
+        #: Number of files closed to make room for other files
+        self.evictions = 0
+
+    @property
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return self.hits / total
+
+    def _get(self, task_id, path):
+        key = (task_id, path)
+        fp = self._files.get(key)
+        if fp is not None:
+            self.hits += 1
+            self._files.move_to_end(key)
+            return fp
+        self.misses += 1
+        while len(self._files) >= self.max_size:
+            _, evicted = self._files.popitem(last=False)
+            evicted.close()
+            self.evictions += 1
+        fp = open(path, "ab")  # pylint: disable=R1732
+        self._files[key] = fp
+        return fp
+
+    def write(self, task_id, path, data):
+        """Appends data to a file.
+
+        :param task_id: identifier of the task the file belongs to
+        :type task_id: str
+        :param path: path of the file
+        :type path: str
+        :param data: the content to be appended to the file
+        :type data: bytes
+        """
+        self._get(task_id, path).write(data)
+
+    def close_task(self, task_id):
+        """Closes all the files that belong to a given task."""
+        for key in [key for key in self._files if key[0] == task_id]:
+            self._files.pop(key).close()
+
+    def close(self):
+        """Closes all the files in the pool."""
+        while self._files:
+            _, fp = self._files.popitem(last=False)
+            fp.close()
+
+    def __repr__(self):
+        return (
+            f'<FileHandlePool open="{len(self._files)}" hits="{self.hits}" '
+            f'misses="{self.misses}" evictions="{self.evictions}">'
+        )
+
 
 class BaseMessageHandler:
     """
@@ -59,35 +146,52 @@ class BaseMessageHandler:
 class MessageHandler(BaseMessageHandler):
     """Entry point for handling messages."""
 
-    def __init__(self):
+    def __init__(self, file_pool_size=DEFAULT_FILE_HANDLE_POOL_SIZE):
+        #: Files written by the handlers of running messages
+        self.file_pool = FileHandlePool(file_pool_size)
         self._handlers = {
             "started": [StartMessageHandler()],
             "finished": [FinishMessageHandler()],
-            "running": [RunningMessageHandler()],
+            "running": [RunningMessageHandler(self.file_pool)],
         }
 
     def process_message(self, message, task, job):
+        if message.get("status") == "finished":
+            # the task files may be read by the handling of its end
+            for handler in self._handlers["running"]:
+                handler.flush_task(task)
+            self.file_pool.close_task(task.identifier)
         for handler in self._handlers.get(message.get("status"), []):
             handler.process_message(message, task, job)
 
+    def close(self):
+        """Closes the files that are still open, such as of unfinished tasks."""
+        self.file_pool.close()
+
 
 class RunningMessageHandler(BaseMessageHandler):
     """Entry point for handling running messages."""
 
-    def __init__(self):
+    def __init__(self, file_pool=None):
         self._handlers = {
-            "log": [LogMessageHandler()],
-            "stdout": [StdoutMessageHandler()],
-            "stderr": [StderrMessageHandler()],
-            "whiteboard": [WhiteboardMessageHandler()],
-            "output": [OutputMessageHandler()],
-            "file": [FileMessageHandler()],
+            "log": [LogMessageHandler(file_pool)],
+            "stdout": [StdoutMessageHandler(file_pool)],
+            "stderr": [StderrMessageHandler(file_pool)],
+            "whiteboard": [WhiteboardMessageHandler(file_pool)],
+            "output": [OutputMessageHandler(file_pool)],
+            "file": [FileMessageHandler(file_pool)],
         }
 
     def process_message(self, message, task, job):
         for handler in self._handlers.get(message.get("type"), []):
             handler.process_message(message, task, job)
 
+    def flush_task(self, task):
+        """Saves the data still kept by the handlers for the given task."""
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler.flush_task(task)
+
 
 class StartMessageHandler(BaseMessageHandler):
     """
@@ -123,8 +227,10 @@ class StartMessageHandler(BaseMessageHandler):
         logfile = os.path.join(task_path, DEFAULT_LOG_FILE)
         os.makedirs(task_path, exist_ok=True)
         params = []
-        symlink_dir = task.metadata.get("symlink")
-        if symlink_dir:
+        symlink_dirs = list(task.metadata.get("symlinks", []))
+        if task.metadata.get("symlink"):
+            symlink_dirs.append(task.metadata["symlink"])
+        for symlink_dir in symlink_dirs:
             os.makedirs(
                 os.path.abspath(os.path.join(symlink_dir, os.pardir)), exist_ok=True
             )
@@ -217,33 +323,65 @@ class BaseRunningMessageHandler(BaseMessageHandler):
 
     _tag = b""
 
-    def __init__(self):
-        self.line_buffer = b""
+    def __init__(self, file_pool=None):
+        """
+        :param file_pool: pool of open files, where messages are saved to.
+                          If not given, files are opened and closed for
+                          every message.
+        :type file_pool: :class:`FileHandlePool`
+        """
+        #: Incomplete lines, waiting for their end, by task identifier
+        self.line_buffers = {}
+        self._file_pool = file_pool
 
-    def _split_complete_lines(self, data):
+    def _split_complete_lines(self, data, task_id=None):
         """
         It will split data into list of lines.
 
         If the data don't finish with the new line character, the last line is
-        marked as incomplete, and it is saved to the line buffer for next usage.
+        marked as incomplete, and it is saved to the line buffer of the task
+        for next usage.  An incomplete line that grows beyond
+        :data:`MAX_LINE_BUFFER_SIZE` is returned as it is.
 
         When the buffer is not empty the buffer will be added at the beginning
         of data.
 
         :param data: massage log
         :type data: bytes
+        :param task_id: identifier of the task that produced the data
         :return: list of lines
         """
+        line_buffer = self.line_buffers.pop(task_id, b"")
         data_lines = data.splitlines(True)
         if len(data_lines) <= 1 and not data.endswith(b"\n"):
-            self.line_buffer += data
-            return []
+            line_buffer += data
+            data_lines = []
         else:
-            data_lines[0] = self.line_buffer + data_lines[0]
-            self.line_buffer = b""
+            data_lines[0] = line_buffer + data_lines[0]
+            line_buffer = b""
             if not data.endswith(b"\n"):
-                self.line_buffer = data_lines.pop()
-            return data_lines
+                line_buffer = data_lines.pop()
+        if len(line_buffer) > MAX_LINE_BUFFER_SIZE:
+            data_lines.append(line_buffer + b"\n")
+        elif line_buffer:
+            self.line_buffers[task_id] = line_buffer
+        return data_lines
+
+    def flush_task(self, task):
+        """
+        Saves the incomplete line kept for a task, if any.
+
+        This is meant to be used when no more messages are expected from
+        the task, such as when it finishes.
+
+        :param task: runtime_task which message is related to
+        :type task: :class:`avocado.core.nrunner.Task`
+        """
+        line_buffer = self.line_buffers.pop(task.identifier, b"")
+        if line_buffer:
+            self._save_message_to_file(
+                DEFAULT_LOG_FILE, self._tag + line_buffer + b"\n", task
+            )
 
     def _save_to_default_file(self, message, task):
         """
@@ -261,7 +399,7 @@ class BaseRunningMessageHandler(BaseMessageHandler):
         if message.get("encoding"):
             data = message.get("log", b"").splitlines(True)
         else:
-            data = self._split_complete_lines(message.get("log", b""))
+            data = self._split_complete_lines(message.get("log", b""), task.identifier)
 
         if data:
             data = self._tag + self._tag.join(data)
@@ -288,8 +426,7 @@ class BaseRunningMessageHandler(BaseMessageHandler):
             message = f"{message}\n"
         return message
 
-    @staticmethod
-    def _save_message_to_file(filename, buff, task, encoding=None):
+    def _save_message_to_file(self, filename, buff, task, encoding=None):
         """
         Method for saving messages into the file
 
@@ -307,17 +444,15 @@ class BaseRunningMessageHandler(BaseMessageHandler):
         :param encoding: encoding of buff, default is None
         :type encoding: str
         """
-
-        def _save_to_file(file_name, mode):
-            with open(file_name, mode) as fp:  # pylint: disable=W1514
-                fp.write(buff)
-
         file = os.path.join(task.metadata["task_path"], filename)
         if encoding:
             buff = BaseRunningMessageHandler._message_to_line(buff, encoding)
-            _save_to_file(file, "a")
+            buff = buff.encode(locale.getpreferredencoding(False))
+        if self._file_pool is not None:
+            self._file_pool.write(task.identifier, file, buff)
         else:
-            _save_to_file(file, "ab")
+            with open(file, "ab") as fp:
+                fp.write(buff)
 
 
 class LogMessageHandler(BaseRunningMessageHandler):
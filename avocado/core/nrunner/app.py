@@ -5,7 +5,7 @@ import os
 import re
 import sys
 
-from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.runnable import RUNNER_APP_CONFIGURATION_USED, Runnable
 from avocado.core.nrunner.task import TASK_DEFAULT_CATEGORY, Task
 from avocado.core.utils.entry_points import get_entry_points_for
 
@@ -224,7 +224,7 @@ class BaseRunnerApp:
         :returns: the configuration keys (aka namespaces) used by known runners
         :rtype: list
         """
-        config_used = []
+        config_used = list(RUNNER_APP_CONFIGURATION_USED)
         for kind in self.RUNNABLE_KINDS_CAPABLE:
             for ep in get_entry_points_for("avocado.plugins.runnable.runner"):
                 if ep.name == kind:
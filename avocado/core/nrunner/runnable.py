@@ -39,6 +39,21 @@ SYSTEM_WIDE_SCHEMA_PATH = "/usr/share/avocado/schemas"
 #: own class attribute "CONFIGURATION_USED"
 CONFIGURATION_USED = ["runner.identifier_format"]
 
+#: Configuration used by all runners built on top of the Avocado runner
+#: application (:class:`avocado.core.nrunner.app.BaseRunnerApp`).  Runners
+#: that are not, don't report using them, and thus will never be asked
+#: to use features (such as a different status protocol) they don't know
+RUNNER_APP_CONFIGURATION_USED = ["run.status_server_protocol"]
+
+#: The maximum number of filtered runnable configurations kept to be
+#: shared, so that long lived processes don't keep all the ones ever used
+INTERNED_CONFIGS_MAX = 256
+
+#: The filtered runnable configurations, shared by all runnables of the
+#: same kind that have the same configuration values, from the least to
+#: the most recently used
+_INTERNED_CONFIGS = collections.OrderedDict()
+
 
 class RunnableRecipeInvalidError(Exception):
     """Signals that a runnable recipe is not well formed, contains
@@ -83,6 +98,21 @@ def _key_val_args_to_kwargs(kwargs):
     return result
 
 
+def _intern_config(kind, config):
+    try:
+        key = (kind, json.dumps(config, cls=ConfigEncoder, sort_keys=True))
+    except (TypeError, ValueError):
+        return config
+    interned = _INTERNED_CONFIGS.get(key)
+    if interned is not None:
+        _INTERNED_CONFIGS.move_to_end(key)
+        return interned
+    _INTERNED_CONFIGS[key] = config
+    if len(_INTERNED_CONFIGS) > INTERNED_CONFIGS_MAX:
+        _INTERNED_CONFIGS.popitem(last=False)
+    return config
+
+
 class Runnable:
     """
     Describes an entity that be executed in the context of a task
@@ -91,6 +121,21 @@ class Runnable:
     execute a runnable.
     """
 
+    __slots__ = (
+        "kind",
+        "uri",
+        "_default_config",
+        "_config",
+        "args",
+        "tags",
+        "dependencies",
+        "variant",
+        "output_dir",
+        "assets",
+        "kwargs",
+        "_identifier",
+    )
+
     def __init__(self, kind, uri, *args, config=None, identifier=None, **kwargs):
         self.kind = kind
         #: The main reference to what needs to be run.  This is free
@@ -358,7 +403,9 @@ class Runnable:
         configuration_used = []
         klass = cls.pick_runner_class_from_entry_point_kind(kind)
         if klass is not None:
-            configuration_used = klass.CONFIGURATION_USED
+            configuration_used = (
+                klass.CONFIGURATION_USED + RUNNER_APP_CONFIGURATION_USED
+            )
         else:
             command = Runnable.pick_runner_command(kind)
             if command is not None:
@@ -381,7 +428,9 @@ class Runnable:
                        used.
         :type config: dict
         :returns: Config dict, which has only values essential for runner
-                  based on STANDALONE_EXECUTABLE_CONFIG_USED
+                  based on STANDALONE_EXECUTABLE_CONFIG_USED.  The same dict
+                  is returned for the same kind and values, so it must not
+                  be changed in place.
         :rtype: dict
         """
         whole_config = settings.as_dict()
@@ -391,7 +440,7 @@ class Runnable:
             filtered_config[config_item] = config.get(
                 config_item, whole_config.get(config_item)
             )
-        return filtered_config
+        return _intern_config(kind, filtered_config)
 
     def read_dependencies(self, dependencies_dict):
         """
@@ -1,3 +1,6 @@
+import contextlib
+import os
+import select
 import time
 
 from avocado.core.nrunner.runnable import RUNNERS_REGISTRY_STANDALONE_EXECUTABLE
@@ -40,6 +43,41 @@ def check_runnables_runner_requirements(runnables, runners_registry=None):
     return (ok, missing)
 
 
+def get_queue_waiter(queue):
+    """Returns a callable that waits for a message on a queue.
+
+    The callable is given the maximum amount of time (in seconds) to
+    wait, and returns whether there's a message available.
+
+    :param queue: the queue the messages are put on
+    :type queue: :class:`multiprocessing.SimpleQueue`
+    """
+    return queue._reader.poll  # pylint: disable=W0212
+
+
+@contextlib.contextmanager
+def process_waiter(pid):
+    """Provides a callable that waits for the end of a child process.
+
+    The callable is given the maximum amount of time (in seconds) to
+    wait.  It blocks on a file descriptor referring to the process, so
+    no time is spent until the process ends, except on platforms without
+    those, where it sleeps for :data:`RUNNER_RUN_CHECK_INTERVAL` only.
+
+    :param pid: the process ID of the child process
+    :type pid: int
+    """
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        yield lambda timeout: time.sleep(min(timeout, RUNNER_RUN_CHECK_INTERVAL))
+        return
+    try:
+        yield lambda timeout: select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+
+
 class BaseRunner(RunnableRunner):
 
     #: The "main Avocado" configuration keys (AKA namespaces) that
@@ -66,15 +104,27 @@ class BaseRunner(RunnableRunner):
         status.update({"status": status_type, "time": time.monotonic()})
         return status
 
-    def running_loop(self, condition):
+    def running_loop(self, condition, collect=None, wait=None):
         """Produces timely running messages until end condition is found.
 
         :param condition: a callable that will be evaluated as a
                           condition for continuing the loop
+        :param collect: an optional callable, evaluated on every check of
+                        the condition, that returns an iterable with
+                        additional running messages to be produced, such as
+                        the output generated by the test so far
+        :param wait: an optional callable that blocks until the condition
+                     may have changed, such as the ones given by
+                     :func:`process_waiter` and :func:`get_queue_waiter`,
+                     or until the amount of time (in seconds) it's given
+                     passes.  Without it, the condition is checked every
+                     :data:`RUNNER_RUN_CHECK_INTERVAL`.
         """
         most_current_execution_state_time = None
         next_execution_state_mark = 0
         while not condition():
+            if collect is not None:
+                yield from collect()
             now = time.monotonic()
             if most_current_execution_state_time is not None:
                 next_execution_state_mark = (
@@ -85,5 +135,33 @@ class BaseRunner(RunnableRunner):
                 or now > next_execution_state_mark
             ):
                 most_current_execution_state_time = now
+                next_execution_state_mark = now + RUNNER_RUN_STATUS_INTERVAL
+                yield self.prepare_status("running")
+            if wait is None:
+                time.sleep(RUNNER_RUN_CHECK_INTERVAL)
+            else:
+                wait(max(next_execution_state_mark - time.monotonic(), 0))
+
+    def queue_loop(self, queue):
+        """Produces the messages put on a queue until a finished one.
+
+        It waits for the messages to be put on the queue, producing
+        timely running messages meanwhile.
+
+        :param queue: the queue the messages are put on, such as by the
+                      process performing the runner's work
+        :type queue: :class:`multiprocessing.SimpleQueue`
+        """
+        wait = get_queue_waiter(queue)
+        next_execution_state_mark = time.monotonic() + RUNNER_RUN_CHECK_INTERVAL
+        while True:
+            now = time.monotonic()
+            if now >= next_execution_state_mark:
+                next_execution_state_mark = now + RUNNER_RUN_STATUS_INTERVAL
                 yield self.prepare_status("running")
-            time.sleep(RUNNER_RUN_CHECK_INTERVAL)
+            if not wait(max(next_execution_state_mark - time.monotonic(), 0)):
+                continue
+            message = queue.get()
+            yield message
+            if message.get("status") == "finished":
+                break
@@ -10,6 +10,7 @@ from avocado.core.nrunner.runnable import (
     RUNNERS_REGISTRY_STANDALONE_EXECUTABLE,
     Runnable,
 )
+from avocado.core.status.utils import FRAMED_PROTOCOL_HEADER, frame_encode
 
 LOG = logging.getLogger(__name__)
 
@@ -31,6 +32,23 @@ def json_dumps(data):
     return json.dumps(data, ensure_ascii=True, cls=StatusEncoder)
 
 
+#: The protocols a :class:`TaskStatusService` can use to post messages.
+#: "json" sends one JSON encoded message per line, with bytes encoded as
+#: base64, while "framed" sends length prefixed frames, with bytes sent
+#: as they are, and coalesces output messages into batches
+STATUS_PROTOCOLS = ("json", "framed")
+
+#: Types of running messages whose content can be merged when batching
+COALESCEABLE_TYPES = ("stdout", "stderr", "output")
+
+#: Maximum amount of time (in seconds) that running messages are held on a
+#: batch, evaluated when new messages are posted
+STATUS_BATCH_INTERVAL = 0.05
+
+#: Maximum amount of output data (in bytes) held on a batch
+STATUS_BATCH_SIZE = 2**16
+
+
 class TaskStatusService:
     """
     Implementation of interface that a task can use to post status updates
@@ -38,9 +56,22 @@ class TaskStatusService:
     TODO: make the interface generic and this just one of the implementations
     """
 
-    def __init__(self, uri):
+    def __init__(self, uri, protocol=None):
+        """Instantiates a new TaskStatusService.
+
+        :param uri: either a "host:port" string or a path to a UNIX socket
+        :type uri: str
+        :param protocol: one of :data:`STATUS_PROTOCOLS`.  Defaults to
+                         "json", that is, one JSON encoded message per line.
+        :type protocol: str
+        """
         self.uri = uri
+        self.protocol = protocol or "json"
         self._connection = None
+        #: Messages waiting to be sent on a batch (framed protocol only)
+        self._pending = []
+        self._pending_size = 0
+        self._pending_since = None
 
     @property
     def connection(self):
@@ -67,21 +98,76 @@ class TaskStatusService:
         else:
             self._connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self._connection.connect(self.uri)
+        if self.protocol == "framed":
+            self._connection.sendall(FRAMED_PROTOCOL_HEADER)
 
-    def post(self, status):
-        data = json_dumps(status)
+    def _send(self, data):
         try:
-            self.connection.send(data.encode("ascii") + "\n".encode("ascii"))
+            self.connection.sendall(data)
         except BrokenPipeError:
             try:
                 self._create_connection()
-                self.connection.send(data.encode("ascii") + "\n".encode("ascii"))
+                self.connection.sendall(data)
             except ConnectionRefusedError:
                 LOG.warning(f"Connection with {self.uri} has been lost.")
                 return False
         return True
 
+    @staticmethod
+    def _can_coalesce(previous, status):
+        """Checks if two messages can be merged into a single one.
+
+        This is the case for consecutive raw (not encoded) output messages
+        of the same type, as their content can simply be concatenated.
+        """
+        if status.get("type") not in COALESCEABLE_TYPES or "encoding" in status:
+            return False
+        if previous.keys() != status.keys():
+            return False
+        for key, value in status.items():
+            if key not in ("log", "time") and previous[key] != value:
+                return False
+        return isinstance(status.get("log"), bytes)
+
+    def _flush(self):
+        if not self._pending:
+            return True
+        data = b"".join(frame_encode(status) for status in self._pending)
+        self._pending = []
+        self._pending_size = 0
+        self._pending_since = None
+        return self._send(data)
+
+    def _post_framed(self, status):
+        if status.get("status") != "running":
+            self._pending.append(status)
+            return self._flush()
+
+        if self._pending and self._can_coalesce(self._pending[-1], status):
+            previous = self._pending[-1]
+            self._pending[-1] = dict(previous, log=previous["log"] + status["log"])
+        else:
+            self._pending.append(dict(status))
+        self._pending_size += len(status.get("log", b""))
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        if (
+            self._pending_size >= STATUS_BATCH_SIZE
+            or now - self._pending_since >= STATUS_BATCH_INTERVAL
+        ):
+            return self._flush()
+        return True
+
+    def post(self, status):
+        if self.protocol == "framed":
+            return self._post_framed(status)
+        data = json_dumps(status)
+        return self._send(data.encode("ascii") + "\n".encode("ascii"))
+
     def close(self):
+        if self._pending:
+            self._flush()
         if self.connection is not None:
             self.connection.close()
 
@@ -98,6 +184,15 @@ class Task:
     that is, whether it is pending, is running or has finished.
     """
 
+    __slots__ = (
+        "runnable",
+        "identifier",
+        "category",
+        "job_id",
+        "status_services",
+        "metadata",
+    )
+
     def __init__(
         self,
         runnable,
@@ -137,11 +232,14 @@ class Task:
         self.job_id = job_id
         self.status_services = []
         status_uris = status_uris or self.runnable.config.get("run.status_server_uri")
+        status_protocol = self.runnable.config.get("run.status_server_protocol")
         if status_uris is not None:
             if not isinstance(status_uris, list):
                 status_uris = [status_uris]
             for status_uri in status_uris:
-                self.status_services.append(TaskStatusService(status_uri))
+                self.status_services.append(
+                    TaskStatusService(status_uri, status_protocol)
+                )
         self.metadata = {}
 
     def __repr__(self):
@@ -0,0 +1,84 @@
+"""
+Warm runner: runs tasks on processes forked from an already initialized one
+
+A warm runner is started (by the process spawner, when configured to
+do so) once, imports the Python modules needed to run tasks of the given
+kinds, and then waits for tasks on its standard input.  Each task is
+given as a JSON encoded list with the arguments of a ``task-run``
+command, and is run on a new process, forked from the warm runner.
+
+This means that tasks don't pay for the startup of the Python
+interpreter and for the import of the Avocado modules, but are still
+isolated from each other: a task can not change the state of the warm
+runner, or of other tasks, as it runs on a copy of the warm runner
+process.  What is shared among tasks is what is shared with any child
+process: the state of the warm runner process at the time of the fork,
+including the modules imported on its start.  To not have tasks sharing
+the same sequence of pseudo random numbers, the :mod:`random` module is
+reseeded on each forked process.
+
+The warm runner reports, on its standard output, one line when it's
+ready to receive tasks (``ready``), one line when a task is started
+(``started $PID``) and one line when a task ends (``finished $PID
+$RETURNCODE``).  Tasks are run one at a time, and the warm runner exits
+when its standard input is closed.
+"""
+
+import json
+import os
+import random
+import signal
+import sys
+
+from avocado.core.nrunner.app import BaseRunnerApp
+from avocado.core.nrunner.runnable import Runnable
+
+
+class WarmRunnerApp(BaseRunnerApp):
+    PROG_NAME = "avocado-runner-warm"
+    PROG_DESCRIPTION = "nrunner application that runs tasks on forked processes"
+
+
+def _report(line):
+    sys.stdout.write(f"{line}\n")
+    sys.stdout.flush()
+
+
+def _run_task(app, args):
+    """Runs a task on the current (forked) process, and never returns."""
+    returncode = 0
+    try:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        random.seed()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        os.dup2(devnull, sys.stdin.fileno())
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        app.command_task_run(vars(app.parser.parse_args(["task-run"] + args)))
+    except SystemExit as details:
+        returncode = details.code if isinstance(details.code, int) else 1
+    except BaseException:  # pylint: disable=W0718
+        returncode = 1
+    finally:
+        os._exit(returncode)  # pylint: disable=W0212
+
+
+def main():
+    # the tasks are the ones to be interrupted, not the warm runner
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for kind in sys.argv[1:]:
+        Runnable.pick_runner_class_from_entry_point_kind(kind)
+    app = WarmRunnerApp(echo=lambda _: None)
+    _report("ready")
+    for line in sys.stdin:
+        args = json.loads(line)
+        pid = os.fork()
+        if pid == 0:
+            _run_task(app, args)
+        _report(f"started {pid}")
+        _, status = os.waitpid(pid, 0)
+        _report(f"finished {pid} {os.waitstatus_to_exitcode(status)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -380,6 +380,13 @@ class Spawner(Plugin):
         :rtype: bool
         """
 
+    async def close(self):
+        """Releases the resources held by the spawner.
+
+        This is called once the spawner is no longer going to be used to
+        spawn or manage tasks, such as after all tasks of a suite ended.
+        """
+
     @staticmethod
     @abc.abstractmethod
     async def check_task_requirements(runtime_task):
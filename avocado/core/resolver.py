@@ -17,8 +17,10 @@ Test resolver module.
 """
 
 import glob
+import math
 import os
 import stat
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 
 from avocado.core.enabled_extension_manager import EnabledExtensionManager
@@ -37,7 +39,18 @@ class ReferenceResolutionAssetType(Enum):
     DATA_FILE = "data_file"
 
 
-class ReferenceResolutionResult(Enum):
+class _PickledByName(Enum):
+    """Enumeration whose members are pickled by their names.
+
+    The values of the members are unique objects, which can not be
+    compared after being copied to another process.
+    """
+
+    def __reduce_ex__(self, proto):
+        return getattr, (self.__class__, self.name)
+
+
+class ReferenceResolutionResult(_PickledByName):
     #: Given test reference was properly resolved
     SUCCESS = object()
     #: Given test reference might be resolved, but it is corrupted.
@@ -48,7 +61,7 @@ class ReferenceResolutionResult(Enum):
     ERROR = object()
 
 
-class ReferenceResolutionAction(Enum):
+class ReferenceResolutionAction(_PickledByName):
     #: Stop trying to resolve the reference
     RETURN = object()
     #: Continue to resolve the given reference
@@ -259,6 +272,79 @@ def _extend_directory(path):
     return paths
 
 
+#: The minimum number of references given to each worker, when the
+#: number of workers is chosen automatically
+MIN_REFERENCES_PER_WORKER = 16
+
+#: The number of chunks of references given to each worker, so that
+#: the chunks that take longer to resolve are compensated by others
+CHUNKS_PER_WORKER = 4
+
+#: The resolver used by each worker process of a parallel resolution
+_WORKER_RESOLVER = None
+
+
+def _initialize_worker(config):
+    global _WORKER_RESOLVER  # pylint: disable=W0603
+    _WORKER_RESOLVER = Resolver(config)
+
+
+def _resolve_in_worker(references):
+    return [_WORKER_RESOLVER.resolve(reference) for reference in references]
+
+
+def _get_number_of_workers(config, number_of_references):
+    """Returns the number of processes to resolve references with.
+
+    :param config: the configuration with the "resolver.workers" option,
+                   where 0 means choosing the number of workers based on
+                   the number of CPUs and references
+    :type config: dict
+    :rtype: int
+    """
+    if config is None:
+        return 1
+    workers = config.get("resolver.workers")
+    if workers is None:
+        return 1
+    if workers == 0:
+        workers = min(
+            os.cpu_count() or 1, number_of_references // MIN_REFERENCES_PER_WORKER
+        )
+    return max(min(workers, number_of_references), 1)
+
+
+def _resolve_references(resolver, references, config):
+    """Resolves references, possibly in parallel by a number of processes.
+
+    :returns: the resolutions of each reference, in the same order
+    :rtype: list of lists of :class:`ReferenceResolution`
+    """
+    workers = _get_number_of_workers(config, len(references))
+    if workers == 1:
+        return [resolver.resolve(reference) for reference in references]
+
+    chunk_size = math.ceil(len(references) / (workers * CHUNKS_PER_WORKER))
+    chunks = [
+        references[index : index + chunk_size]
+        for index in range(0, len(references), chunk_size)
+    ]
+    resolved = []
+    with ProcessPoolExecutor(
+        workers, initializer=_initialize_worker, initargs=(config,)
+    ) as executor:
+        futures = [executor.submit(_resolve_in_worker, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                resolved.extend(future.result())
+            except Exception:  # pylint: disable=W0703
+                # errors within resolvers are resolutions themselves, so
+                # this is a problem with a worker (or results that could
+                # not be transferred), and the chunk is resolved here
+                resolved.extend(resolver.resolve(reference) for reference in chunk)
+    return resolved
+
+
 def resolve(references, hint=None, ignore_missing=True, config=None):
     resolutions = []
     hint_references = {}
@@ -279,11 +365,18 @@ def resolve(references, hint=None, ignore_missing=True, config=None):
             # here it walks directories if one is given, and extends
             # the original reference into final file paths
             extended_references.extend(_extend_directory(reference))
+        resolved = iter(
+            _resolve_references(
+                resolver,
+                [_ for _ in extended_references if _ not in hint_references],
+                config,
+            )
+        )
         for reference in extended_references:
             if reference in hint_references:
                 resolutions.append(hint_references[reference])
             else:
-                resolutions.extend(resolver.resolve(reference))
+                resolutions.extend(next(resolved))
     else:
         discoverer = Discoverer(config)
         resolutions.extend(discoverer.discover())
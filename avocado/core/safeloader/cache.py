@@ -0,0 +1,187 @@
+"""
+Persistent cache of the tests found on Python source code files.
+
+Each entry holds the tests found on a file, along with the signatures
+(modification time, size and digest) of that file and of all modules
+containing their parent classes.  An entry is only used while none of
+those files changed.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import tempfile
+
+from avocado.core.data_dir import get_datafile_path
+from avocado.core.version import VERSION
+
+#: The location of the discovery cache entries
+CACHE_DIR = get_datafile_path("cache", "safeloader")
+
+#: The version of the format of the entries
+CACHE_FORMAT_VERSION = 1
+
+
+def _get_entry_path(target_module, target_class, path):
+    key = json.dumps([target_module, target_class, os.path.abspath(path)])
+    return os.path.join(CACHE_DIR, f"{hashlib.sha256(key.encode()).hexdigest()}.json")
+
+
+def _get_digest(path):
+    with open(path, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
+
+
+def _is_unchanged(path, signature):
+    """Checks whether a file still matches its recorded signature.
+
+    Files whose modification time changed, but whose size did not, have
+    their contents checked, so that files merely touched (such as by a
+    version control checkout) are still considered unchanged.
+    """
+    mtime_ns, size, digest = signature
+    try:
+        stat = os.stat(path)
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns == mtime_ns:
+            return True
+        return _get_digest(path) == digest
+    except OSError:
+        return False
+
+
+def _serialize_tests(tests):
+    return [
+        [
+            klass,
+            [
+                [
+                    method,
+                    {
+                        key: (None if value is None else sorted(value))
+                        for key, value in tags.items()
+                    },
+                    dependencies,
+                ]
+                for method, tags, dependencies in methods
+            ],
+        ]
+        for klass, methods in tests.items()
+    ]
+
+
+def _deserialize_tests(tests):
+    return collections.OrderedDict(
+        (
+            klass,
+            [
+                (
+                    method,
+                    {
+                        key: (None if value is None else set(value))
+                        for key, value in tags.items()
+                    },
+                    dependencies,
+                )
+                for method, tags, dependencies in methods
+            ],
+        )
+        for klass, methods in tests
+    )
+
+
+def load(target_module, target_class, path):
+    """Loads the tests found on a file, if they're still valid.
+
+    :returns: the same as :func:`avocado.core.safeloader.core.find_python_tests`
+              or None if there's no valid entry for the file
+    """
+    try:
+        with open(
+            _get_entry_path(target_module, target_class, path), encoding="utf-8"
+        ) as entry_file:
+            entry = json.load(entry_file)
+        if entry["format"] != CACHE_FORMAT_VERSION or entry["avocado"] != VERSION:
+            return None
+        for module_path, signature in entry["modules"].items():
+            if not _is_unchanged(module_path, signature):
+                return None
+        return _deserialize_tests(entry["tests"]), set(entry["disabled"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save(target_module, target_class, path, found, parsed):
+    """Saves the tests found on a file.
+
+    Nothing is saved if some of the modules that could contain parent
+    classes were not found, as those could be created later.
+
+    :param found: the result of
+                  :func:`avocado.core.safeloader.core.find_python_tests`
+    :param parsed: the modules parsed while finding those tests
+    :type parsed: :class:`avocado.core.safeloader.core.ParsedModules`
+    """
+    if not parsed.complete:
+        return
+    tests, disabled = found
+    entry = {
+        "format": CACHE_FORMAT_VERSION,
+        "avocado": VERSION,
+        "target": [target_module, target_class],
+        "path": os.path.abspath(path),
+        "modules": parsed,
+        "tests": _serialize_tests(tests),
+        "disabled": sorted(disabled),
+    }
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=CACHE_DIR, suffix=".tmp", delete=False
+        ) as entry_file:
+            try:
+                json.dump(entry, entry_file)
+            except (TypeError, ValueError):
+                # dependencies that can not be serialized, not worth caching
+                entry_file.close()
+                os.unlink(entry_file.name)
+                return
+        os.replace(entry_file.name, _get_entry_path(target_module, target_class, path))
+    except OSError:
+        # the cache is an optimization only
+        pass
+
+
+def get_entries():
+    """Returns the target, path and number of tests of all the entries.
+
+    :rtype: list of tuple of (str, str, int)
+    """
+    entries = []
+    if not os.path.isdir(CACHE_DIR):
+        return entries
+    for name in os.listdir(CACHE_DIR):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(CACHE_DIR, name), encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+            target = ".".join(entry["target"])
+            tests = sum(len(methods) for _, methods in entry["tests"])
+            entries.append((target, entry["path"], tests))
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+    return sorted(entries, key=lambda entry: (entry[1], entry[0]))
+
+
+def clear():
+    """Removes all the entries."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        try:
+            os.unlink(os.path.join(CACHE_DIR, name))
+        except FileNotFoundError:
+            pass
@@ -1,8 +1,10 @@
 import ast
 import collections
+import os
 import sys
 from importlib.machinery import PathFinder
 
+from avocado.core.safeloader import cache as discovery_cache
 from avocado.core.safeloader.docstring import (
     check_docstring_directive,
     get_docstring_directives,
@@ -12,6 +14,28 @@ from avocado.core.safeloader.docstring import (
 from avocado.core.safeloader.module import PythonModule
 
 
+class ParsedModules(dict):
+    """Signatures of the modules parsed while finding tests, by their paths.
+
+    This tells which files the tests found depend on, that is, the file
+    given and all others containing their parent classes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        #: Whether all the modules that could contain parent classes
+        #: were found.  If not, the tests found depend on more than
+        #: the modules that were parsed.
+        self.complete = True
+
+    def add(self, module):
+        """Records a parsed module.
+
+        :type module: :class:`avocado.core.safeloader.module.PythonModule`
+        """
+        self[os.path.abspath(module.path)] = module.signature
+
+
 def get_methods_info(statement_body, class_tags, class_dependencies):
     """Returns information on test methods.
 
@@ -82,6 +106,7 @@ def _examine_same_module(
     target_class,
     determine_match,
     info_class_tags,
+    parsed,
 ):
     # Searching the parents in the same module
     for parent in parents[:]:
@@ -102,6 +127,7 @@ def _examine_same_module(
             module.path,
             parent_class,
             match,
+            parsed,
         )
         if _info:
             parents.remove(parent)
@@ -208,7 +234,7 @@ def _find_import_match(parent_path, parent_module):
 
 
 def _examine_class(
-    target_module, target_class, determine_match, path, class_name, match
+    target_module, target_class, determine_match, path, class_name, match, parsed=None
 ):
     """
     Examine a class from a given path
@@ -236,13 +262,18 @@ def _examine_class(
     :param match: whether the inheritance from <target_module.target_class> has
                   been determined or not
     :type match: bool
+    :param parsed: where the modules parsed are recorded
+    :type parsed: :class:`ParsedModules`
     :returns: tuple where first item is a list of test methods detected
               for given class; second item is set of class names which
               look like avocado tests but are force-disabled;
               third is dict of class tags.
     :rtype: tuple
     """
+    if parsed is None:
+        parsed = ParsedModules()
     module = PythonModule(path, target_module, target_class)
+    parsed.add(module)
     info = []
     class_tags = {}
     disabled = set()
@@ -264,7 +295,7 @@ def _examine_class(
         )
 
         # Getting the list of parents of the current class
-        parents = klass.bases
+        parents = list(klass.bases)
 
         match = _examine_same_module(
             parents,
@@ -276,6 +307,7 @@ def _examine_class(
             target_class,
             determine_match,
             class_tags,
+            parsed,
         )
 
         # If there are parents left to be discovered, they
@@ -290,6 +322,7 @@ def _examine_class(
 
                 found_spec = imported_symbol.get_importable_spec(symbol_is_module)
                 if found_spec is None:
+                    parsed.complete = False
                     continue
 
             except ClassNotSuitable:
@@ -302,6 +335,7 @@ def _examine_class(
                 found_spec.origin,
                 parent_class,
                 match,
+                parsed,
             )
             if _info:
                 _exted_tests_tags(info, parent_tags)
@@ -315,7 +349,9 @@ def _examine_class(
         imported_symbol = module.imported_symbols[class_name]
         if imported_symbol:
             found_spec = imported_symbol.get_importable_spec()
-            if found_spec:
+            if not found_spec:
+                parsed.complete = False
+            else:
                 _info, _disabled, _class_tags, _match = _examine_class(
                     target_module,
                     target_class,
@@ -323,6 +359,7 @@ def _examine_class(
                     found_spec.origin,
                     class_name,
                     match,
+                    parsed,
                 )
                 if _info:
                     _exted_tests_tags(info, _class_tags)
@@ -338,7 +375,7 @@ def _examine_class(
     return info, disabled, class_tags, match
 
 
-def find_python_tests(target_module, target_class, determine_match, path):
+def find_python_tests(target_module, target_class, determine_match, path, parsed=None):
     """
     Attempts to find Python tests from source files
 
@@ -363,13 +400,18 @@ def find_python_tests(target_module, target_class, determine_match, path):
     :type determine_match: function
     :param path: path to a Python source code file
     :type path: str
+    :param parsed: where the modules parsed are recorded
+    :type parsed: :class:`ParsedModules`
     :returns: tuple where first item is dict with class name and additional
               info such as method names and tags; the second item is
               set of class names which look like Python tests but have been
               forcefully disabled.
     :rtype: tuple
     """
+    if parsed is None:
+        parsed = ParsedModules()
     module = PythonModule(path, target_module, target_class)
+    parsed.add(module)
     # The resulting test classes
     result = collections.OrderedDict()
     disabled = set()
@@ -407,7 +449,7 @@ def find_python_tests(target_module, target_class, determine_match, path):
             get_docstring_directives_dependencies(docstring),
         )
         # Getting the list of parents of the current class
-        parents = klass.bases
+        parents = list(klass.bases)
 
         match = _examine_same_module(
             parents,
@@ -419,6 +461,7 @@ def find_python_tests(target_module, target_class, determine_match, path):
             target_class,
             determine_match,
             class_tags,
+            parsed,
         )
 
         # If there are parents left to be discovered, they
@@ -433,6 +476,7 @@ def find_python_tests(target_module, target_class, determine_match, path):
 
                 found_spec = imported_symbol.get_importable_spec(symbol_is_module)
                 if found_spec is None:
+                    parsed.complete = False
                     continue
 
             except ClassNotSuitable:
@@ -445,6 +489,7 @@ def find_python_tests(target_module, target_class, determine_match, path):
                 found_spec.origin,
                 parent_class,
                 match,
+                parsed,
             )
             if _info:
                 _exted_tests_tags(info, parent_tags)
@@ -479,10 +524,36 @@ def _determine_match_python(module, klass, docstring):
     return module.is_matching_klass(klass)
 
 
-def find_avocado_tests(path):
-    return find_python_tests("avocado", "Test", _determine_match_python, path)
+def _find_python_tests_cached(target_module, target_class, determine_match, path):
+    """Same as :func:`find_python_tests`, but using the discovery cache."""
+    found = discovery_cache.load(target_module, target_class, path)
+    if found is None:
+        parsed = ParsedModules()
+        found = find_python_tests(
+            target_module, target_class, determine_match, path, parsed
+        )
+        discovery_cache.save(target_module, target_class, path, found, parsed)
+    return found
+
+
+def find_avocado_tests(path, cache=False):
+    """Attempts to find Avocado instrumented tests from a source file.
+
+    :param cache: whether to use (and update) the persistent discovery
+                  cache, at :mod:`avocado.core.safeloader.cache`
+    :type cache: bool
+    """
+    find = _find_python_tests_cached if cache else find_python_tests
+    return find("avocado", "Test", _determine_match_python, path)
 
 
-def find_python_unittests(path):
-    found, _ = find_python_tests("unittest", "TestCase", _determine_match_python, path)
+def find_python_unittests(path, cache=False):
+    """Attempts to find Python unittests from a source file.
+
+    :param cache: whether to use (and update) the persistent discovery
+                  cache, at :mod:`avocado.core.safeloader.cache`
+    :type cache: bool
+    """
+    find = _find_python_tests_cached if cache else find_python_tests
+    found, _ = find("unittest", "TestCase", _determine_match_python, path)
     return found
@@ -91,8 +91,7 @@ class ImportedSymbol:
                                  an importable spec
         :type symbol_is_module: bool
         """
-        modules_paths = sys.path
-        modules_paths.insert(0, self.get_relative_module_fs_path())
+        modules_paths = [self.get_relative_module_fs_path()] + sys.path
         spec = None
         for component, previous in self._walk_importable_components(symbol_is_module):
             if previous:
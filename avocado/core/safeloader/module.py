@@ -1,9 +1,31 @@
 import ast
+import functools
+import hashlib
 import os
 
 from avocado.core.safeloader.imported import ImportedSymbol
 from avocado.core.safeloader.utils import get_statement_import_as
 
+#: How many parsed modules are kept in memory, so that modules containing
+#: base classes common to many others are not parsed over and over again
+PARSED_MODULES_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=PARSED_MODULES_CACHE_SIZE)
+def _parse(path, mtime_ns, size):  # pylint: disable=W0613
+    """Parses a Python source code file.
+
+    The modification time and size of the file are not used here, but
+    are part of the key of the cached results, so that files that changed
+    are parsed again.  The (never modified) tree is shared by all users.
+
+    :returns: the module tree and the SHA-256 digest of its source code
+    :rtype: tuple of (:class:`ast.Module`, str)
+    """
+    with open(path, "rb") as source_file:
+        source = source_file.read()
+    return ast.parse(source.decode("utf-8"), path), hashlib.sha256(source).hexdigest()
+
 
 class PythonModule:
     """
@@ -23,6 +45,7 @@ class PythonModule:
         "klass",
         "imported_symbols",
         "interesting_klass_found",
+        "signature",
     )
 
     def __init__(self, path, module="avocado", klass="Test"):
@@ -46,8 +69,10 @@ class PythonModule:
         self.module = module
         self.klass = klass
         self.imported_symbols = {}
-        with open(self.path, encoding="utf-8") as source_file:
-            self.mod = ast.parse(source_file.read(), self.path)
+        stat = os.stat(self.path)
+        self.mod, digest = _parse(self.path, stat.st_mtime_ns, stat.st_size)
+        #: The modification time, size and digest of the parsed source code
+        self.signature = (stat.st_mtime_ns, stat.st_size, digest)
         self.interesting_klass_found = False
 
     def is_matching_klass(self, klass):
@@ -1,5 +1,10 @@
+import asyncio
 import heapq
 import logging
+import os
+import pickle
+import sys
+import tempfile
 
 from avocado.core.status.utils import json_loads
 from avocado.core.teststatus import STATUSES
@@ -11,19 +16,98 @@ class StatusMsgMissingDataError(Exception):
     """Status message does not contain the required data."""
 
 
+class StatusRecord:
+    """
+    Compact, in memory, representation of a status message.
+
+    The complete message is kept in a :class:`StatusMessageStore`, and
+    only the data needed to track the task is kept in memory.
+    """
+
+    __slots__ = ("status", "time", "result", "offset", "size")
+
+    def __init__(self, status, time, result, offset, size):
+        self.status = status
+        self.time = time
+        self.result = result
+        #: Position of the complete message in the store
+        self.offset = offset
+        #: Size of the complete message in the store
+        self.size = size
+
+
+class StatusMessageStore:
+    """Append only, on disk, store of status messages."""
+
+    def __init__(self, directory=None):
+        """
+        :param directory: directory where the (unnamed) file that holds the
+                          messages will be created
+        :type directory: str
+        """
+        # pylint: disable=R1732
+        self._file = tempfile.TemporaryFile(prefix=".avocado-status-", dir=directory)
+        #: Amount of data (in bytes) on the store
+        self.size = 0
+
+    def append(self, message):
+        """Saves a message on the store.
+
+        :param message: a status message
+        :type message: dict
+        :returns: a record with the position of the message on the store
+        :rtype: :class:`StatusRecord`
+        """
+        data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        offset = self.size
+        os.pwrite(self._file.fileno(), data, offset)
+        self.size += len(data)
+        return StatusRecord(
+            message.get("status"),
+            message.get("time"),
+            message.get("result"),
+            offset,
+            len(data),
+        )
+
+    def load(self, record):
+        """Loads the complete message from the store.
+
+        :param record: a record given by :meth:`append`
+        :type record: :class:`StatusRecord`
+        :rtype: dict
+        """
+        return pickle.loads(os.pread(self._file.fileno(), record.size, record.offset))
+
+    def close(self):
+        self._file.close()
+
+
 class StatusRepo:
     """Maintains tasks' status related data and provides aggregated info."""
 
-    def __init__(self, job_id):
+    def __init__(self, job_id, compact=False, store_dir=None):
         """Initializes a new StatusRepo
 
         :param job_id: the job unique identification for which the
                        messages are destined to.
         :type job_id: str
+        :param compact: whether to keep in memory only the data needed to
+                        track the tasks, while the complete messages are
+                        kept on a :class:`StatusMessageStore`.
+        :type compact: bool
+        :param store_dir: directory for the store of messages, used only
+                          in compact mode
+        :type store_dir: str
         """
         self.job_id = job_id
-        #: Contains all received messages by a given task (by its ID)
+        #: Contains all received messages by a given task (by its ID),
+        #: or, in compact mode, the :class:`StatusRecord` for them
         self._all_data = {}
+        #: Where complete messages are kept, in compact mode
+        self._store = None
+        if compact:
+            self._store = StatusMessageStore(store_dir)
         #: Contains the most up to date status of a task, and the time
         #: it was set in a tuple (status, time).  This is keyed
         #: by the task ID, and the most up to date status is determined by
@@ -35,6 +119,15 @@ class StatusRepo:
         self._status_journal_summary = []
         #: Contains the task IDs keyed by the result received
         self._by_result = {}
+        #: Contains futures, keyed by the task ID, that will be set with
+        #: the data of the finished message of the given task
+        self._finished_futures = {}
+        #: Event set whenever a new entry is added to the status journal,
+        #: only created when there's someone waiting for entries
+        self._journal_event = None
+        #: Event set whenever the status journal gets empty, only created
+        #: when there's someone waiting for that
+        self._journal_empty_event = None
 
     def _handle_task_finished(self, message):
         task_id = message["id"]
@@ -57,6 +150,9 @@ class StatusRepo:
         self._set_by_result(message)
         self._set_task_data(message)
         LOG.debug('Task "%s" finished message: "%s"', task_id, message)
+        future = self._finished_futures.pop(task_id, None)
+        if future is not None and not future.done():
+            future.set_result(message)
 
     def _handle_task_started(self, message):
         if "output_dir" not in message:
@@ -73,35 +169,136 @@ class StatusRepo:
         for tasks with a given result."""
         result = message.get("result")
         if result not in self._by_result:
-            self._by_result[result] = []
-        if message["id"] not in self._by_result[result]:
-            self._by_result[result].append(message["id"])
+            self._by_result[result] = set()
+        self._by_result[result].add(message["id"])
 
     def _set_task_data(self, message):
         """Appends all data on message to an entry keyed by the task's ID."""
         task_id = message.pop("id")
         if task_id not in self._all_data:
             self._all_data[task_id] = []
+        if self._store is not None:
+            message = self._store.append(message)
         self._all_data[task_id].append(message)
 
+    def _load(self, data):
+        if self._store is not None:
+            return self._store.load(data)
+        return data
+
     def get_all_task_data(self, task_id):
         """Returns all data on a given task, by its ID."""
-        return self._all_data.get(task_id)
+        task_data = self._all_data.get(task_id)
+        if task_data is None or self._store is None:
+            return task_data
+        return [self._load(data) for data in task_data]
 
     def get_task_data(self, task_id, index):
         """Returns the data on the index of a given task, by its ID."""
         task_data = self._all_data.get(task_id)
-        return task_data[index]
+        return self._load(task_data[index])
 
     def get_latest_task_data(self, task_id):
         """Returns the latest data on a given task, by its ID."""
         task_data = self._all_data.get(task_id)
         if task_data is None:
             return None
-        return task_data[-1]
+        return self._load(task_data[-1])
+
+    @property
+    def memory_footprint(self):
+        """Approximate amount of memory (in bytes) used by the tasks' data.
+
+        This accounts for the messages (or records, in compact mode) and
+        the containers holding them, but not for the objects that may be
+        shared among them, such as the task IDs.
+        """
+        size = sys.getsizeof(self._all_data)
+        for task_data in self._all_data.values():
+            size += sys.getsizeof(task_data)
+            for data in task_data:
+                size += sys.getsizeof(data)
+                if isinstance(data, dict):
+                    size += sum(sys.getsizeof(value) for value in data.values())
+        for task_ids in self._by_result.values():
+            size += sys.getsizeof(task_ids)
+        return size
+
+    @property
+    def store_size(self):
+        """Amount of data (in bytes) kept on disk, in compact mode."""
+        if self._store is None:
+            return 0
+        return self._store.size
+
+    def close(self):
+        """Releases the resources, such as the on disk store, of the repo."""
+        if self._store is not None:
+            self._store.close()
+
+    def _journal_pop(self):
+        entry = heapq.heappop(self._status_journal_summary)
+        if not self._status_journal_summary and self._journal_empty_event is not None:
+            self._journal_empty_event.set()
+        return entry
 
     def status_journal_summary_pop(self):
-        return heapq.heappop(self._status_journal_summary)
+        return self._journal_pop()
+
+    @property
+    def status_journal_summary_size(self):
+        return len(self._status_journal_summary)
+
+    async def status_journal_summary_get(self):
+        """Returns the next status journal entry, waiting for one if needed.
+
+        Contrary to :meth:`status_journal_summary_pop`, this will not
+        raise an error when the journal is empty, but will wait until a
+        new entry is added.
+        """
+        while not self._status_journal_summary:
+            if self._journal_event is None:
+                self._journal_event = asyncio.Event()
+            self._journal_event.clear()
+            await self._journal_event.wait()
+        return self._journal_pop()
+
+    async def wait_status_journal_empty(self):
+        """Waits until all the status journal entries have been picked."""
+        while self._status_journal_summary:
+            if self._journal_empty_event is None:
+                self._journal_empty_event = asyncio.Event()
+            self._journal_empty_event.clear()
+            await self._journal_empty_event.wait()
+
+    async def wait_task_finished(self, task_id):
+        """Waits until the finished message of a given task is received.
+
+        :param task_id: the ID of the task
+        :type task_id: str
+        :returns: the data on the finished message of the task
+        :rtype: dict
+        """
+        if self.get_task_status(task_id) == "finished":
+            # the status on the stored data may have been changed by
+            # message handlers, but the result is always kept
+            for data in reversed(self._all_data.get(task_id, [])):
+                if self._store is not None:
+                    if data.result is not None:
+                        return self._load(data)
+                elif "result" in data:
+                    return data
+        future = self._finished_futures.get(task_id)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            self._finished_futures[task_id] = future
+        # the same future may be awaited by others
+        return await asyncio.shield(future)
+
+    def _journal_push(self, entry):
+        heapq.heappush(self._status_journal_summary, entry)
+        if self._journal_event is not None:
+            self._journal_event.set()
 
     def _update_status(self, message):
         """Update the latest status of a task (by message)."""
@@ -112,7 +309,7 @@ class StatusRepo:
             return
         if task_id not in self._status:
             self._status[task_id] = (status, time)
-            heapq.heappush(self._status_journal_summary, (time, task_id, status, 0))
+            self._journal_push((time, task_id, status, 0))
         else:
             current_status, _ = self._status[task_id]
             if current_status == "finished":
@@ -127,8 +324,8 @@ class StatusRepo:
                 )
             else:
                 self._status[task_id] = (status, time)
-            index = len(self.get_all_task_data(task_id))
-            heapq.heappush(self._status_journal_summary, (time, task_id, status, index))
+            index = len(self._all_data.get(task_id, []))
+            self._journal_push((time, task_id, status, index))
 
     def process_message(self, message):
         for required_field in ("id", "job_id"):
@@ -161,16 +358,13 @@ class StatusRepo:
     def get_task_status(self, task_id):
         return self._status.get(task_id, (None, None))[0]
 
-    @staticmethod
-    def _is_in_task(tasks, task_ids):
-        """Returns True if any of the tasks is in task_ids."""
-        return any([True for task_id in task_ids if task_id in tasks])
-
     def get_result_set_for_tasks(self, task_ids):
         """Returns a set of results for the given tasks."""
-        results = [
+        # task identifiers may be given as TestID instances, whose hash
+        # is not the one of their string representation
+        task_ids = {str(task_id) for task_id in task_ids}
+        return {
             key
             for key, value in self._by_result.items()
-            if self._is_in_task(value, task_ids)
-        ]
-        return set(results)
+            if not value.isdisjoint(task_ids)
+        }
@@ -3,7 +3,12 @@ import logging
 import os
 
 from avocado.core.settings import settings
-from avocado.core.status.utils import StatusMsgInvalidJSONError
+from avocado.core.status.utils import (
+    FRAME_PREFIX,
+    FRAMED_PROTOCOL_HEADER,
+    StatusMsgInvalidJSONError,
+    frame_decode,
+)
 
 LOG = logging.getLogger(__name__)
 
@@ -52,7 +57,23 @@ class StatusServer:
         if os.path.exists(self._uri):
             os.unlink(self._uri)
 
+    async def _read_frames(self, reader):
+        """Reads and processes messages sent with the framed protocol."""
+        while True:
+            try:
+                prefix = await reader.readexactly(FRAME_PREFIX.size)
+                header_size, payload_size = FRAME_PREFIX.unpack(prefix)
+                header = await reader.readexactly(header_size)
+                payload = await reader.readexactly(payload_size)
+            except (asyncio.IncompleteReadError, ConnectionResetError):
+                return
+            try:
+                self._repo.process_message(frame_decode(header, payload))
+            except StatusMsgInvalidJSONError as e:
+                LOG.warning("Invalid JSON in internal status message: %s", e)
+
     async def cb(self, reader, _):
+        first_message = True
         while True:
             try:
                 raw_message = await reader.readline()
@@ -60,6 +81,11 @@ class StatusServer:
                 continue
             if not raw_message:
                 return
+            if first_message:
+                first_message = False
+                if raw_message == FRAMED_PROTOCOL_HEADER:
+                    await self._read_frames(reader)
+                    return
             try:
                 self._repo.process_raw_message(raw_message)
             except StatusMsgInvalidJSONError as e:
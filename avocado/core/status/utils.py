@@ -1,5 +1,18 @@
 import base64
 import json
+import struct
+
+#: Line sent by a client, right after connecting, to signal that the
+#: following messages will use the framed protocol instead of JSON lines
+FRAMED_PROTOCOL_HEADER = b"avocado-status-framed-1\n"
+
+#: The prefix of each frame, containing the length of the header and
+#: the length of the payload, as unsigned 32 bits integers
+FRAME_PREFIX = struct.Struct("!II")
+
+#: Key, in the header of a frame, with a list of (key, length) pairs
+#: for the message values that were sent as raw bytes in the payload
+FRAME_PAYLOAD_KEY = "__payload__"
 
 
 class StatusMsgInvalidJSONError(Exception):
@@ -28,3 +41,49 @@ def json_loads(data):
         return json.loads(data, object_hook=json_base64_decode)
     except json.decoder.JSONDecodeError:
         raise StatusMsgInvalidJSONError(data)
+
+
+def frame_encode(message):
+    """Encodes a message into a frame of the framed protocol.
+
+    The (top level) values of the message that are bytes are sent
+    as they are, in the payload of the frame, instead of being base64
+    encoded into JSON.
+
+    :param message: a status message
+    :type message: dict
+    :rtype: bytes
+    """
+    header = {}
+    payload_keys = []
+    payload = []
+    for key, value in message.items():
+        if isinstance(value, bytes):
+            payload_keys.append((key, len(value)))
+            payload.append(value)
+        else:
+            header[key] = value
+    if payload_keys:
+        header[FRAME_PAYLOAD_KEY] = payload_keys
+    header = json.dumps(header, ensure_ascii=True).encode("ascii")
+    payload = b"".join(payload)
+    return FRAME_PREFIX.pack(len(header), len(payload)) + header + payload
+
+
+def frame_decode(header, payload):
+    """Decodes the header and payload of a frame into a message.
+
+    :param header: the JSON header of the frame
+    :type header: bytes
+    :param payload: the raw payload of the frame
+    :type payload: bytes
+    :raises: StatusMsgInvalidJSONError
+    :returns: the status message
+    :rtype: dict
+    """
+    message = json_loads(header)
+    offset = 0
+    for key, length in message.pop(FRAME_PAYLOAD_KEY, []):
+        message[key] = payload[offset : offset + length]
+        offset += length
+    return message
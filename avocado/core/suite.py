@@ -13,7 +13,7 @@
 # Author: Beraldo Leal <bleal@redhat.com>
 
 import os
-from copy import deepcopy
+from copy import copy
 from enum import Enum
 from uuid import uuid4
 
@@ -276,8 +276,12 @@ class TestSuite:
 
     def _get_test_variants(self):
         def add_variant(runnable, variant):
-            runnable = deepcopy(runnable)
-            runnable.variant = dump_variant(variant)
+            # The runnables of the variants of a test are shallow copies,
+            # sharing all its attributes (but the variant), which are not
+            # modified in place.  Each variant is also dumped only once,
+            # and shared by the runnables of all tests.
+            runnable = copy(runnable)
+            runnable.variant = variant
             runnable_with_variant.append(runnable)
 
         runnable_with_variant = []
@@ -286,18 +290,20 @@ class TestSuite:
             tree_nodes = TreeNode().get_node(paths[0], True)
             tree_nodes.value = self.test_parameters
             variant = {"variant": tree_nodes, "variant_id": None, "paths": paths}
+            variant = dump_variant(variant)
             for runnable in self.tests:
                 add_variant(runnable, variant)
         elif self.variants:
             # let's use variants when parameters are not available
             # define execution order
+            variants = [dump_variant(variant) for variant in self.variants.itertests()]
             execution_order = self.config.get("run.execution_order")
             if execution_order == "variants-per-test":
                 for runnable in self.tests:
-                    for variant in self.variants.itertests():
+                    for variant in variants:
                         add_variant(runnable, variant)
             elif execution_order == "tests-per-variant":
-                for variant in self.variants.itertests():
+                for variant in variants:
                     for runnable in self.tests:
                         add_variant(runnable, variant)
         return runnable_with_variant
@@ -1,10 +1,13 @@
+import heapq
 import itertools
 import os
 from enum import Enum
 
 from avocado.core.dispatcher import TestPostDispatcher, TestPreDispatcher
+from avocado.core.nrunner.runnable import Runnable
 from avocado.core.nrunner.task import TASK_DEFAULT_CATEGORY, Task
 from avocado.core.test_id import TestID
+from avocado.core.teststatus import STATUSES
 
 
 class RuntimeTaskStatus(Enum):
@@ -28,9 +31,14 @@ class RuntimeTaskStatus(Enum):
         ]
 
 
+_FINISHED_STATUSES = frozenset(RuntimeTaskStatus.finished_statuses())
+
+
 class RuntimeTaskMixin:
     """Common utilities for RuntimeTask implementations."""
 
+    __slots__ = ()
+
     @classmethod
     def get_identifier(
         cls,
@@ -112,6 +120,21 @@ class RuntimeTask(RuntimeTaskMixin):
     information about its execution by a spawner within a state machine.
     """
 
+    __slots__ = (
+        "task",
+        "dependents",
+        "_status",
+        "_result",
+        "execution_timeout",
+        "spawner_handle",
+        "spawning_result",
+        "dependencies",
+        "_tracked_dependencies",
+        "_unfinished_dependencies",
+        "_satisfiable_deps_execution_statuses",
+        "is_cacheable",
+    )
+
     category = TASK_DEFAULT_CATEGORY
 
     def __init__(self, task, satisfiable_deps_execution_statuses=None):
@@ -126,9 +149,10 @@ class RuntimeTask(RuntimeTaskMixin):
         """
         #: The :class:`avocado.core.nrunner.Task`
         self.task = task
-        #: The task status, a value from the enum
-        #: :class:`avocado.core.task.runtime.RuntimeTaskStatus`
-        self.status = None
+        #: The tasks that depend on this one (the reverse of
+        #: :attr:`dependencies`), kept up to date by :meth:`add_dependency`
+        self.dependents = []
+        self._status = None
         #: Information about task result when it is finished
         self._result = None
         #: Timeout limit for the completion of the task execution
@@ -141,11 +165,15 @@ class RuntimeTask(RuntimeTaskMixin):
         #: The result of the spawning of a Task
         self.spawning_result = None
         self.dependencies = []
+        # how many of the dependencies are accounted for in the number
+        # of dependencies that have not finished yet
+        self._tracked_dependencies = 0
+        self._unfinished_dependencies = 0
         self._satisfiable_deps_execution_statuses = ["pass"]
         if satisfiable_deps_execution_statuses:
-            self._satisfiable_deps_execution_statuses = [
-                status.lower() for status in satisfiable_deps_execution_statuses
-            ]
+            self.satisfiable_deps_execution_statuses = (
+                satisfiable_deps_execution_statuses
+            )
         #: Flag to detect if the task should be save to cache
         self.is_cacheable = False
 
@@ -166,6 +194,23 @@ class RuntimeTask(RuntimeTaskMixin):
             return hash(self) == hash(other)
         return False
 
+    @property
+    def status(self):
+        """The task status, a value from the enum
+        :class:`avocado.core.task.runtime.RuntimeTaskStatus`"""
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        was_finished = self._status in _FINISHED_STATUSES
+        self._status = status
+        is_finished = status in _FINISHED_STATUSES
+        if is_finished != was_finished:
+            change = -1 if is_finished else 1
+            for dependent in self.dependents:
+                # pylint: disable=W0212
+                dependent._unfinished_dependencies += change
+
     @property
     def result(self):
         return self._result
@@ -174,23 +219,40 @@ class RuntimeTask(RuntimeTaskMixin):
     def satisfiable_deps_execution_statuses(self):
         return self._satisfiable_deps_execution_statuses
 
+    @satisfiable_deps_execution_statuses.setter
+    def satisfiable_deps_execution_statuses(self, statuses):
+        self._satisfiable_deps_execution_statuses = [
+            status.lower() for status in statuses
+        ]
+
     @result.setter
     def result(self, result):
         self._result = result.lower()
 
+    def _track_dependencies(self):
+        # dependencies may also have been appended directly to the list
+        for dependency in self.dependencies[self._tracked_dependencies :]:
+            dependency.dependents.append(self)
+            if dependency.status not in _FINISHED_STATUSES:
+                self._unfinished_dependencies += 1
+        self._tracked_dependencies = len(self.dependencies)
+
+    def add_dependency(self, dependency):
+        """Makes this task depend on another one.
+
+        :param dependency: the task that needs to finish before this one
+        :type dependency: :class:`RuntimeTask`
+        """
+        self.dependencies.append(dependency)
+        self._track_dependencies()
+
     def are_dependencies_finished(self):
-        for dependency in self.dependencies:
-            if dependency.status not in RuntimeTaskStatus.finished_statuses():
-                return False
-        return True
+        self._track_dependencies()
+        return self._unfinished_dependencies == 0
 
     def get_finished_dependencies(self):
         """Returns all dependencies which already finished."""
-        return [
-            dep
-            for dep in self.dependencies
-            if dep.status in RuntimeTaskStatus.finished_statuses()
-        ]
+        return [dep for dep in self.dependencies if dep.status in _FINISHED_STATUSES]
 
     def can_run(self):
         if not self.are_dependencies_finished():
@@ -205,6 +267,8 @@ class RuntimeTask(RuntimeTaskMixin):
 class PrePostRuntimeTaskMixin(RuntimeTask):
     """Common utilities for PrePostRuntimeTask implementations."""
 
+    __slots__ = ()
+
     @classmethod
     def get_tasks_from_test_task(
         cls,
@@ -215,6 +279,7 @@ class PrePostRuntimeTaskMixin(RuntimeTask):
         status_server_uri=None,
         job_id=None,
         suite_config=None,
+        shared_tasks=None,
     ):
         """Creates runtime tasks for preTest task from test task.
 
@@ -235,6 +300,11 @@ class PrePostRuntimeTaskMixin(RuntimeTask):
         :type job_id: str
         :param suite_config: Configuration dict relevant for the whole suite.
         :type suite_config: dict
+        :param shared_tasks: tasks created for cacheable runnables, which
+                             are reused (instead of creating new tasks)
+                             for identical runnables of other tests.  It
+                             is updated with the newly created tasks.
+        :type shared_tasks: dict
         :returns: Pre/Post RuntimeTasks of the dependencies from runnable
         :rtype: list
         """
@@ -252,6 +322,23 @@ class PrePostRuntimeTaskMixin(RuntimeTask):
                 if isinstance(runnable, tuple):
                     runnable, satisfiable_deps_execution_statuses = runnable
                 output_dir_not_exists = runnable.output_dir is None
+                symlink = os.path.join(
+                    test_task.task.runnable.output_dir,
+                    "dependencies",
+                    f'{runnable.kind}-{runnable.kwargs.get("name")}',
+                )
+                key = None
+                if shared_tasks is not None and is_cacheable and output_dir_not_exists:
+                    key = (
+                        cls.category,
+                        runnable.get_json(),
+                        tuple(satisfiable_deps_execution_statuses or ()),
+                    )
+                    task = shared_tasks.get(key)
+                    if task is not None:
+                        task.task.metadata["symlinks"].append(symlink)
+                        tasks.append(task)
+                        continue
                 task = cls.from_runnable(
                     runnable,
                     no_digits,
@@ -268,12 +355,10 @@ class PrePostRuntimeTaskMixin(RuntimeTask):
                         "dependencies",
                         str(task.task.identifier),
                     )
-                    task.task.metadata["symlink"] = os.path.join(
-                        test_task.task.runnable.output_dir,
-                        "dependencies",
-                        f'{runnable.kind}-{runnable.kwargs.get("name")}',
-                    )
+                    task.task.metadata["symlinks"] = [symlink]
                 task.is_cacheable = is_cacheable
+                if key is not None:
+                    shared_tasks[key] = task
                 tasks.append(task)
         return tasks
 
@@ -281,6 +366,8 @@ class PrePostRuntimeTaskMixin(RuntimeTask):
 class PreRuntimeTask(PrePostRuntimeTaskMixin):
     """Runtime task for tasks run before test"""
 
+    __slots__ = ()
+
     category = "pre_test"
     dispatcher = TestPreDispatcher
 
@@ -288,6 +375,8 @@ class PreRuntimeTask(PrePostRuntimeTaskMixin):
 class PostRuntimeTask(PrePostRuntimeTaskMixin):
     """Runtime task for tasks run after test"""
 
+    __slots__ = ()
+
     category = "post_test"
     dispatcher = TestPostDispatcher
 
@@ -303,6 +392,7 @@ class RuntimeTaskGraph:
         job_id,
         base_dir,
         suite_config=None,
+        batch_packages=False,
     ):
         """Instantiates a new RuntimeTaskGraph.
 
@@ -324,8 +414,14 @@ class RuntimeTaskGraph:
         :type base_dir: str
         :param suite_config: Configuration dict relevant for the whole suite.
         :type suite_config: dict
+        :param batch_packages: whether the packages required by the tests
+                               are installed by a single task, in a single
+                               transaction, before their own tasks run
+        :type batch_packages: bool
         """
         self.graph = {}
+        # identical (cacheable) dependencies of different tests are run once
+        shared_tasks = {}
         # create graph
         no_digits = len(str(len(tests)))
         for index, runnable in enumerate(tests, start=1):
@@ -350,6 +446,7 @@ class RuntimeTaskGraph:
                     status_server_uri,
                     job_id,
                     suite_config,
+                    shared_tasks,
                 )
                 post_tasks = PostRuntimeTask.get_tasks_from_test_task(
                     runtime_test,
@@ -359,9 +456,68 @@ class RuntimeTaskGraph:
                     status_server_uri,
                     job_id,
                     suite_config,
+                    shared_tasks,
                 )
                 if pre_tasks or post_tasks:
                     self._connect_tasks(pre_tasks, [runtime_test], post_tasks)
+        if batch_packages:
+            self._batch_package_tasks(
+                no_digits, base_dir, test_suite_name, status_server_uri, job_id
+            )
+
+    def _batch_package_tasks(
+        self, no_digits, base_dir, test_suite_name, status_server_uri, job_id
+    ):
+        """Makes the package installation tasks depend on a batch one.
+
+        The batch task installs all the packages in a single transaction,
+        so that the package installation tasks, which still report the
+        result for each package to the tests requiring them, find them
+        already installed.  Those run even if the batch task fails, and
+        then try to install their packages on their own.
+        """
+        package_tasks = [
+            task
+            for task in self.graph
+            if isinstance(task, PreRuntimeTask)
+            and task.task.runnable.kind == "package"
+            and task.task.runnable.kwargs.get("action", "install") == "install"
+            and task.task.runnable.kwargs.get("name")
+        ]
+        names = list(
+            dict.fromkeys(
+                name
+                for task in package_tasks
+                for name in task.task.runnable.kwargs["name"].split()
+            )
+        )
+        if len(names) < 2:
+            return
+        config = package_tasks[0].task.runnable.config
+        runnable = Runnable(
+            "package",
+            None,
+            config=Runnable.filter_runnable_config("package", config),
+            action="install",
+            name=" ".join(names),
+        )
+        prefix = f"{test_suite_name}-0" if test_suite_name else 0
+        test_id = TestID(prefix, "package-batch", None, no_digits)
+        runnable.output_dir = os.path.join(base_dir, test_id.str_filesystem)
+        batch_task = PreRuntimeTask(
+            Task(
+                runnable,
+                identifier=test_id,
+                status_uris=status_server_uri,
+                category=PreRuntimeTask.category,
+                job_id=job_id,
+            )
+        )
+        # the first task added to the graph comes first in the topological order
+        self.graph = {batch_task: batch_task, **self.graph}
+        for task in package_tasks:
+            task.satisfiable_deps_execution_statuses = STATUSES
+            task.add_dependency(batch_task)
 
     def _connect_tasks(self, pre_tasks, tasks, post_tasks):
         connections = list(itertools.product(pre_tasks, tasks))
@@ -369,26 +525,42 @@ class RuntimeTaskGraph:
         for dependency, task in connections:
             self.graph[task] = task
             self.graph[dependency] = dependency
-            task.dependencies.append(dependency)
+            task.add_dependency(dependency)
 
     def get_tasks_in_topological_order(self):
         """Computes the topological order of runtime tasks in graph
 
+        This uses Kahn's algorithm.  Among the tasks whose dependencies
+        are already in the order, the one added first to the graph comes
+        first, so tests keep the order they have in the suite, each one
+        preceded by its dependencies (the ones not already in the order).
+
         :returns: runtime tasks in topological order
         :rtype: list
+        :raises ValueError: if there are circular dependencies
         """
-
-        def topological_order_util(vertex, visited, topological_order):
-            visited[vertex] = True
-            for v in vertex.dependencies:
-                if not visited[v]:
-                    topological_order_util(v, visited, topological_order)
-            topological_order.append(vertex)
-
-        visited = dict.fromkeys(self.graph, False)
+        tasks = list(self.graph)
+        position = {task: index for index, task in enumerate(tasks)}
+        # both indexed by the position of the tasks
+        in_degree = [0] * len(tasks)
+        dependents = [[] for _ in tasks]
+        for index, task in enumerate(tasks):
+            for dependency in task.dependencies:
+                dependency_index = position.get(dependency)
+                if dependency_index is not None:
+                    in_degree[index] += 1
+                    dependents[dependency_index].append(index)
+
+        ready = [index for index, degree in enumerate(in_degree) if not degree]
         topological_order = []
-
-        for vertex in self.graph.values():
-            if not visited[vertex]:
-                topological_order_util(vertex, visited, topological_order)
+        while ready:
+            index = heapq.heappop(ready)
+            topological_order.append(tasks[index])
+            for dependent in dependents[index]:
+                in_degree[dependent] -= 1
+                if not in_degree[dependent]:
+                    heapq.heappush(ready, dependent)
+
+        if len(topological_order) != len(tasks):
+            raise ValueError("Circular dependencies between tasks")
         return topological_order
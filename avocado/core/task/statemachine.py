@@ -235,15 +235,16 @@ class Worker:
         except IndexError:
             return
 
-    async def triage(self):
-        """Reads from triaging, moves into either: ready or finished."""
-
-        try:
-            async with self._state_machine.lock:
-                runtime_task = self._state_machine.triaging.pop(0)
-        except IndexError:
-            return
-
+    async def _triage_task(self, runtime_task):
+        """Checks requirements, dependencies and cache for a single task.
+
+        :param runtime_task: A runtime task that has been removed from the
+                             triaging queue.
+        :returns: None if the task is ready to be started, or the
+                  :class:`RuntimeTaskStatus` describing why it can not
+                  (yet) be started.  If it is one of the finished
+                  statuses, the task has already been finished.
+        """
         # a task waiting requirements already checked its requirements
         if runtime_task.status != RuntimeTaskStatus.WAIT_DEPENDENCIES:
             # check for requirements a task may have
@@ -258,17 +259,13 @@ class Worker:
                 await self._state_machine.finish_task(
                     runtime_task, RuntimeTaskStatus.FAIL_TRIAGE
                 )
-                return
+                return RuntimeTaskStatus.FAIL_TRIAGE
 
         # handle task dependencies
         if runtime_task.dependencies:
             # check of all the dependency tasks finished
             if not runtime_task.are_dependencies_finished():
-                async with self._state_machine.lock:
-                    self._state_machine.triaging.append(runtime_task)
-                    runtime_task.status = RuntimeTaskStatus.WAIT_DEPENDENCIES
-                await asyncio.sleep(0.1)
-                return
+                return RuntimeTaskStatus.WAIT_DEPENDENCIES
 
             # dependencies finished, let's check if they finished
             # successfully, so we can move on with the parent task
@@ -300,7 +297,7 @@ class Worker:
                 await self._state_machine.finish_task(
                     runtime_task, RuntimeTaskStatus.FAIL_TRIAGE
                 )
-                return
+                return RuntimeTaskStatus.FAIL_TRIAGE
         if runtime_task.task.category != "test":
             # save or retrieve task from cache
             if runtime_task.is_cacheable:
@@ -309,11 +306,7 @@ class Worker:
                         runtime_task
                     )
                     if is_task_in_cache is None:
-                        async with self._state_machine.lock:
-                            self._state_machine.triaging.append(runtime_task)
-                            runtime_task.status = RuntimeTaskStatus.WAIT
-                            await asyncio.sleep(0.1)
-                        return
+                        return RuntimeTaskStatus.WAIT
 
                     if is_task_in_cache:
                         task_id = str(runtime_task.task.identifier)
@@ -335,40 +328,49 @@ class Worker:
                         self._state_machine._status_repo.process_message(start_message)
                         self._state_machine._status_repo.process_message(log_message)
                         self._state_machine._status_repo.process_message(finish_message)
+                        runtime_task.result = "pass"
                         await self._state_machine.finish_task(
                             runtime_task, RuntimeTaskStatus.IN_CACHE
                         )
-                        runtime_task.result = "pass"
-                        return
+                        return RuntimeTaskStatus.IN_CACHE
 
                     await self._spawner.save_requirement_in_cache(runtime_task)
+        return None
 
-        # the task is ready to run
-        async with self._state_machine.lock:
-            self._state_machine.ready.append(runtime_task)
+    async def triage(self):
+        """Reads from triaging, moves into either: ready or finished."""
 
-    async def start(self):
-        """Reads from ready, moves into either: started or finished."""
         try:
             async with self._state_machine.lock:
-                runtime_task = self._state_machine.ready.pop(0)
+                runtime_task = self._state_machine.triaging.pop(0)
         except IndexError:
             return
 
-        # enforce a rate limit on the number of started (currently
-        # running) tasks.  this is a global limit, but the spawners
-        # can also be queried with regards to their capacity to handle
-        # new tasks
-        should_wait = False
-        async with self._state_machine.lock:
-            if len(self._state_machine.started) >= self._max_running:
-                self._state_machine.ready.insert(0, runtime_task)
-                runtime_task.status = RuntimeTaskStatus.WAIT
-                should_wait = True
-        if should_wait:
+        triage_status = await self._triage_task(runtime_task)
+        if triage_status in (
+            RuntimeTaskStatus.WAIT_DEPENDENCIES,
+            RuntimeTaskStatus.WAIT,
+        ):
+            async with self._state_machine.lock:
+                self._state_machine.triaging.append(runtime_task)
+                runtime_task.status = triage_status
             await asyncio.sleep(0.1)
             return
+        if triage_status is not None:
+            return
 
+        # the task is ready to run
+        async with self._state_machine.lock:
+            self._state_machine.ready.append(runtime_task)
+
+    async def _start_task(self, runtime_task):
+        """Spawns a single task, finishing it if it could not be spawned.
+
+        :param runtime_task: A runtime task that has been removed from the
+                             ready queue.
+        :returns: whether the task was spawned successfully
+        :rtype: bool
+        """
         LOG.debug(
             'Task "%s": about to be spawned with "%s"',
             runtime_task.task.identifier,
@@ -380,27 +382,50 @@ class Worker:
             runtime_task.status = RuntimeTaskStatus.STARTED
             if self._task_timeout is not None:
                 runtime_task.execution_timeout = time.monotonic() + self._task_timeout
-            async with self._state_machine.lock:
-                self._state_machine.started.append(runtime_task)
         else:
             await self._state_machine.finish_task(
                 runtime_task, RuntimeTaskStatus.FAIL_START
             )
+        return start_ok
 
-    async def monitor(self):
-        """Reads from started, moves into finished."""
+    async def start(self):
+        """Reads from ready, moves into either: started or finished."""
         try:
             async with self._state_machine.lock:
-                runtime_task = self._state_machine.started.pop(0)
+                runtime_task = self._state_machine.ready.pop(0)
         except IndexError:
             return
 
+        # enforce a rate limit on the number of started (currently
+        # running) tasks.  this is a global limit, but the spawners
+        # can also be queried with regards to their capacity to handle
+        # new tasks
+        should_wait = False
+        async with self._state_machine.lock:
+            if len(self._state_machine.started) >= self._max_running:
+                self._state_machine.ready.insert(0, runtime_task)
+                runtime_task.status = RuntimeTaskStatus.WAIT
+                should_wait = True
+        if should_wait:
+            await asyncio.sleep(0.1)
+            return
+
+        if await self._start_task(runtime_task):
+            async with self._state_machine.lock:
+                self._state_machine.started.append(runtime_task)
+
+    async def _monitor_task(self, runtime_task):
+        """Waits for a single spawned task and finishes it.
+
+        :param runtime_task: A runtime task that has been spawned and
+                             removed from the started queue.
+        """
         if self._spawner.is_task_alive(runtime_task):
             LOG.debug(
                 'Task "%s" is alive at monitor phase', runtime_task.task.identifier
             )
             async with self._state_machine.lock:
-                self._state_machine._monitored.append(runtime_task)
+                self._state_machine.monitored.append(runtime_task)
             try:
                 if runtime_task.execution_timeout is None:
                     remaining = None
@@ -426,24 +451,14 @@ class Worker:
                 runtime_task.task.identifier,
             )
 
-        # from here, this `task` ran, so, let's check
-        # its latest data in the status repo
-        latest_task_data = (
-            self._state_machine._status_repo.get_latest_task_data(
-                str(runtime_task.task.identifier)
-            )
-            or {}
+        # from here, this `task` ran, so, let's wait for its
+        # finished message (if not already) in the status repo
+        latest_task_data = await self._state_machine._status_repo.wait_task_finished(
+            str(runtime_task.task.identifier)
         )
-        # or maybe its results are not available yet
-        while latest_task_data.get("result") is None:
-            await asyncio.sleep(0.1)
-            latest_task_data = (
-                self._state_machine._status_repo.get_latest_task_data(
-                    str(runtime_task.task.identifier)
-                )
-                or {}
-            )
-        if runtime_task.task.category != "test":
+        # only the results of cacheable tasks (and not, say, the one of
+        # the batch installation of packages) are of use in the cache
+        if runtime_task.task.category != "test" and runtime_task.is_cacheable:
             async with self._state_machine.cache_lock:
                 await self._spawner.update_requirement_cache(
                     runtime_task, latest_task_data["result"].upper()
@@ -458,6 +473,16 @@ class Worker:
 
         await self._state_machine.finish_task(runtime_task, RuntimeTaskStatus.FINISHED)
 
+    async def monitor(self):
+        """Reads from started, moves into finished."""
+        try:
+            async with self._state_machine.lock:
+                runtime_task = self._state_machine.started.pop(0)
+        except IndexError:
+            return
+
+        await self._monitor_task(runtime_task)
+
     async def _terminate_task(self, runtime_task, task_status):
         runtime_task.status = task_status
         terminate_result = await self._spawner.terminate_task(runtime_task)
@@ -503,3 +528,259 @@ class Worker:
             await self.triage()
             await self.start()
             await self.monitor()
+
+
+class EventTaskStateMachine(TaskStateMachine):
+    """State machine that notifies workers about state changes.
+
+    Instead of having workers poll the queues, workers wait on a
+    :class:`asyncio.Condition` that is notified whenever a task
+    becomes ready to be triaged or started, or when a task finishes.
+    Tasks waiting on dependencies are parked outside of the queues
+    and are only put back into triage when their last dependency
+    finishes.
+    """
+
+    #: Interval, in seconds, after which a task waiting on a requirement
+    #: that is being fulfilled outside of this state machine (such as by
+    #: another job sharing the requirements cache) is triaged again
+    CACHE_RETRY_INTERVAL = 1.0
+
+    def __init__(self, tasks, status_repo):
+        super().__init__(tasks, status_repo)
+        self._triaging = collections.deque()
+        self._ready = collections.deque()
+        self._finished_set = set()
+        self._waiting_dependencies = set()
+        self._waiting_cache = []
+        self._cache_retries = {}
+        self._triages_in_progress = 0
+        self._in_progress = 0
+        self._running = 0
+        self._condition = asyncio.Condition(self._lock)
+
+    @property
+    def condition(self):
+        return self._condition
+
+    @property
+    def waiting_dependencies(self):
+        return self._waiting_dependencies
+
+    @property
+    def waiting_cache(self):
+        return self._waiting_cache
+
+    @property
+    async def complete(self):
+        async with self._lock:
+            return self.is_complete()
+
+    def is_complete(self):
+        """Checks, without locking, if there's nothing left to be done."""
+        pending = any(
+            [
+                self._requested,
+                self._triaging,
+                self._ready,
+                self._started,
+                self._waiting_dependencies,
+                self._waiting_cache,
+                self._in_progress,
+            ]
+        )
+        return not pending
+
+    def has_work(self, max_triaging, max_running):
+        """Checks, without locking, if a worker would have something to do.
+
+        :param max_triaging: the limit of tasks being triaged concurrently
+        :param max_running: the limit of tasks running concurrently
+        """
+        if self.is_complete():
+            return True
+        if self._ready and self._running < max_running:
+            return True
+        if (self._triaging or self._requested) and (
+            self._triages_in_progress < max_triaging
+        ):
+            return True
+        return False
+
+    def next_task(self, max_running):
+        """Picks, without locking, the next task a worker should act on.
+
+        Starting tasks that are ready takes precedence over triaging
+        new ones, so that dependencies are resolved as early as possible.
+
+        :param max_running: the limit of tasks running concurrently
+        :returns: a tuple with the task and whether it should be started
+                  (True) or triaged (False)
+        """
+        self._in_progress += 1
+        if self._ready and self._running < max_running:
+            self._running += 1
+            return self._ready.popleft(), True
+        self._triages_in_progress += 1
+        if self._triaging:
+            return self._triaging.popleft(), False
+        runtime_task = self._requested.popleft()
+        LOG.debug('Task "%s": requested -> triaging', runtime_task.task.identifier)
+        return runtime_task, False
+
+    def task_done(self, started):
+        """Accounts, without locking, for a task no longer being worked on.
+
+        :param started: whether the task was picked to be started
+        """
+        self._in_progress -= 1
+        if started:
+            self._running -= 1
+        else:
+            self._triages_in_progress -= 1
+        self._condition.notify_all()
+
+    def park_waiting_dependencies(self, runtime_task):
+        """Parks, without locking, a task until its dependencies finish."""
+        runtime_task.status = RuntimeTaskStatus.WAIT_DEPENDENCIES
+        # a dependency may have finished while the task was being triaged
+        if runtime_task.are_dependencies_finished():
+            self._triaging.appendleft(runtime_task)
+        else:
+            self._waiting_dependencies.add(runtime_task)
+
+    def park_waiting_cache(self, runtime_task):
+        """Parks, without locking, a task until a requirement finishes."""
+        runtime_task.status = RuntimeTaskStatus.WAIT
+        self._waiting_cache.append(runtime_task)
+        self._cache_retries[runtime_task] = asyncio.ensure_future(
+            self._retry_waiting_cache(runtime_task)
+        )
+
+    async def _retry_waiting_cache(self, runtime_task):
+        await asyncio.sleep(self.CACHE_RETRY_INTERVAL)
+        async with self._condition:
+            self._cache_retries.pop(runtime_task, None)
+            if runtime_task in self._waiting_cache:
+                self._waiting_cache.remove(runtime_task)
+                self._triaging.append(runtime_task)
+                self._condition.notify_all()
+
+    def _release_waiting_cache(self):
+        for retry in self._cache_retries.values():
+            retry.cancel()
+        self._cache_retries.clear()
+        released = list(self._waiting_cache)
+        self._waiting_cache.clear()
+        return released
+
+    async def add_new_task(self, runtime_task):
+        async with self._condition:
+            self._requested.appendleft(runtime_task)
+            self._tasks_by_id[str(runtime_task.task.identifier)] = runtime_task.task
+            self._condition.notify_all()
+
+    async def abort(self, status_reason=None):
+        await super().abort(status_reason)
+        await self.abort_queue("waiting_dependencies", status_reason)
+        await self.abort_queue("waiting_cache", status_reason)
+
+    async def abort_queue(self, queue_name, status_reason=None):
+        async with self._lock:
+            if queue_name == "waiting_cache":
+                to_remove = self._release_waiting_cache()
+            else:
+                queue = getattr(self, queue_name)
+                to_remove = list(queue)
+                queue.clear()
+
+        if to_remove:
+            LOG.debug(
+                'Aborting queue "%s" by finishing %u tasks: %s',
+                queue_name,
+                len(to_remove),
+                status_reason,
+            )
+
+        for task in to_remove:
+            await self.finish_task(task, status_reason)
+
+    async def finish_task(self, runtime_task, status_reason=None):
+        async with self._condition:
+            if runtime_task in self._finished_set:
+                return
+            if status_reason:
+                runtime_task.status = status_reason
+                LOG.debug(
+                    'Task "%s" finished with status: %s',
+                    runtime_task.task.identifier,
+                    status_reason,
+                )
+            else:
+                LOG.debug('Task "%s" finished', runtime_task.task.identifier)
+            self._finished.append(runtime_task)
+            self._finished_set.add(runtime_task)
+
+            # the dependencies of the tasks waiting for them were tracked
+            # (and so were their dependents) when they were triaged
+            for dependent in runtime_task.dependents:
+                if (
+                    dependent in self._waiting_dependencies
+                    and dependent.are_dependencies_finished()
+                ):
+                    self._waiting_dependencies.remove(dependent)
+                    self._triaging.appendleft(dependent)
+            # a finished requirement may have been the one others were
+            # waiting on to be saved into the cache
+            if runtime_task.task.category != "test" and self._waiting_cache:
+                self._triaging.extend(self._release_waiting_cache())
+            self._condition.notify_all()
+
+
+class EventWorker(Worker):
+    """Worker that sleeps until the state machine has work for it.
+
+    This is to be used with a :class:`EventTaskStateMachine`.
+    """
+
+    def _has_work(self):
+        return self._state_machine.has_work(self._max_triaging, self._max_running)
+
+    async def _triage(self, runtime_task):
+        triage_status = await self._triage_task(runtime_task)
+        async with self._state_machine.condition:
+            if triage_status == RuntimeTaskStatus.WAIT_DEPENDENCIES:
+                self._state_machine.park_waiting_dependencies(runtime_task)
+            elif triage_status == RuntimeTaskStatus.WAIT:
+                self._state_machine.park_waiting_cache(runtime_task)
+            elif triage_status is None:
+                self._state_machine.ready.append(runtime_task)
+
+    async def _start(self, runtime_task):
+        if await self._start_task(runtime_task):
+            await self._monitor_task(runtime_task)
+
+    async def run(self):
+        """Pushes Tasks forward whenever the state machine notifies changes."""
+        while True:
+            async with self._state_machine.condition:
+                await self._state_machine.condition.wait_for(self._has_work)
+                if self._state_machine.is_complete():
+                    break
+                runtime_task, start = self._state_machine.next_task(self._max_running)
+            try:
+                if start:
+                    await self._start(runtime_task)
+                else:
+                    await self._triage(runtime_task)
+            finally:
+                async with self._state_machine.condition:
+                    self._state_machine.task_done(start)
+
+
+#: The available schedulers, that is, the state machine and worker
+#: implementations, by the name used in the "run.scheduler" option
+SCHEDULERS = {
+    "polling": (TaskStateMachine, Worker),
+    "event": (EventTaskStateMachine, EventWorker),
+}
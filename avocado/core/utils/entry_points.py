@@ -22,47 +22,173 @@ The entry_points() API changed across Python versions:
  Python 3.12+ - returns EntryPoints; group= kwarg supported; no .get()/.groups
 
 These helpers provide a single version-agnostic API for the whole codebase.
+
+Finding the entry points means reading the metadata of every installed
+distribution, which is a significant part of the startup time of short
+lived commands (and it's done once per plugin namespace).  So, the entry
+points are kept on an index, by group, which is cached both on the
+running process and on disk (under ``$XDG_CACHE_HOME/avocado``).  The
+index on disk is used only while its fingerprint, made of the
+modification times of the ``sys.path`` directories and of the entry
+points files of the distributions on them, is still the same.
 """
 
+import hashlib
+import itertools
+import json
+import os
+import sys
+import tempfile
+from importlib.metadata import EntryPoint
 from importlib.metadata import entry_points as _entry_points
 
+#: The suffixes of the metadata directories of the distributions
+METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+#: Indexes already loaded by this process, by the sys.path they were
+#: loaded with
+_INDEXES = {}
+
 
 def _eps_raw():
     """Call entry_points() with no arguments and return the raw result."""
     return _entry_points()
 
 
+def _get_cache_path():
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    key = hashlib.sha256(
+        json.dumps([sys.executable, sys.path]).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(cache_dir, "avocado", f"entry-points-{key[:16]}.json")
+
+
+def _get_fingerprint():
+    """Returns what changes whenever distributions are (un)installed."""
+    stamps = []
+    for path in sys.path:
+        try:
+            stamps.append([path, os.stat(path or ".").st_mtime_ns])
+            with os.scandir(path or ".") as scanned:
+                for dir_entry in scanned:
+                    if not dir_entry.name.endswith(METADATA_SUFFIXES):
+                        continue
+                    try:
+                        mtime = os.stat(
+                            os.path.join(dir_entry.path, "entry_points.txt")
+                        ).st_mtime_ns
+                    except OSError:
+                        mtime = None
+                    stamps.append([dir_entry.name, mtime])
+        except OSError:
+            continue
+    return hashlib.sha256(json.dumps(stamps).encode("utf-8")).hexdigest()
+
+
+def _scan():
+    """Reads the entry points of all distributions, by group.
+
+    In RPM build environments the same package version can appear in more
+    than one ``dist-info`` directory on ``sys.path`` (e.g. both the system
+    install and the BUILDROOT install), and on Python 3.8/3.9 (el9) the
+    same entry point is then listed multiple times.  (name, value)
+    uniquely identifies a plugin regardless of which directory it was
+    discovered from, so the duplicates are dropped, which guards against
+    loading a plugin class more than once.  That would otherwise cause
+    every plugin method to be invoked twice per event (leading to errors
+    like ``FileExistsError`` in the bystatus plugin).
+    """
+    eps = raw = _eps_raw()
+    if isinstance(raw, dict):
+        # Python 3.10/3.11: SelectableGroups, whose dict interface is
+        # deprecated
+        if hasattr(raw, "groups"):
+            eps = itertools.chain.from_iterable(
+                raw.select(group=group) for group in raw.groups
+            )
+        # Python 3.8/3.9 (el9): a plain dict keyed by group
+        else:
+            eps = itertools.chain.from_iterable(raw.values())
+    index = {}
+    seen = set()
+    for ep in eps:
+        key = (ep.group, ep.name, ep.value)
+        if key not in seen:
+            seen.add(key)
+            index.setdefault(ep.group, []).append([ep.name, ep.value])
+    return index
+
+
+def _read_cache(cache_path, fingerprint):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+        return None
+    index = cached.get("groups")
+    if not isinstance(index, dict):
+        return None
+    return index
+
+
+def _write_cache(cache_path, fingerprint, index):
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=os.path.dirname(cache_path),
+            prefix=".entry-points-",
+            delete=False,
+        ) as cache_file:
+            json.dump({"fingerprint": fingerprint, "groups": index}, cache_file)
+        os.replace(cache_file.name, cache_path)
+    except OSError:
+        pass
+
+
+def _get_index():
+    """Returns the entry points of all distributions, by group.
+
+    The index found on disk is used if its fingerprint is still current,
+    otherwise the distributions are scanned and the index is written
+    back, if possible.  Within a process, the index is kept for as long
+    as ``sys.path`` stays the same.
+
+    :returns: the (name, value) of the entry points, by group
+    :rtype: dict
+    """
+    path_key = tuple(sys.path)
+    index = _INDEXES.get(path_key)
+    if index is not None:
+        return index
+    # the fingerprint is taken before scanning, so that changes made
+    # during the scan make the index written to disk look outdated
+    fingerprint = _get_fingerprint()
+    cache_path = _get_cache_path()
+    index = _read_cache(cache_path, fingerprint)
+    if index is None:
+        index = _scan()
+        _write_cache(cache_path, fingerprint, index)
+    _INDEXES[path_key] = index
+    return index
+
+
 def get_entry_points_for(group):
     """Return entry points belonging to *group*, compatible with Python 3.8+.
 
-    On Python 3.9 (el9), ``importlib.metadata.entry_points()`` is called with
-    no arguments and returns a plain dict.  In RPM build environments the same
-    package version can appear in more than one ``dist-info`` directory on
-    ``sys.path`` (e.g. both the system install and the BUILDROOT install), which
-    causes the same entry point to be listed multiple times in that dict.  The
-    deduplication below guards against loading a plugin class more than once,
-    which would otherwise cause every plugin method to be invoked twice per
-    event (leading to errors like ``FileExistsError`` in the bystatus plugin).
+    The entry points come from the index (see :func:`_get_index`), so
+    they're deduplicated, and they're not bound to their distributions.
 
     :param group: entry point group name (e.g. ``"avocado.plugins.cli"``)
     :type group: str
     :returns: sequence of entry points in the requested group, deduplicated
     """
-    eps = _eps_raw()
-    # Python 3.8/3.9 (el9): entry_points() returns a plain dict keyed by group
-    if isinstance(eps, dict):
-        seen = set()
-        result = []
-        for ep in eps.get(group, []):
-            # (name, value) uniquely identifies a plugin regardless of which
-            # dist-info directory it was discovered from.
-            key = (ep.name, ep.value)
-            if key not in seen:
-                seen.add(key)
-                result.append(ep)
-        return result
-    # Python 3.10+: EntryPoints / SelectableGroups — use group= kwarg directly
-    return _entry_points(group=group)
+    return [
+        EntryPoint(name, value, group) for name, value in _get_index().get(group, [])
+    ]
 
 
 def get_entry_point_module_name(entry_point):
@@ -92,12 +218,4 @@ def get_entry_point_groups():
     :returns: list of group name strings
     :rtype: list
     """
-    eps = _eps_raw()
-    # Python 3.8/3.9: plain dict
-    if isinstance(eps, dict):
-        return list(eps.keys())
-    # Python 3.10/3.11: SelectableGroups has .groups
-    if hasattr(eps, "groups"):
-        return list(eps.groups)
-    # Python 3.12+: EntryPoints — collect unique group names by iterating entries
-    return list({ep.group for ep in eps})
+    return list(_get_index())
@@ -17,7 +17,12 @@ Assets subcommand
 """
 
 import ast
+import concurrent.futures
+import json
+import multiprocessing
 import os
+import sqlite3
+import time
 from datetime import datetime
 
 from avocado.core import exit_codes, safeloader
@@ -26,11 +31,14 @@ from avocado.core.output import LOG_UI
 from avocado.core.plugin_interfaces import CLICmd, JobPreTests
 from avocado.core.settings import settings
 from avocado.utils import data_structures
-from avocado.utils.asset import SUPPORTED_OPERATORS, Asset
+from avocado.utils.asset import DEFAULT_HASH_ALGORITHM, SUPPORTED_OPERATORS, Asset
 from avocado.utils.astring import iter_tabular_output
 from avocado.utils.data_structures import DataSize, InvalidDataSize
 from avocado.utils.output import display_data_size
 
+#: The default maximum number of assets being fetched at a time
+FETCH_WORKERS = 4
+
 
 class FetchAssetHandler(ast.NodeVisitor):  # pylint: disable=R0902
     """
@@ -225,37 +233,110 @@ class FetchAssetHandler(ast.NodeVisitor):  # pylint: disable=R0902
                         self.calls.append(call)
 
 
-def fetch_assets(
-    test_file, test_file_parse_cache, klass=None, method=None, logger=None
-):
-    """Fetches the assets based on keywords listed on FetchAssetHandler.calls.
+def _get_asset(call, cache_dirs):
+    """Creates the asset of a `fetch_asset()` call.
 
-    :param test_file: File name of instrumented test to be evaluated
-                      :type test_file: str
+    :param call: the keyword arguments of the call, as found by
+                 :class:`FetchAssetHandler`
+    """
+    call = dict(call)
+    expire = call.pop("expire", None)
+    if expire is not None:
+        expire = data_structures.time_to_seconds(str(expire))
+    return Asset(**call, cache_dirs=cache_dirs, expire=expire)
+
+
+def _fetch_asset(call, cache_dirs, timeout):
+    """Fetches the asset of a `fetch_asset()` call.
+
+    :returns: the path of the asset and whether it was already on the cache
+    """
+    asset_obj = _get_asset(call, cache_dirs)
+    try:
+        asset_obj.find_asset_file()
+        cached = True
+    except OSError:
+        cached = False
+    return asset_obj.fetch(timeout), cached
+
+
+def fetch_asset_calls(calls, workers=1, logger=None):
+    """Fetches the assets of `fetch_asset()` calls, a number at a time.
+
+    Calls with the same arguments, such as the ones on the `setUp()` of
+    different tests of the same class, have their asset fetched once.
+
+    :param calls: keyword arguments of the calls, as found by
+                  :class:`FetchAssetHandler`
+    :type calls: list of dict
+    :param workers: the maximum number of assets being fetched at a time
+    :type workers: int
+    :param logger: logger for the progress of the fetching and its summary
     :returns: list of names that were successfully fetched and list of
               fails.
     """
     cache_dirs = settings.as_dict().get("datadir.paths.cache_dirs")
     timeout = settings.as_dict().get("assets.fetch.timeout")
+    unique_calls = {}
+    for call in calls:
+        unique_calls.setdefault(json.dumps(call, sort_keys=True), call)
     success = []
     fail = []
-    handler = FetchAssetHandler(test_file, test_file_parse_cache, klass, method)
-    for call in handler.calls:
-        expire = call.pop("expire", None)
-        if expire is not None:
-            expire = data_structures.time_to_seconds(str(expire))
-
-        try:
-            asset_obj = Asset(**call, cache_dirs=cache_dirs, expire=expire)
+    downloaded = 0
+    start = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max(workers, 1)) as executor:
+        futures = {
+            executor.submit(_fetch_asset, call, cache_dirs, timeout): call["name"]
+            for call in unique_calls.values()
+        }
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                asset_path, cached = future.result()
+            except (OSError, ValueError) as failed:
+                fail.append(failed)
+                if logger is not None:
+                    logger.warning("Failed to fetch asset %s: %s", name, failed)
+                continue
+            success.append(name)
+            if not cached:
+                downloaded += os.path.getsize(asset_path)
             if logger is not None:
-                logger.info("Fetching asset from %s:%s.%s", test_file, klass, method)
-            asset_obj.fetch(timeout)
-            success.append(call["name"])
-        except (OSError, ValueError) as failed:
-            fail.append(failed)
+                logger.info(
+                    "Asset %s %s (%d/%d)",
+                    name,
+                    "already on cache" if cached else "fetched",
+                    len(success) + len(fail),
+                    len(futures),
+                )
+    elapsed = time.monotonic() - start
+    if logger is not None and unique_calls:
+        logger.info(
+            "Fetched %d assets (%d failed) in %.2fs, %s downloaded (%s/s)",
+            len(success),
+            len(fail),
+            elapsed,
+            display_data_size(downloaded),
+            display_data_size(downloaded / elapsed if elapsed else 0),
+        )
     return success, fail
 
 
+def fetch_assets(
+    test_file, test_file_parse_cache, klass=None, method=None, logger=None, workers=1
+):
+    """Fetches the assets based on keywords listed on FetchAssetHandler.calls.
+
+    :param test_file: File name of instrumented test to be evaluated
+                      :type test_file: str
+    :param workers: the maximum number of assets being fetched at a time
+    :returns: list of names that were successfully fetched and list of
+              fails.
+    """
+    handler = FetchAssetHandler(test_file, test_file_parse_cache, klass, method)
+    return fetch_asset_calls(handler.calls, workers, logger)
+
+
 class FetchAssetJob(JobPreTests):  # pylint: disable=R0903
     """Implements the assets fetch job pre tests.
 
@@ -290,11 +371,17 @@ class FetchAssetJob(JobPreTests):  # pylint: disable=R0903
                         if candidate not in candidates:
                             candidates.append(candidate)
 
+        # The assets of all tests are fetched together, so that the same
+        # asset is fetched only once, and different ones concurrently
         test_file_parse_cache = {}
-        for candidate in candidates:
-            fetch_assets(
-                candidate[0], test_file_parse_cache, candidate[1], candidate[2], logger
+        calls = []
+        for module_path, klass, method in candidates:
+            handler = FetchAssetHandler(
+                module_path, test_file_parse_cache, klass, method
             )
+            calls.extend(handler.calls)
+        workers = job.config.get("assets.fetch.workers") or FETCH_WORKERS
+        fetch_asset_calls(calls, workers, logger)
 
 
 class Assets(CLICmd):
@@ -415,6 +502,21 @@ class Assets(CLICmd):
             long_arg="--timeout",
         )
 
+        help_msg = (
+            "Maximum number of assets being fetched at a time, from "
+            "the same test file, or before the tests of a job."
+        )
+        settings.register_option(
+            section="assets.fetch",
+            key="workers",
+            help_msg=help_msg,
+            default=FETCH_WORKERS,
+            key_type=int,
+            metavar="WORKERS",
+            parser=fetch_subcommand_parser,
+            long_arg="--workers",
+        )
+
         register_subcommand_parser = subcommands.add_parser(
             "register", help="Register an asset directly to the cacche"
         )
@@ -462,6 +564,29 @@ class Assets(CLICmd):
         list_subcommand_parser = subcommands.add_parser("list", help=help_msg)
         register_filter_options(list_subcommand_parser, "assets.list")
 
+        help_msg = (
+            "Rebuilds the catalogs of the cache directories, after assets "
+            "were added or removed by other means than Avocado."
+        )
+        subcommands.add_parser("reindex", help=help_msg)
+
+        help_msg = (
+            "Verifies the integrity of the cached assets, by hashing their "
+            "contents again and comparing with the recorded hashes."
+        )
+        verify_subcommand_parser = subcommands.add_parser("verify", help=help_msg)
+        help_msg = "Maximum number of assets being verified at a time."
+        settings.register_option(
+            section="assets.verify",
+            key="workers",
+            help_msg=help_msg,
+            default=multiprocessing.cpu_count(),
+            key_type=int,
+            metavar="WORKERS",
+            parser=verify_subcommand_parser,
+            long_arg="--workers",
+        )
+
     def handle_purge(self, config):
         days = config.get("assets.purge.days")
         size_filter = config.get("assets.purge.size_filter")
@@ -509,31 +634,27 @@ class Assets(CLICmd):
             return exit_codes.AVOCADO_FAIL
 
         cache_dirs = config.get("datadir.paths.cache_dirs")
+        criteria = {}
         try:
-            assets = None
             if days is not None:
-                assets = Asset.get_assets_unused_for_days(days, cache_dirs)
+                criteria["accessed_before"] = time.time() - days * 24 * 60 * 60
             elif size_filter is not None:
-                assets = Asset.get_assets_by_size(size_filter, cache_dirs)
-            elif assets is None:
-                assets = Asset.get_all_assets(cache_dirs)
+                criteria["size_filter"] = Asset.parse_size_filter(size_filter)
+            entries = Asset.get_catalog_entries(cache_dirs, **criteria)
         except (FileNotFoundError, OSError) as e:
             LOG_UI.error("Could get assets: %s", e)
             return exit_codes.AVOCADO_FAIL
 
         matrix = []
-        for asset in assets:
-            stat = os.stat(asset)
-            basename = os.path.basename(asset)
-            hash_path = f"{asset}-CHECKSUM"
-            atime = datetime.fromtimestamp(stat.st_atime)
-            _, checksum = Asset.read_hash_from_file(hash_path)
+        for entry in entries:
+            atime = datetime.fromtimestamp(entry.atime)
+            checksum = entry.hashes.get(DEFAULT_HASH_ALGORITHM)
             matrix.append(
                 (
-                    basename,
+                    os.path.basename(entry.path),
                     str(checksum or "unknown")[:10],
                     atime.strftime("%Y-%m-%d %H:%M:%S"),
-                    display_data_size(stat.st_size),
+                    display_data_size(entry.size),
                 )
             )
         header = ("asset", "checksum", "atime", "size")
@@ -544,6 +665,49 @@ class Assets(CLICmd):
             for line in output:
                 LOG_UI.info(line)
 
+    @staticmethod
+    def handle_reindex(config):
+        cache_dirs = config.get("datadir.paths.cache_dirs")
+        try:
+            result = Asset.rebuild_catalogs(cache_dirs)
+        except (OSError, sqlite3.Error) as e:
+            LOG_UI.error("Could not rebuild the assets catalogs: %s", e)
+            return exit_codes.AVOCADO_FAIL
+        for cache_dir, assets in result.items():
+            LOG_UI.info("%s: %d assets", cache_dir, assets)
+        return exit_codes.AVOCADO_ALL_OK
+
+    @staticmethod
+    def _verify_asset(asset_path):
+        try:
+            return Asset.verify_asset_file(asset_path)
+        except OSError as e:
+            return e
+
+    def handle_verify(self, config):
+        cache_dirs = config.get("datadir.paths.cache_dirs")
+        workers = config.get("assets.verify.workers")
+        assets = Asset.get_all_assets(cache_dirs, sort=False)
+        failed = 0
+        with concurrent.futures.ThreadPoolExecutor(max(workers, 1)) as executor:
+            for asset_path, result in zip(
+                assets, executor.map(self._verify_asset, assets)
+            ):
+                if isinstance(result, OSError):
+                    LOG_UI.error("%s: could not be verified: %s", asset_path, result)
+                elif result:
+                    LOG_UI.error(
+                        "%s: hash mismatch (%s)", asset_path, ", ".join(result)
+                    )
+                else:
+                    LOG_UI.debug("%s: OK", asset_path)
+                    continue
+                failed += 1
+        LOG_UI.info("Verified %d assets, %d failed", len(assets), failed)
+        if failed:
+            return exit_codes.AVOCADO_FAIL
+        return exit_codes.AVOCADO_ALL_OK
+
     @staticmethod
     def handle_fetch(config):
         exitcode = exit_codes.AVOCADO_ALL_OK
@@ -552,7 +716,9 @@ class Assets(CLICmd):
         for test_file in config.get("assets.fetch.references"):
             if os.path.isfile(test_file) and test_file.endswith(".py"):
                 LOG_UI.debug("Fetching assets from %s.", test_file)
-                success, fail = fetch_assets(test_file, cache)
+                success, fail = fetch_assets(
+                    test_file, cache, workers=config.get("assets.fetch.workers")
+                )
 
                 for asset_file in success:
                     LOG_UI.debug("  File %s fetched or already on cache.", asset_file)
@@ -609,5 +775,9 @@ class Assets(CLICmd):
             return self.handle_purge(config)
         elif subcommand == "list":
             return self.handle_list(config)
+        elif subcommand == "reindex":
+            return self.handle_reindex(config)
+        elif subcommand == "verify":
+            return self.handle_verify(config)
         else:
             return exit_codes.UTILITY_FAIL
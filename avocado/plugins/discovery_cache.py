@@ -0,0 +1,38 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright: Red Hat Inc. 2026
+
+from avocado.core import output
+from avocado.core.plugin_interfaces import Cache
+from avocado.core.safeloader import cache
+from avocado.utils import astring
+
+
+class DiscoveryCache(Cache):
+
+    name = "discovery"
+    description = "Provides entries of tests found on Python source files"
+
+    def list(self):
+        entries = cache.get_entries()
+        if not entries:
+            return ""
+        header = (
+            output.TERM_SUPPORT.header_str("Path"),
+            output.TERM_SUPPORT.header_str("Tests_of"),
+            output.TERM_SUPPORT.header_str("Tests"),
+        )
+        matrix = [[path, target, str(tests)] for target, path, tests in entries]
+        return astring.tabular_output(matrix, header=header, strip=True) + "\n\n"
+
+    def clear(self):
+        cache.clear()
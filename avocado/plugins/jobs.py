@@ -18,13 +18,18 @@ Jobs subcommand
 import json
 import os
 from datetime import datetime
-from glob import glob
 
-from avocado.core import exit_codes, output
-from avocado.core.data_dir import get_job_results_dir, get_logs_dir
+from avocado.core import exit_codes, jobindex, output
+from avocado.core.data_dir import get_job_results_dir
 from avocado.core.output import LOG_UI
 from avocado.core.plugin_interfaces import CLICmd
 from avocado.core.settings import settings
+from avocado.plugins.jsonresult import (
+    JSON_LINES_FILENAME,
+    JSONResult,
+    load_results_stream,
+)
+from avocado.plugins.xunit import XUnitResult
 from avocado.utils import astring
 
 
@@ -118,7 +123,40 @@ class Jobs(CLICmd):
         subcommands.required = True
 
         help_msg = "List all known jobs by Avocado"
-        subcommands.add_parser("list", help=help_msg)
+        list_parser = subcommands.add_parser("list", help=help_msg)
+        settings.register_option(
+            section="jobs.list",
+            key="limit",
+            help_msg="Maximum number of jobs to list, most recent first",
+            key_type=int,
+            default=None,
+            metavar="LIMIT",
+            parser=list_parser,
+            long_arg="--limit",
+        )
+        settings.register_option(
+            section="jobs.list",
+            key="offset",
+            help_msg="Number of (most recent) jobs to skip before listing",
+            key_type=int,
+            default=0,
+            metavar="OFFSET",
+            parser=list_parser,
+            long_arg="--offset",
+        )
+        help_msg = (
+            "Rebuild the index of jobs, reading all job results "
+            "directories, before listing them"
+        )
+        settings.register_option(
+            section="jobs.list",
+            key="rebuild_index",
+            help_msg=help_msg,
+            key_type=bool,
+            default=False,
+            parser=list_parser,
+            long_arg="--rebuild-index",
+        )
 
         help_msg = (
             "Show details about a specific job. When passing a Job "
@@ -137,23 +175,49 @@ class Jobs(CLICmd):
             parser=show_parser,
         )
 
+        help_msg = (
+            "Regenerate the JSON and xUnit results of a job from its "
+            f'stream of test results ("{JSON_LINES_FILENAME}"), such '
+            "as for jobs that were killed before finishing. When passing "
+            'a Job ID, you can use any Job Reference (job_id, "latest", '
+            "or job results path)."
+        )
+        regenerate_parser = subcommands.add_parser("regenerate", help=help_msg)
+        settings.register_option(
+            section="jobs.regenerate",
+            key="job_id",
+            help_msg="JOB id",
+            metavar="JOBID",
+            default="latest",
+            nargs="?",
+            positional_arg=True,
+            parser=regenerate_parser,
+        )
+
     @staticmethod
-    def handle_list_command(jobs_results):
+    def handle_list_command(config):
         """Called when 'avocado jobs list' command is executed."""
 
-        for filename in jobs_results.values():
-            with open(filename, "r", encoding="utf-8") as fp:
-                job = json.load(fp)
-                LOG_UI.info(
-                    "%-40s %-26s %3s (%s/%s/%s/%s)",
-                    job.get("job_id", "<unknown>"),
-                    job.get("start", "<unknown>"),
-                    job.get("total", "<unknown>"),
-                    job.get("pass", "<unknown>"),
-                    job.get("skip", "<unknown>"),
-                    job.get("errors", "<unknown>"),
-                    job.get("failures", "<unknown>"),
-                )
+        entries = jobindex.load(
+            config.get("datadir.paths.logs_dir"),
+            rebuild=config.get("jobs.list.rebuild_index"),
+        )
+        # only the jobs that ran tests, most recent first
+        jobs = [entry for entry in reversed(entries) if entry.get("total")]
+        offset = config.get("jobs.list.offset") or 0
+        limit = config.get("jobs.list.limit")
+        end = None if limit is None else offset + limit
+        for job in jobs[offset:end]:
+            LOG_UI.info(
+                "%-40s %-26s %3s (%s/%s/%s/%s)",
+                job.get("id", "<unknown>"),
+                job.get("start", "<unknown>"),
+                job.get("total", "<unknown>"),
+                job.get("pass", "<unknown>"),
+                job.get("skip", "<unknown>"),
+                job.get("errors", "<unknown>"),
+                job.get("failures", "<unknown>"),
+            )
 
         return exit_codes.AVOCADO_ALL_OK
 
@@ -199,22 +263,53 @@ class Jobs(CLICmd):
         self._print_job_details({"RESULTS": results})
         return exit_codes.AVOCADO_ALL_OK
 
-    def run(self, config):
-        results = {}
-
-        jobs_dir = get_logs_dir()
-        for result in sorted(
-            glob(os.path.join(jobs_dir, "*/results.json")),
-            key=os.path.getmtime,
-            reverse=True,
-        ):
-            with open(result, "r", encoding="utf-8") as fp:
-                job = json.load(fp)
-                results[job["job_id"]] = result
+    @staticmethod
+    def handle_regenerate_command(config):
+        """Called when 'avocado jobs regenerate' command is executed."""
+
+        job_id = config.get("jobs.regenerate.job_id")
+        results_dir = get_job_results_dir(job_id)
+        if results_dir is None:
+            LOG_UI.error("Error: Job %s not found", job_id)
+            return exit_codes.AVOCADO_GENERIC_CRASH
+
+        stream_path = os.path.join(results_dir, JSON_LINES_FILENAME)
+        try:
+            result = load_results_stream(stream_path)
+        except FileNotFoundError:
+            LOG_UI.error("File not found %s", stream_path)
+            return exit_codes.AVOCADO_GENERIC_CRASH
+        except ValueError:
+            # the job was killed before anything was written to the stream
+            LOG_UI.error("No results to regenerate on %s", stream_path)
+            return exit_codes.AVOCADO_GENERIC_CRASH
 
+        json_path = os.path.join(results_dir, "results.json")
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            JSONResult.dump(result, json_file)
+        LOG_UI.info("JSON results regenerated at %s", json_path)
+
+        xunit_path = os.path.join(results_dir, "results.xml")
+        with open(xunit_path, "wb") as xunit_file:
+            XUnitResult().dump(
+                result,
+                xunit_file,
+                config.get("job.run.result.xunit.max_test_log_chars"),
+                config.get("job.run.result.xunit.job_name"),
+            )
+        LOG_UI.info("xUnit results regenerated at %s", xunit_path)
+        try:
+            jobindex.update(results_dir)
+        except OSError:
+            pass
+        return exit_codes.AVOCADO_ALL_OK
+
+    def run(self, config):
         subcommand = config.get("jobs_subcommand")
         if subcommand == "list":
-            return self.handle_list_command(results)
+            return self.handle_list_command(config)
         elif subcommand == "show":
             return self.handle_show_command(config)
+        elif subcommand == "regenerate":
+            return self.handle_regenerate_command(config)
         return exit_codes.AVOCADO_ALL_OK
@@ -19,10 +19,12 @@ JSON output module.
 
 import json
 import os
+import textwrap
 
 from avocado.core.output import LOG_UI
 from avocado.core.parser import FileOrStdoutAction
-from avocado.core.plugin_interfaces import CLI, Init, Result
+from avocado.core.plugin_interfaces import CLI, Init, Result, ResultEvents
+from avocado.core.result import Result as JobResult
 from avocado.core.settings import settings
 from avocado.core.test_id import TestID
 from avocado.utils import astring
@@ -30,45 +32,98 @@ from avocado.utils import astring
 UNKNOWN = "<unknown>"
 
 
+#: Name of the file, in the job results directory, with the test
+#: results streamed as JSON Lines while the job runs
+JSON_LINES_FILENAME = "results.jsonl"
+
+#: Keys of the test states that are recorded on the stream (to allow
+#: other formats to be regenerated from it), but not on results.json
+_STREAM_ONLY_KEYS = ("class_name", "fail_class", "traceback")
+
+_JSON_KWARGS = {"sort_keys": True, "indent": 4, "separators": (",", ": ")}
+
+
+def _get_test_record(test):
+    fail_reason = test.get("fail_reason", UNKNOWN)
+    if fail_reason is not None:
+        fail_reason = astring.to_text(fail_reason)
+    # Actually we are saving the TestID() there.
+    test_id = test.get("name", UNKNOWN)
+    if isinstance(test_id, TestID):
+        name = f"{test_id.name}{test_id.str_variant}"
+    else:
+        name = str(test_id)
+    return {
+        "id": str(test_id),
+        "name": str(name),
+        "time_start": test.get("time_start", -1),
+        "actual_time_start": test.get("actual_time_start", -1),
+        "time_end": test.get("time_end", -1),
+        "actual_time_end": test.get("actual_time_end", -1),
+        "time_elapsed": test.get("time_elapsed", -1),
+        "status": test.get("status", {}),
+        "tags": test.get("tags") or {},
+        "whiteboard": test.get("whiteboard", UNKNOWN),
+        "logdir": test.get("logdir", UNKNOWN),
+        "logfile": test.get("logfile", UNKNOWN),
+        "fail_reason": fail_reason,
+    }
+
+
+def _get_test_state(record):
+    test_id = record.get("id", UNKNOWN)
+    name = record.get("name", UNKNOWN)
+    state = dict(record)
+    if test_id.endswith(f"-{name}"):
+        state["name"] = TestID(test_id[: -len(name) - 1], name)
+    return state
+
+
+def load_results_stream(path):
+    """
+    Loads the test results streamed by :class:`JSONLinesResult`.
+
+    A stream that was not completely written (such as the one of a job
+    that was killed) is loaded up to its last complete test record, and
+    the tests without a record are accounted as skipped, just like it
+    happens with interrupted jobs.
+
+    :param path: path of the results stream ("results.jsonl") file
+    :returns: the job result, as if tests had been run and finished
+    :rtype: :class:`avocado.core.result.Result`
+    :raises: ValueError if the header, with the job information, was not
+             completely written
+    """
+    with open(path, "r", encoding="utf-8") as stream:
+        header = json.loads(stream.readline())
+        if not isinstance(header, dict):
+            raise ValueError(f"Invalid results stream header on {path}")
+        result = JobResult(
+            header.get("job_id"), header.get("debuglog"), header.get("start")
+        )
+        result.tests_total = header.get("total", 0)
+        for line in stream:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # the last record was only partially written
+                break
+            result.check_test(_get_test_state(record))
+    result.end_tests()
+    return result
+
+
 class JSONResult(Result):
 
     name = "json"
     description = "JSON result support"
 
     @staticmethod
-    def _render(result):
-        tests = []
-        for test in result.tests:
-            fail_reason = test.get("fail_reason", UNKNOWN)
-            if fail_reason is not None:
-                fail_reason = astring.to_text(fail_reason)
-            # Actually we are saving the TestID() there.
-            test_id = test.get("name", UNKNOWN)
-            if isinstance(test_id, TestID):
-                name = f"{test_id.name}{test_id.str_variant}"
-            else:
-                name = str(test_id)
-            tests.append(
-                {
-                    "id": str(test_id),
-                    "name": str(name),
-                    "time_start": test.get("time_start", -1),
-                    "actual_time_start": test.get("actual_time_start", -1),
-                    "time_end": test.get("time_end", -1),
-                    "actual_time_end": test.get("actual_time_end", -1),
-                    "time_elapsed": test.get("time_elapsed", -1),
-                    "status": test.get("status", {}),
-                    "tags": test.get("tags") or {},
-                    "whiteboard": test.get("whiteboard", UNKNOWN),
-                    "logdir": test.get("logdir", UNKNOWN),
-                    "logfile": test.get("logfile", UNKNOWN),
-                    "fail_reason": fail_reason,
-                }
-            )
-        content = {
+    def _get_content(result):
+        return {
             "job_id": result.job_unique_id,
             "debuglog": result.logfile,
-            "tests": tests,
+            "tests": [],
             "total": result.tests_total,
             "pass": result.passed,
             "errors": result.errors,
@@ -80,7 +135,39 @@ class JSONResult(Result):
             "time": result.tests_total_time,
             "start": str(result.job_start_date_time),
         }
-        return json.dumps(content, sort_keys=True, indent=4, separators=(",", ": "))
+
+    @staticmethod
+    def _render(result):
+        content = JSONResult._get_content(result)
+        content["tests"] = [_get_test_record(test) for test in result.tests]
+        return json.dumps(content, **_JSON_KWARGS)
+
+    @staticmethod
+    def dump(result, json_file):
+        """
+        Writes the JSON results to a file, one test at a time.
+
+        The content is the same as the one given by :meth:`_render`,
+        but there's no need to hold all of it in memory.
+
+        :param result: the job result
+        :type result: :class:`avocado.core.result.Result`
+        :param json_file: a file object open for writing text
+        """
+        content = json.dumps(JSONResult._get_content(result), **_JSON_KWARGS)
+        head, tail = content.split('\n    "tests": []', 1)
+        json_file.write(head)
+        json_file.write('\n    "tests": [')
+        separator = "\n"
+        for test in result.tests:
+            record = json.dumps(_get_test_record(test), **_JSON_KWARGS)
+            json_file.write(separator)
+            json_file.write(textwrap.indent(record, " " * 8))
+            separator = ",\n"
+        if result.tests:
+            json_file.write("\n    ")
+        json_file.write("]")
+        json_file.write(tail)
 
     def render(self, result, job):
         json_output = job.config.get("job.run.result.json.output")
@@ -92,19 +179,73 @@ class JSONResult(Result):
         if not result.tests_total:
             return
 
-        content = self._render(result)
         if json_enabled:
             json_path = os.path.join(job.logdir, "results.json")
             with open(json_path, "w", encoding="utf-8") as json_file:
-                json_file.write(content)
+                self.dump(result, json_file)
 
         json_path = json_output
         if json_path is not None:
             if json_path == "-":
-                LOG_UI.debug(content)
+                LOG_UI.debug(self._render(result))
             else:
                 with open(json_path, "w", encoding="utf-8") as json_file:
-                    json_file.write(content)
+                    self.dump(result, json_file)
+
+
+class JSONLinesResult(ResultEvents):
+    """
+    Streams the test results, as they finish, to a JSON Lines file
+
+    The first line holds the job information, and every other line
+    the results of one test.  Because every line is written (and
+    flushed) as soon as a test finishes, the results of the finished
+    tests are kept even if the job does not finish, and can be used to
+    regenerate the other result formats with ``avocado jobs regenerate``.
+    """
+
+    name = "jsonl"
+    description = "JSON Lines results stream"
+
+    def __init__(self, config):  # pylint: disable=W0613,W0231
+        self.stream = None
+
+    def pre_tests(self, job):
+        if not job.config.get("job.run.result.jsonl.enabled"):
+            return
+        if not job.result.tests_total:
+            return
+        path = os.path.join(job.logdir, JSON_LINES_FILENAME)
+        self.stream = open(path, "w", encoding="utf-8")  # pylint: disable=R1732
+        header = {
+            "job_id": job.unique_id,
+            "debuglog": job.logfile,
+            "start": str(job.result.job_start_date_time),
+            "total": job.result.tests_total,
+        }
+        self.stream.write(json.dumps(header, sort_keys=True) + "\n")
+        self.stream.flush()
+
+    def start_test(self, result, state):
+        pass
+
+    def test_progress(self, progress=False):
+        pass
+
+    def end_test(self, result, state):
+        if self.stream is None:
+            return
+        record = _get_test_record(state)
+        for key in _STREAM_ONLY_KEYS:
+            if key in state:
+                record[key] = state[key]
+        self.stream.write(json.dumps(record, sort_keys=True, default=str) + "\n")
+        self.stream.flush()
+
+    def post_tests(self, job):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
 
 
 class JSONInit(Init):
@@ -133,6 +274,18 @@ class JSONInit(Init):
             help_msg=help_msg,
         )
 
+        help_msg = (
+            "Enables the JSON Lines stream of test results in the job "
+            'results directory. File will be named "results.jsonl".'
+        )
+        settings.register_option(
+            section="job.run.result.jsonl",
+            key="enabled",
+            key_type=bool,
+            default=True,
+            help_msg=help_msg,
+        )
+
 
 class JSONCLI(CLI):
     """
@@ -161,5 +314,11 @@ class JSONCLI(CLI):
             long_arg="--disable-json-job-result",
         )
 
+        settings.add_argparser_to_option(
+            namespace="job.run.result.jsonl.enabled",
+            parser=run_subcommand_parser,
+            long_arg="--disable-jsonl-job-result",
+        )
+
     def run(self, config):
         pass
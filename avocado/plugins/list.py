@@ -232,6 +232,14 @@ class List(CLICmd):
             allow_multiple=True,
         )
 
+        settings.add_argparser_to_option(
+            namespace="resolver.workers",
+            metavar="WORKERS",
+            parser=parser,
+            long_arg="--resolver-workers",
+            allow_multiple=True,
+        )
+
         settings.add_argparser_to_option(
             namespace="resolver.exec_runnables_recipe.arguments",
             metavar="ARGS",
@@ -12,7 +12,6 @@
 # Copyright: Red Hat Inc. 2022
 # Author: Jan Richter <jarichte@redhat.com>
 
-import os
 
 from avocado.core import output
 from avocado.core.dependencies.requirements.cache.backends import sqlite
@@ -53,5 +52,4 @@ class RequirementCache(Cache):
         return requirement_list
 
     def clear(self):
-        if os.path.exists(sqlite.CACHE_DATABASE_PATH):
-            os.remove(sqlite.CACHE_DATABASE_PATH)
+        sqlite.clear()
@@ -68,7 +68,7 @@ class ExecTestResolver(BaseExec, Resolver):
         )
 
 
-def python_resolver(name, reference, find_tests):
+def python_resolver(name, reference, find_tests, cache=False):
     module_path, tests_filter = reference_split(reference)
     if tests_filter is not None:
         tests_filter = re.compile(tests_filter)
@@ -78,7 +78,7 @@ def python_resolver(name, reference, find_tests):
         return criteria_check
 
     # disabled tests not needed here
-    class_methods_info, _ = find_tests(module_path)
+    class_methods_info, _ = find_tests(module_path, cache=cache)
     runnables = []
     for klass, methods_tags_depens in class_methods_info.items():
         for method, tags, depens in methods_tags_depens:
@@ -103,19 +103,44 @@ def python_resolver(name, reference, find_tests):
     return ReferenceResolution(reference, ReferenceResolutionResult.NOTFOUND)
 
 
+class PythonResolverInit(Init):
+    name = "python-resolvers"
+    description = (
+        'Configuration for resolver plugins "avocado-instrumented" and '
+        '"python-unittest"'
+    )
+
+    def initialize(self):
+        help_msg = (
+            "Whether the tests found on Python source files should be kept "
+            "in a cache, and reused while neither the files, nor the "
+            "modules with the parent classes of their tests, change."
+        )
+        settings.register_option(
+            section="resolver",
+            key="discovery_cache",
+            key_type=bool,
+            default=True,
+            help_msg=help_msg,
+        )
+
+
 class PythonUnittestResolver(Resolver):
 
     name = "python-unittest"
     description = "Test resolver for Python Unittests"
 
     @staticmethod
-    def _find_compat(module_path):
+    def _find_compat(module_path, cache=False):
         """Used as compatibility for the :func:`python_resolver()` interface."""
-        return find_python_unittests(module_path), None
+        return find_python_unittests(module_path, cache), None
 
     def resolve(self, reference):
         return python_resolver(
-            PythonUnittestResolver.name, reference, PythonUnittestResolver._find_compat
+            PythonUnittestResolver.name,
+            reference,
+            PythonUnittestResolver._find_compat,
+            self.config.get("resolver.discovery_cache"),
         )
 
 
@@ -127,7 +152,10 @@ class AvocadoInstrumentedResolver(Resolver):
 
     def resolve(self, reference):
         return python_resolver(
-            AvocadoInstrumentedResolver.name, reference, find_avocado_tests
+            AvocadoInstrumentedResolver.name,
+            reference,
+            find_avocado_tests,
+            self.config.get("resolver.discovery_cache"),
         )
 
 
@@ -27,13 +27,14 @@ from avocado.core.dispatcher import SpawnerDispatcher
 from avocado.core.exceptions import JobError, JobFailFast
 from avocado.core.messages import MessageHandler
 from avocado.core.nrunner.runner import check_runnables_runner_requirements
+from avocado.core.nrunner.task import STATUS_PROTOCOLS
 from avocado.core.output import LOG_JOB
 from avocado.core.plugin_interfaces import CLI, Init, SuiteRunner
 from avocado.core.settings import settings
 from avocado.core.status.repo import StatusRepo
 from avocado.core.status.server import StatusServer
 from avocado.core.task.runtime import RuntimeTaskGraph
-from avocado.core.task.statemachine import TaskStateMachine, Worker
+from avocado.core.task.statemachine import SCHEDULERS
 
 DEFAULT_SERVER_URI = "127.0.0.1:8888"
 
@@ -113,6 +114,36 @@ class RunnerInit(Init):
             help_msg=help_msg,
         )
 
+        help_msg = (
+            "Keep in memory only the status, result and timing of the "
+            "messages received from the tasks, while the complete messages "
+            "(including their logs) are kept on disk, under the job's "
+            "directory. This reduces the memory used by jobs with many "
+            "tests or large outputs."
+        )
+        settings.register_option(
+            section=section,
+            key="status_repo_compact",
+            default=False,
+            key_type=bool,
+            help_msg=help_msg,
+        )
+
+        help_msg = (
+            "Protocol used by runners to send status messages to the "
+            "status server. 'json' sends one JSON encoded message per "
+            "line, while 'framed' sends length prefixed frames with "
+            "output data as raw bytes, and batches output messages. "
+            "Runners that don't support 'framed' will fallback to 'json'."
+        )
+        settings.register_option(
+            section=section,
+            key="status_server_protocol",
+            default="json",
+            choices=STATUS_PROTOCOLS,
+            help_msg=help_msg,
+        )
+
         help_msg = (
             "Number of maximum number tasks running in parallel. You "
             "can disable parallel execution by setting this to 1. "
@@ -134,6 +165,21 @@ class RunnerInit(Init):
             section=section, key="spawner", default="process", help_msg=help_msg
         )
 
+        help_msg = (
+            "Scheduler used to move tasks through their life cycle. "
+            "'polling' has workers periodically checking on the tasks, "
+            "while 'event' has workers waiting to be notified about "
+            "tasks that can be triaged or started, which reduces the "
+            "overhead on jobs with a large number of short lived tasks."
+        )
+        settings.register_option(
+            section=section,
+            key="scheduler",
+            default="polling",
+            choices=tuple(SCHEDULERS),
+            help_msg=help_msg,
+        )
+
         help_msg = "The amount of time a test has to complete in seconds."
         settings.register_option(
             section="task.timeout",
@@ -184,6 +230,20 @@ class RunnerCLI(CLI):
             metavar="HOST_PORT",
         )
 
+        settings.add_argparser_to_option(
+            namespace="run.status_repo_compact",
+            parser=parser,
+            long_arg="--status-repo-compact",
+            action="store_true",
+        )
+
+        settings.add_argparser_to_option(
+            namespace="run.status_server_protocol",
+            parser=parser,
+            long_arg="--status-server-protocol",
+            metavar="PROTOCOL",
+        )
+
         settings.add_argparser_to_option(
             namespace="run.max_parallel_tasks",
             parser=parser,
@@ -198,6 +258,13 @@ class RunnerCLI(CLI):
             metavar="SPAWNER",
         )
 
+        settings.add_argparser_to_option(
+            namespace="run.scheduler",
+            parser=parser,
+            long_arg="--scheduler",
+            metavar="SCHEDULER",
+        )
+
     def run(self, config):
         pass
 
@@ -241,23 +308,47 @@ class Runner(SuiteRunner):
         self._sync_status_server_urls(test_suite.config)
         listen = self._determine_status_server(test_suite, "run.status_server_listen")
         # pylint: disable=W0201
-        self.status_repo = StatusRepo(job.unique_id)
+        self.status_repo = StatusRepo(
+            job.unique_id,
+            compact=test_suite.config.get("run.status_repo_compact"),
+            store_dir=job.logdir,
+        )
         # pylint: disable=W0201
         self.status_server = StatusServer(listen, self.status_repo)
 
     async def _update_status(self, job):
-        message_handler = MessageHandler()
         while True:
-            try:
-                (_, task_id, _, index) = self.status_repo.status_journal_summary_pop()
-
-            except IndexError:
-                await asyncio.sleep(0.05)
-                continue
-
+            (_, task_id, _, index) = await self.status_repo.status_journal_summary_get()
             message = self.status_repo.get_task_data(task_id, index)
             task = self.tsm.tasks_by_id.get(task_id)
-            message_handler.process_message(message, task, job)
+            self.message_handler.process_message(message, task, job)
+
+    def _close_message_handler(self):
+        """Closes the files left open by the message handler."""
+        self.message_handler.close()
+        file_pool = self.message_handler.file_pool
+        LOG_JOB.debug(
+            "Task files written with %d opens for %d writes (%.1f%% hit ratio, "
+            "%d evictions)",
+            file_pool.misses,
+            file_pool.hits + file_pool.misses,
+            file_pool.hit_ratio * 100,
+            file_pool.evictions,
+        )
+
+    async def _wait_status_updated(self):
+        """Waits until all status journal entries have been processed.
+
+        The status updater processes each entry right after picking it,
+        before waiting for the next one, so an empty journal means all
+        entries were processed.  If the status updater is gone, there's
+        no point in waiting.
+        """
+        empty = asyncio.ensure_future(self.status_repo.wait_status_journal_empty())
+        await asyncio.wait(
+            {empty, self.status_updater_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        empty.cancel()
 
     @staticmethod
     def _abort_if_missing_runners(runnables):
@@ -303,6 +394,9 @@ class Runner(SuiteRunner):
             job.unique_id,
             job.test_results_path,
             test_suite.config,
+            # other spawners keep the packages installed by each task on
+            # an environment (such as a container image) of its own
+            batch_packages=spawner_name == "process",
         )
         # pylint: disable=W0201
         self.runtime_tasks = graph.get_tasks_in_topological_order()
@@ -320,14 +414,17 @@ class Runner(SuiteRunner):
             for rt in self.runtime_tasks
             if rt.task.category == "test"
         ]
-        self.tsm = TaskStateMachine(self.runtime_tasks, self.status_repo)
+        state_machine_class, worker_class = SCHEDULERS[
+            test_suite.config.get("run.scheduler")
+        ]
+        self.tsm = state_machine_class(self.runtime_tasks, self.status_repo)
         max_running = min(
             test_suite.config.get("run.max_parallel_tasks"), len(self.runtime_tasks)
         )
         timeout = test_suite.config.get("task.timeout.running")
         failfast = test_suite.config.get("run.failfast")
         workers = [
-            Worker(
+            worker_class(
                 state_machine=self.tsm,
                 spawner=spawner,
                 max_running=max_running,
@@ -336,6 +433,8 @@ class Runner(SuiteRunner):
             ).run()
             for _ in range(max_running)
         ]
+        # pylint: disable=W0201
+        self.message_handler = MessageHandler()
         # Store task reference for proper cleanup
         self.status_updater_task = loop.create_task(self._update_status(job))
         loop = asyncio.get_event_loop()
@@ -347,7 +446,7 @@ class Runner(SuiteRunner):
                     )
                 )
             except asyncio.TimeoutError:
-                terminate_worker = Worker(
+                terminate_worker = worker_class(
                     state_machine=self.tsm,
                     spawner=spawner,
                     max_running=max_running,
@@ -359,7 +458,7 @@ class Runner(SuiteRunner):
                 )
                 raise
             except KeyboardInterrupt:
-                terminate_worker = Worker(
+                terminate_worker = worker_class(
                     state_machine=self.tsm,
                     spawner=spawner,
                     max_running=max_running,
@@ -377,13 +476,12 @@ class Runner(SuiteRunner):
             job.interrupted_reason = str(ex)
             summary.add("INTERRUPTED")
 
-        # Wait until all messages may have been processed by the
-        # status_updater. This should be replaced by a mechanism
-        # that only waits if there are missing status messages to
-        # be processed, and, only for a given amount of time.
-        # Tests with non received status will always show as SKIP
-        # because of result reconciliation.
-        loop.run_until_complete(asyncio.sleep(0.05))
+        # The finished messages of all tasks that were monitored until
+        # their end have already been received, so wait until all the
+        # status journal entries have been processed by the status updater.
+        loop.run_until_complete(self._wait_status_updated())
+        self._close_message_handler()
+        loop.run_until_complete(spawner.close())
 
         job.result.end_tests()
         # Wake the status server before waiting for its serve_forever task.
@@ -409,4 +507,11 @@ class Runner(SuiteRunner):
                 for status in self.status_repo.get_result_set_for_tasks(test_ids)
             ]
         )
+        LOG_JOB.debug(
+            "Status repository used approximately %d bytes of memory, and "
+            "%d bytes of disk",
+            self.status_repo.memory_footprint,
+            self.status_repo.store_size,
+        )
+        self.status_repo.close()
         return summary
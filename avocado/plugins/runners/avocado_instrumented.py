@@ -3,12 +3,11 @@ import os
 import signal
 import sys
 import tempfile
-import time
 import traceback
 
 from avocado.core.exceptions import TestInterrupt
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import RUNNER_RUN_CHECK_INTERVAL, BaseRunner
+from avocado.core.nrunner.runner import BaseRunner
 from avocado.core.test import TestID
 from avocado.core.tree import TreeNodeEnvOnly
 from avocado.core.utils import loader, messages
@@ -137,18 +136,10 @@ class AvocadoInstrumentedTestRunner(BaseRunner):
                 )
             )
 
-    @staticmethod
-    def _monitor(queue):
-        while True:
-            time.sleep(RUNNER_RUN_CHECK_INTERVAL)
-            if queue.empty():
-                yield messages.RunningMessage.get()
-            else:
-                message = queue.get()
-                if message.get("type") != "early_state":
-                    yield message
-                if message.get("status") == "finished":
-                    break
+    def _monitor(self, queue):
+        for message in self.queue_loop(queue):
+            if message.get("type") != "early_state":
+                yield message
 
     def run(self, runnable):
         # pylint: disable=W0201
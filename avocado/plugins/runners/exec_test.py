@@ -8,7 +8,50 @@ from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as pkg_version
 
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import BaseRunner
+from avocado.core.nrunner.runner import BaseRunner, process_waiter
+
+#: The maximum amount of output (in bytes) sent on a single message
+OUTPUT_CHUNK_SIZE = 2**16
+
+
+class OutputReader:
+    """
+    Reads the output written by a process to a file, while it's produced.
+    """
+
+    def __init__(self, path, message_type, log_only):
+        """
+        :param path: path of the file the process writes to
+        :type path: str
+        :param message_type: the type of the running messages, such as
+                             "stdout" or "stderr"
+        :type message_type: str
+        :param log_only: whether the output should be saved only to the
+                         test log, as it was already saved to its file
+        :type log_only: bool
+        """
+        self.message_type = message_type
+        self.log_only = log_only
+        #: Whether any output was read from the file
+        self.produced = False
+        self._file = open(path, "rb")  # pylint: disable=R1732
+
+    def read(self):
+        """Yields the output written since the last read, in chunks."""
+        while True:
+            data = self._file.read(OUTPUT_CHUNK_SIZE)
+            if not data:
+                return
+            self.produced = True
+            yield data
+
+    def rewind(self):
+        """Returns the file, positioned at its start."""
+        self._file.seek(0)
+        return self._file
+
+    def close(self):
+        self._file.close()
 
 
 class ExecTestRunner(BaseRunner):
@@ -42,6 +85,13 @@ class ExecTestRunner(BaseRunner):
     def _process_final_status(
         self, process, runnable, stdout=None, stderr=None
     ):  # pylint: disable=W0613
+        """Produces the finished message of the test.
+
+        :param stdout: the complete standard output of the process, as a
+                       binary file positioned at its start
+        :param stderr: the complete standard error of the process, as a
+                       binary file positioned at its start
+        """
         # Since Runners are standalone, and could be executed on a remote
         # machine in an "isolated" way, there is no way to assume a default
         # value, at this moment.
@@ -161,63 +211,80 @@ class ExecTestRunner(BaseRunner):
 
         return env
 
-    def _run_proc(self, runnable):
-        if runnable.output_dir is not None:
-            stdout = open(os.path.join(runnable.output_dir, "stdout"), "xb")
-            stderr = open(os.path.join(runnable.output_dir, "stderr"), "xb")
-        else:
-            stdout = subprocess.PIPE
-            stderr = subprocess.PIPE
-
-        return subprocess.Popen(
-            [runnable.uri] + list(runnable.args),
-            stdin=subprocess.DEVNULL,
-            stdout=stdout,
-            stderr=stderr,
-            env=self._get_env(runnable),
-        )
+    def _run_proc(self, runnable, output_dir):
+        stdout_path = os.path.join(output_dir, "stdout")
+        stderr_path = os.path.join(output_dir, "stderr")
+        with open(stdout_path, "xb") as stdout, open(stderr_path, "xb") as stderr:
+            return subprocess.Popen(
+                [runnable.uri] + list(runnable.args),
+                stdin=subprocess.DEVNULL,
+                stdout=stdout,
+                stderr=stderr,
+                env=self._get_env(runnable),
+            )
+
+    def _output_messages(self, readers, final=False):
+        for reader in readers:
+            for data in reader.read():
+                yield self._output_message(reader, data)
+            # always produce (even if empty) one message of each type
+            if final and not reader.produced:
+                yield self._output_message(reader, b"")
+
+    def _output_message(self, reader, data):
+        status = {"type": reader.message_type, "log": data}
+        if reader.log_only:
+            status["log_only"] = True
+        return self.prepare_status("running", status)
 
     def run(self, runnable):
         yield self.prepare_status("started")
 
+        # The output of the process is always written to files, which are
+        # read while the process runs, and sent in chunks.  If there's
+        # no output directory, temporary files are used instead, and the
+        # output is not only saved to the test log (log_only).
+        output_dir = runnable.output_dir
+        tmp_dir = None
+        if output_dir is None:
+            tmp_dir = tempfile.TemporaryDirectory(prefix=".avocado-exec-test-")
+            output_dir = tmp_dir.name
+
         try:
-            process = self._run_proc(runnable)
+            process = self._run_proc(runnable, output_dir)
         except Exception as e:
             yield self.prepare_status(
                 "finished", {"result": "error", "fail_reason": str(e)}
             )
             self._cleanup(runnable)
+            if tmp_dir is not None:
+                tmp_dir.cleanup()
             return
 
+        log_only = tmp_dir is None
+        readers = [
+            OutputReader(os.path.join(output_dir, "stdout"), "stdout", log_only),
+            OutputReader(os.path.join(output_dir, "stderr"), "stderr", log_only),
+        ]
+
         def poll_proc():
             return process.poll() is not None
 
-        yield from self.running_loop(poll_proc)
-
-        if process.stdout is not None:
-            stdout = process.stdout.read()
-            yield self.prepare_status("running", {"type": "stdout", "log": stdout})
-        else:
-            stdout_path = os.path.join(runnable.output_dir, "stdout")
-            with open(stdout_path, "rb") as stdout_file:
-                stdout = stdout_file.read()
-            yield self.prepare_status(
-                "running", {"type": "stdout", "log": stdout, "log_only": True}
-            )
+        def collect():
+            return self._output_messages(readers)
 
-        if process.stderr is not None:
-            stderr = process.stderr.read()
-            yield self.prepare_status("running", {"type": "stderr", "log": stderr})
-        else:
-            stderr_path = os.path.join(runnable.output_dir, "stderr")
-            with open(stderr_path, "rb") as stderr_file:
-                stderr = stderr_file.read()
-            yield self.prepare_status(
-                "running", {"type": "stderr", "log": stderr, "log_only": True}
-            )
-
-        yield self._process_final_status(process, runnable, stdout, stderr)
-        self._cleanup(runnable)
+        try:
+            with process_waiter(process.pid) as wait:
+                yield from self.running_loop(poll_proc, collect, wait)
+            yield from self._output_messages(readers, final=True)
+            stdout, stderr = (reader.rewind() for reader in readers)
+            yield self._process_final_status(process, runnable, stdout, stderr)
+        finally:
+            for reader in readers:
+                reader.close()
+            self._cleanup(runnable)
+            if tmp_dir is not None:
+                tmp_dir.cleanup()
 
 
 class RunnerApp(BaseRunnerApp):
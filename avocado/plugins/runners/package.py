@@ -24,7 +24,8 @@ class PackageRunner(BaseRunner):
      * args: not used
 
      * kwargs:
-        - name: the package name (required)
+        - name: the package name (required).  Many packages, separated by
+          spaces, are installed in a single transaction
         - action: one of 'install', 'check', or 'remove' (optional, defaults
           to 'install')
     """
@@ -44,8 +45,26 @@ class PackageRunner(BaseRunner):
             stderr = MESSAGES["check-installed"]["fail"] % package
         return result, stdout, stderr
 
+    @staticmethod
+    def _install_batch(software_manager, cmd, names):
+        installed = software_manager.check_installed_batch(names)
+        missing = [name for name in names if not installed[name]]
+        if not missing:
+            return "pass", MESSAGES["check-installed"]["success"] % " ".join(names), ""
+        missing_names = " ".join(missing)
+        # check if the error is a false negative because of package
+        # installation collision
+        if software_manager.install_batch(missing) or all(
+            software_manager.check_installed_batch(missing).values()
+        ):
+            return "pass", MESSAGES[cmd]["success"] % missing_names, ""
+        return "error", "", MESSAGES[cmd]["fail"] % missing_names
+
     @staticmethod
     def _install(software_manager, cmd, package):
+        names = package.split()
+        if len(names) > 1:
+            return PackageRunner._install_batch(software_manager, cmd, names)
         result = "pass"
         stderr = ""
         if not software_manager.check_installed(package):
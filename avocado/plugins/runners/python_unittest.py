@@ -2,16 +2,11 @@ import io
 import multiprocessing
 import os
 import sys
-import time
 import traceback
 from unittest import TestLoader, TextTestRunner
 
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import (
-    RUNNER_RUN_CHECK_INTERVAL,
-    RUNNER_RUN_STATUS_INTERVAL,
-    BaseRunner,
-)
+from avocado.core.nrunner.runner import BaseRunner
 from avocado.core.utils import messages
 
 
@@ -166,29 +161,7 @@ class PythonUnittestRunner(BaseRunner):
                 )
             process.start()
 
-            most_current_execution_state_time = None
-            next_execution_state_mark = None
-            while True:
-                if queue.empty():
-                    time.sleep(RUNNER_RUN_CHECK_INTERVAL)
-                    now = time.monotonic()
-                    if most_current_execution_state_time is not None:
-                        next_execution_state_mark = (
-                            most_current_execution_state_time
-                            + RUNNER_RUN_STATUS_INTERVAL
-                        )
-                    if (
-                        most_current_execution_state_time is None
-                        or now > next_execution_state_mark
-                    ):
-                        most_current_execution_state_time = now
-                        yield messages.RunningMessage.get()
-
-                else:
-                    message = queue.get()
-                    yield message
-                    if message.get("status") == "finished":
-                        break
+            yield from self.queue_loop(queue)
 
         except Exception as e:
             yield messages.StderrMessage.get(traceback.format_exc())
@@ -1,15 +1,10 @@
 import multiprocessing
 import os
 import sys
-import time
 import traceback
 
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import (
-    RUNNER_RUN_CHECK_INTERVAL,
-    RUNNER_RUN_STATUS_INTERVAL,
-    BaseRunner,
-)
+from avocado.core.nrunner.runner import BaseRunner
 from avocado.core.utils import messages
 from avocado.utils import sysinfo as sysinfo_collectible
 from avocado.utils.software_manager import manager
@@ -172,28 +167,7 @@ class SysinfoRunner(BaseRunner):
 
             sysinfo_process.start()
 
-            most_current_execution_state_time = None
-            next_execution_state_mark = None
-            while True:
-                time.sleep(RUNNER_RUN_CHECK_INTERVAL)
-                now = time.monotonic()
-                if queue.empty():
-                    if most_current_execution_state_time is not None:
-                        next_execution_state_mark = (
-                            most_current_execution_state_time
-                            + RUNNER_RUN_STATUS_INTERVAL
-                        )
-                    if (
-                        most_current_execution_state_time is None
-                        or now > next_execution_state_mark
-                    ):
-                        most_current_execution_state_time = now
-                        yield messages.RunningMessage.get()
-                else:
-                    message = queue.get()
-                    yield message
-                    if message.get("status") == "finished":
-                        break
+            yield from self.queue_loop(queue)
         except Exception:  # pylint: disable=W0703
             yield messages.StderrMessage.get(traceback.format_exc())
             yield messages.FinishedMessage.get("error")
@@ -37,7 +37,7 @@ class TAPRunner(ExecTestRunner):
 
     @staticmethod
     def _get_tap_result(stdout):
-        parser = TapParser(io.StringIO(stdout.decode()))
+        parser = TapParser(io.TextIOWrapper(stdout, encoding="utf-8"))
         result = ""
         fail_reason = None
         for event in parser.parse():
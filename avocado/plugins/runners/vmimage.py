@@ -1,17 +1,12 @@
 import multiprocessing
 import signal
 import sys
-import time
 import traceback
 from multiprocessing import set_start_method
 
 from avocado.core.exceptions import TestInterrupt
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import (
-    RUNNER_RUN_CHECK_INTERVAL,
-    RUNNER_RUN_STATUS_INTERVAL,
-    BaseRunner,
-)
+from avocado.core.nrunner.runner import BaseRunner
 from avocado.core.utils import messages
 from avocado.core.utils.messages import start_logging
 from avocado.plugins.vmimage import download_image
@@ -105,27 +100,6 @@ class VMImageRunner(BaseRunner):
                 )
             )
 
-    @staticmethod
-    def _monitor(queue):
-        most_recent_status_time = None
-        while True:
-            time.sleep(RUNNER_RUN_CHECK_INTERVAL)
-
-            if queue.empty():
-                now = time.monotonic()
-                if (
-                    most_recent_status_time is None
-                    or now >= most_recent_status_time + RUNNER_RUN_STATUS_INTERVAL
-                ):
-                    most_recent_status_time = now
-                    yield messages.RunningMessage.get()
-                continue
-
-            message = queue.get()
-            yield message
-            if message.get("status") == "finished":
-                break
-
     def run(self, runnable):
         signal.signal(signal.SIGTERM, VMImageRunner.signal_handler)
         yield messages.StartedMessage.get()
@@ -138,11 +112,11 @@ class VMImageRunner(BaseRunner):
         try:
             process.start()
 
-            yield from self._monitor(queue)
+            yield from self.queue_loop(queue)
 
         except TestInterrupt:
             process.terminate()
-            yield from self._monitor(queue)
+            yield from self.queue_loop(queue)
         except (multiprocessing.ProcessError, OSError) as e:
             # ProcessError: Issues with process management
             # OSError: System-level errors (e.g. resource limits)
@@ -7,7 +7,7 @@ import subprocess
 import time
 import uuid
 
-from avocado.core.dependencies.requirements import cache
+from avocado.core.dependencies.requirements.cache import AsyncRequirementCache
 from avocado.core.plugin_interfaces import CLI, DeploymentSpawner, Init
 from avocado.core.resolver import ReferenceResolutionAssetType
 from avocado.core.settings import settings
@@ -25,6 +25,181 @@ class PodmanSpawnerException(PodmanException):
     """Errors more closely related to the spawner functionality"""
 
 
+class ContainerStateTracker:
+    """Keeps track of the state of the containers used by the spawner.
+
+    Instead of asking podman about the state of each container
+    repeatedly, the state is updated from the events reported by a
+    single ``podman events`` process.  In case events are not available
+    (or some of them are missed), the state of all tracked containers is
+    also reconciled, with a single ``podman ps`` command, while there are
+    containers being waited on.
+    """
+
+    #: Container events that mean that its process is gone
+    EXITED_EVENTS = frozenset(("died", "exited", "stop", "cleanup", "remove"))
+    #: States (as reported by ``podman ps``) of containers yet to run
+    CREATED_STATES = frozenset(("created", "configured", "initialized"))
+    #: Seconds between reconciliations while the events are being received
+    RECONCILE_INTERVAL = 5.0
+    #: Seconds between reconciliations when events are not available
+    RECONCILE_INTERVAL_NO_EVENTS = 0.5
+
+    def __init__(self, podman):
+        self._podman = podman
+        self._states = {}
+        self._exited = {}
+        self._events_task = None
+        self._reconcile_task = None
+
+    @property
+    def events_running(self):
+        return self._events_task is not None and not self._events_task.done()
+
+    def start(self):
+        """Starts following the events of containers, if not doing so yet."""
+        if self._events_task is None:
+            # a little slack, so that events of containers created right
+            # before the events process is ready are not missed
+            since = str(int(time.time()) - 1)
+            self._events_task = asyncio.ensure_future(self._follow_events(since))
+
+    async def _follow_events(self, since):
+        try:
+            async for event in self._podman.events(["type=container"], since):
+                self.handle_event(event)
+        except PodmanException as ex:
+            LOG.warning("Could not follow podman events: %s", ex)
+        LOG.debug("Not following podman events anymore")
+
+    def handle_event(self, event):
+        container_id = event.get("ID")
+        if container_id not in self._states:
+            return
+        status = event.get("Status")
+        if status == "start":
+            self.set_running(container_id)
+        elif status in self.EXITED_EVENTS:
+            self.set_exited(container_id)
+
+    def add(self, container_id):
+        """Starts tracking a (just created) container."""
+        self._states[container_id] = "created"
+        self._exited[container_id] = asyncio.get_event_loop().create_future()
+
+    def set_running(self, container_id):
+        if self._states.get(container_id) == "created":
+            self._states[container_id] = "running"
+
+    def set_exited(self, container_id):
+        if container_id not in self._states:
+            return
+        self._states[container_id] = "exited"
+        exited = self._exited[container_id]
+        if not exited.done():
+            exited.set_result(None)
+
+    def is_running(self, container_id):
+        return self._states.get(container_id) == "running"
+
+    def update_from_ps(self, containers):
+        """Updates the state of the tracked containers from ``podman ps``.
+
+        :param containers: the containers, as reported by
+                           ``podman ps --all --format=json``
+        :type containers: list of dict
+        """
+        seen = set()
+        for container in containers:
+            container_id = container.get("Id", container.get("ID"))
+            if container_id not in self._states:
+                continue
+            seen.add(container_id)
+            state = str(container.get("State", "")).lower()
+            if state == "running" or state.startswith("up"):
+                self.set_running(container_id)
+            elif state not in self.CREATED_STATES:
+                self.set_exited(container_id)
+        for container_id in self._waited() - seen:
+            # not listed anymore, so it's been removed
+            self.set_exited(container_id)
+
+    def _waited(self):
+        return {
+            container_id
+            for container_id, exited in self._exited.items()
+            if not exited.done()
+        }
+
+    async def _reconcile(self):
+        while True:
+            waited = self._waited()
+            if not waited:
+                return
+            if self.events_running:
+                await asyncio.sleep(self.RECONCILE_INTERVAL)
+            else:
+                await asyncio.sleep(self.RECONCILE_INTERVAL_NO_EVENTS)
+            waited = self._waited()
+            if not waited:
+                return
+            filters = [f"--filter=id={container_id}" for container_id in waited]
+            try:
+                _, stdout, _ = await self._podman.execute(
+                    "ps", "--all", "--format=json", *filters
+                )
+                self.update_from_ps(json.loads(stdout or b"[]"))
+            except (PodmanException, json.JSONDecodeError) as ex:
+                LOG.warning("Could not get the state of containers: %s", ex)
+
+    async def wait(self, container_id):
+        """Waits until the process of a tracked container is gone."""
+        exited = self._exited.get(container_id)
+        if exited is None:
+            return
+        if self._reconcile_task is None or self._reconcile_task.done():
+            self._reconcile_task = asyncio.ensure_future(self._reconcile())
+        await asyncio.shield(exited)
+
+    async def close(self):
+        for task in (self._events_task, self._reconcile_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._events_task = None
+        self._reconcile_task = None
+
+
+class PooledContainer:
+    """A container, kept running, on which tasks are run one at a time."""
+
+    def __init__(self, container_id, key):
+        self.container_id = container_id
+        self.key = key
+        self.tasks_run = 0
+        #: test and data files already copied to the container
+        self.files = set()
+
+    def __str__(self):
+        return self.container_id
+
+
+class PooledTaskHandle:
+    """Handle of a task run (with ``podman exec``) on a pooled container."""
+
+    def __init__(self, container, process):
+        self.container = container
+        self.process = process
+        self.terminated = False
+        self.wait_task = None
+
+    def __str__(self):
+        return self.container.container_id
+
+
 class PodmanSpawnerInit(Init):
 
     description = "Podman (container) based spawner initialization"
@@ -77,6 +252,42 @@ class PodmanSpawnerInit(Init):
             default="avocado_generated",
         )
 
+        help_msg = (
+            "Whether to run tests on a pool of containers, each one created "
+            "and deployed with Avocado once, and reused for many tests "
+            "(with podman exec). Tasks that fulfill requirements still "
+            "run on containers of their own."
+        )
+        settings.register_option(
+            section=section,
+            key="pool",
+            help_msg=help_msg,
+            key_type=bool,
+            default=False,
+        )
+
+        help_msg = "Maximum number of idle containers kept on the pool, per image"
+        settings.register_option(
+            section=section,
+            key="pool_size",
+            help_msg=help_msg,
+            key_type=int,
+            default=8,
+        )
+
+        help_msg = (
+            "Number of tests a pooled container runs before it's discarded "
+            "(and replaced by a fresh one). Containers on which a test was "
+            "interrupted, or the runner failed, are always discarded."
+        )
+        settings.register_option(
+            section=section,
+            key="pool_max_tasks",
+            help_msg=help_msg,
+            key_type=int,
+            default=100,
+        )
+
 
 class PodmanCLI(CLI):
 
@@ -110,6 +321,13 @@ class PodmanCLI(CLI):
             namespace=namespace, parser=parser, long_arg=long_arg, metavar="AVOCADO_EGG"
         )
 
+        settings.add_argparser_to_option(
+            namespace="spawner.podman.pool",
+            parser=parser,
+            long_arg="--spawner-podman-pool",
+            action="store_true",
+        )
+
     def run(self, config):
         pass
 
@@ -126,12 +344,17 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
     ]
 
     _PYTHON_VERSIONS_CACHE = {}
+    POOL_STATUS_SERVER_SOCKET = "/tmp/.status_server.sock"
 
     def __init__(self, config=None, job=None):  # pylint: disable=W0231
         SpawnerMixin.__init__(self, config, job)
         self.environment = f"podman:{self.config.get('spawner.podman.image')}"
         self._podman_version = (None, None, None)
         self._podman = None
+        self._container_states = None
+        self._pool_idle = {}
+        self._pool_containers = set()
+        self._requirement_cache = AsyncRequirementCache()
 
     def _get_podman_version(self):
         podman_bin = self.config.get("spawner.podman.bin")
@@ -186,39 +409,19 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
                 LOG.error(ex)
         return self._podman
 
-    def _get_podman_state(self, runtime_task):
-        if runtime_task.spawner_handle is None:
-            return False
-        podman_bin = self.config.get("spawner.podman.bin")
-        cmd = [
-            podman_bin,
-            "ps",
-            "--all",
-            "--format={{.State}}",
-            f"--filter=id={runtime_task.spawner_handle}",
-        ]
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-        )
-        out, _ = process.communicate()
-        return out
+    @property
+    def container_states(self):
+        if self._container_states is None:
+            self._container_states = ContainerStateTracker(self.podman)
+        return self._container_states
 
     def is_task_alive(self, runtime_task):  # pylint: disable=W0221
-        out = self._get_podman_state(runtime_task)
-        if self.podman_version[0] < 4:
-            return out.startswith(b"Up ")
-
-        if out == b"running\n":
-            return True
-        if out == b"created\n":
-            # give the container a chance to transition to running
-            time.sleep(0.1)
-            out = self._get_podman_state(runtime_task)
-            return out == b"running\n"
-        return False
+        handle = runtime_task.spawner_handle
+        if handle is None:
+            return False
+        if isinstance(handle, PooledTaskHandle):
+            return not handle.wait_task.done()
+        return self.container_states.is_running(handle)
 
     def _fetch_asset(self, url):
         cachedirs = self.config.get("datadir.paths.cache_dirs")
@@ -274,6 +477,18 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
         for egg, to in eggs:
             await self.podman.copy_to_container(where, egg, to)
 
+    async def _get_runner_command(self, runtime_task):
+        _, _, python_binary = await self.python_version
+        full_module_name = (
+            runtime_task.task.runnable.pick_runner_module_from_entry_point_kind(
+                runtime_task.task.runnable.kind
+            )
+        )
+        if full_module_name is None:
+            msg = f"Could not determine Python module name for runnable with kind {runtime_task.task.runnable.kind}"
+            raise PodmanSpawnerException(msg)
+        return [python_binary, "-m", full_module_name, "task-run"]
+
     async def _create_container_for_task(
         self, runtime_task, env_args, test_output=None
     ):
@@ -285,17 +500,7 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
             mount_status_server_socket = True
             runtime_task.task.status_services[0].uri = mounted_status_server_socket
 
-        _, _, python_binary = await self.python_version
-        full_module_name = (
-            runtime_task.task.runnable.pick_runner_module_from_entry_point_kind(
-                runtime_task.task.runnable.kind
-            )
-        )
-        if full_module_name is None:
-            msg = f"Could not determine Python module name for runnable with kind {runtime_task.task.runnable.kind}"
-            raise PodmanSpawnerException(msg)
-
-        entry_point_args = [python_binary, "-m", full_module_name, "task-run"]
+        entry_point_args = await self._get_runner_command(runtime_task)
 
         test_opts = []
         if runtime_task.task.category == "test" and runtime_task.task.runnable.assets:
@@ -337,7 +542,7 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
                 f"{test_output}:{runtime_task.task.runnable.output_dir}",
             )
 
-        image, _ = self._get_image_from_cache(runtime_task)
+        image, _ = await self._get_image_from_cache(runtime_task)
         if not image:
             image = self.config.get("spawner.podman.image")
 
@@ -354,7 +559,150 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
         )
         return stdout.decode().strip()
 
+    def _is_pooled(self, runtime_task):
+        return (
+            self.config.get("spawner.podman.pool")
+            and runtime_task.task.category == "test"
+        )
+
+    async def _create_pooled_container(self, key, env_args):
+        image, output_base_dir, status_server_uri = key
+        _, _, python_binary = await self.python_version
+        entry_point = json.dumps(
+            [python_binary, "-c", "import time\nwhile True: time.sleep(3600)"]
+        )
+        if ":" not in status_server_uri:
+            status_server_opts = (
+                "--privileged",
+                "-v",
+                f"{status_server_uri}:{self.POOL_STATUS_SERVER_SOCKET}",
+            )
+        else:
+            status_server_opts = ("--net=host",)
+        envs = [f"-e={k}={v}" for k, v in env_args.items()]
+        _, stdout, _ = await self.podman.execute(
+            "create",
+            *status_server_opts,
+            "-v",
+            f"{output_base_dir}:{output_base_dir}",
+            "--entrypoint=" + entry_point,
+            *envs,
+            image,
+        )
+        container = PooledContainer(stdout.decode().strip(), key)
+        self._pool_containers.add(container)
+        await self.deploy_avocado(container.container_id)
+        await self.podman.start(container.container_id)
+        return container
+
+    async def _get_pooled_container(self, key, env_args):
+        idle = self._pool_idle.get(key)
+        if idle:
+            return idle.pop()
+        return await self._create_pooled_container(key, env_args)
+
+    async def _release_pooled_container(self, container, reusable):
+        idle = self._pool_idle.setdefault(container.key, [])
+        if (
+            reusable
+            and container.tasks_run < self.config.get("spawner.podman.pool_max_tasks")
+            and len(idle) < self.config.get("spawner.podman.pool_size")
+        ):
+            idle.append(container)
+            return
+        await self._remove_pooled_containers([container])
+
+    async def _remove_pooled_containers(self, containers):
+        if not containers:
+            return
+        for container in containers:
+            self._pool_containers.discard(container)
+        try:
+            await self.podman.execute(
+                "rm", "--force", *[str(container) for container in containers]
+            )
+        except PodmanException as ex:
+            LOG.warning("Could not remove pooled containers: %s", ex)
+
+    async def _copy_task_files(self, container, runtime_task):
+        runnable = runtime_task.task.runnable
+        files = []
+        for asset_type, asset in runnable.assets or []:
+            if asset_type in (
+                ReferenceResolutionAssetType.TEST_FILE,
+                ReferenceResolutionAssetType.DATA_FILE,
+            ):
+                if os.path.exists(asset):
+                    files.append(asset)
+            if asset_type == ReferenceResolutionAssetType.TEST_FILE:
+                # The URI may contain a test specification within the file,
+                # which is separated by a colon
+                if runnable.uri.split(":")[0] == asset:
+                    runnable.uri = os.path.join("/tmp", runnable.uri)
+        files = [path for path in files if path not in container.files]
+        if not files:
+            return
+        destinations = {path: os.path.join("/tmp", path) for path in files}
+        await self.podman.execute(
+            "exec",
+            container.container_id,
+            "mkdir",
+            "-p",
+            *{os.path.dirname(to) for to in destinations.values()},
+        )
+        for path, to in destinations.items():
+            await self.podman.copy_to_container(container.container_id, path, to)
+            container.files.add(path)
+
+    async def _wait_pooled_task(self, handle):
+        returncode = await handle.process.wait()
+        await self._release_pooled_container(
+            handle.container, returncode == 0 and not handle.terminated
+        )
+        return returncode
+
+    async def _spawn_task_pooled(self, runtime_task, env_args):
+        task = runtime_task.task
+        output_dir = self.task_output_dir(runtime_task)
+        os.makedirs(output_dir, exist_ok=True)
+        image, _ = await self._get_image_from_cache(runtime_task)
+        status_server_uri = task.status_services[0].uri
+        key = (
+            image or self.config.get("spawner.podman.image"),
+            os.path.dirname(os.path.abspath(output_dir)),
+            status_server_uri,
+        )
+        if ":" not in status_server_uri:
+            task.status_services[0].uri = self.POOL_STATUS_SERVER_SOCKET
+        try:
+            command = await self._get_runner_command(runtime_task)
+            container = await self._get_pooled_container(key, env_args)
+        except PodmanException as ex:
+            LOG.error("Could not get a pooled podman container: %s", ex)
+            return False
+        try:
+            await self._copy_task_files(container, runtime_task)
+            command.extend(task.get_command_args())
+            process = await self.podman.spawn_exec(container.container_id, command)
+        except PodmanException as ex:
+            LOG.error("Could not run task on pooled container: %s", ex)
+            await self._release_pooled_container(container, False)
+            return False
+        container.tasks_run += 1
+        handle = PooledTaskHandle(container, process)
+        handle.wait_task = asyncio.ensure_future(self._wait_pooled_task(handle))
+        runtime_task.spawner_handle = handle
+        return True
+
     async def spawn_task(self, runtime_task):
+        if self._is_pooled(runtime_task):
+            major, minor, _ = await self.python_version
+            eggs = self.get_eggs_paths(major, minor)
+            destination_eggs = ":".join(map(lambda egg: str(egg[1]), eggs))
+            return await self._spawn_task_pooled(
+                runtime_task, {"PYTHONPATH": destination_eggs}
+            )
+
         self.create_task_output_dir(runtime_task)
 
         major, minor, _ = await self.python_version
@@ -363,6 +711,7 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
         destination_eggs = ":".join(map(lambda egg: str(egg[1]), eggs))
         env_args = {"PYTHONPATH": destination_eggs}
         output_dir_path = self.task_output_dir(runtime_task)
+        self.container_states.start()
         try:
             container_id = await self._create_container_for_task(
                 runtime_task, env_args, output_dir_path
@@ -372,6 +721,7 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
             return False
 
         runtime_task.spawner_handle = container_id
+        self.container_states.add(container_id)
 
         await self.deploy_avocado(container_id)
 
@@ -380,8 +730,10 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
             returncode, _, _ = await self.podman.start(container_id)
         except PodmanException as ex:
             LOG.error("Could not start container: %s", ex)
+            self.container_states.set_exited(container_id)
             return False
 
+        self.container_states.set_running(container_id)
         return returncode == 0
 
     def create_task_output_dir(self, runtime_task):
@@ -392,12 +744,33 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
         runtime_task.task.setup_output_dir(output_podman_path)
 
     async def wait_task(self, runtime_task):
-        while True:
-            if not self.is_task_alive(runtime_task):
-                return
-            await asyncio.sleep(0.1)
+        handle = runtime_task.spawner_handle
+        if handle is None:
+            return
+        if isinstance(handle, PooledTaskHandle):
+            await asyncio.shield(handle.wait_task)
+            return
+        await self.container_states.wait(handle)
+
+    async def _terminate_pooled_task(self, handle):
+        # the container (and with it, the task) is discarded, as there's
+        # no telling in what state an interrupted task leaves it
+        handle.terminated = True
+        if handle.process.returncode is None:
+            handle.process.terminate()
+        await self._remove_pooled_containers([handle.container])
+        await asyncio.shield(handle.wait_task)
+        return True
+
+    async def close(self):
+        if self._container_states is not None:
+            await self._container_states.close()
+        self._pool_idle = {}
+        await self._remove_pooled_containers(list(self._pool_containers))
 
     async def terminate_task(self, runtime_task):
+        if isinstance(runtime_task.spawner_handle, PooledTaskHandle):
+            return await self._terminate_pooled_task(runtime_task.spawner_handle)
         try:
             await self.podman.execute(
                 "kill", "--signal=TERM", runtime_task.spawner_handle
@@ -448,13 +821,17 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
     async def update_requirement_cache(
         self, runtime_task, result
     ):  # pylint: disable=W0221
-        environment_id, _ = self._get_image_from_cache(runtime_task, True)
+        environment_id, _ = await self._get_image_from_cache(runtime_task, True)
         if result in STATUSES_NOT_OK:
-            cache.delete_environment(self.environment, environment_id)
+            await self._requirement_cache.delete_environment(
+                self.environment, environment_id
+            )
             return
         image_id = await self._create_and_tag_image(runtime_task)
-        cache.update_environment(self.environment, environment_id, image_id)
-        cache.update_requirement_status(
+        await self._requirement_cache.update_environment(
+            self.environment, environment_id, image_id
+        )
+        await self._requirement_cache.update_requirement_status(
             self.environment,
             image_id,
             runtime_task.task.runnable.kind,
@@ -464,13 +841,12 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
 
     async def save_requirement_in_cache(self, runtime_task):  # pylint: disable=W0221
         image_id = str(uuid.uuid4())
-        _, requirements = self._get_image_from_cache(runtime_task)
+        _, requirements = await self._get_image_from_cache(runtime_task)
         if requirements:
-            for requirement_type, requirement in requirements:
-                cache.set_requirement(
-                    self.environment, image_id, requirement_type, requirement
-                )
-        cache.set_requirement(
+            await self._requirement_cache.set_requirements(
+                self.environment, image_id, requirements
+            )
+        await self._requirement_cache.set_requirement(
             self.environment,
             image_id,
             runtime_task.task.runnable.kind,
@@ -479,14 +855,14 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
         )
 
     async def is_requirement_in_cache(self, runtime_task):  # pylint: disable=W0221
-        environment, _ = self._get_image_from_cache(runtime_task, use_task=True)
+        environment, _ = await self._get_image_from_cache(runtime_task, use_task=True)
         if not environment:
             return False
-        if cache.is_environment_prepared(environment):
+        if await self._requirement_cache.is_environment_prepared(environment):
             return True
         return None
 
-    def _get_image_from_cache(self, runtime_task, use_task=False):
+    async def _get_image_from_cache(self, runtime_task, use_task=False):
         def _get_all_finished_requirements(requirement_tasks):
             all_finished_requirements = []
             for requirement in requirement_tasks:
@@ -514,8 +890,10 @@ class PodmanSpawner(DeploymentSpawner, SpawnerMixin):
             return None, None
 
         runtime_task_kind, runtime_task_name = finished_requirements[0]
-        cache_entries = cache.get_all_environments_with_requirement(
-            self.environment, runtime_task_kind, runtime_task_name
+        cache_entries = (
+            await self._requirement_cache.get_all_environments_with_requirement(
+                self.environment, runtime_task_kind, runtime_task_name
+            )
         )
         if not cache_entries:
             return None, None
@@ -1,9 +1,14 @@
 import asyncio
+import json
 import os
+import signal
 import socket
+import sys
+from collections import defaultdict
 
-from avocado.core.dependencies.requirements import cache
-from avocado.core.plugin_interfaces import Spawner
+from avocado.core.dependencies.requirements.cache import AsyncRequirementCache
+from avocado.core.plugin_interfaces import Init, Spawner
+from avocado.core.settings import settings
 from avocado.core.spawners.common import SpawnCapabilities, SpawnerMixin, SpawnMethod
 from avocado.core.teststatus import STATUSES_NOT_OK
 from avocado.core.utils.eggenv import get_python_path_env_if_egg
@@ -12,6 +17,42 @@ ENVIRONMENT_TYPE = "local"
 ENVIRONMENT = socket.gethostname()
 
 
+class ProcessSpawnerInit(Init):
+
+    description = "Process based spawner initialization"
+
+    def initialize(self):
+        section = "spawner.process"
+
+        help_msg = (
+            "Run tasks on processes forked from warm runners, that is, "
+            "runner processes that are started once and reused, instead "
+            "of starting a new runner process for each task. Tasks are "
+            "still isolated from each other, as each one runs on its own "
+            "(forked) process. Only applies to tasks whose runners are "
+            "available as Python classes."
+        )
+        settings.register_option(
+            section=section,
+            key="warm",
+            default=False,
+            key_type=bool,
+            help_msg=help_msg,
+        )
+
+        help_msg = (
+            "Number of tasks after which a warm runner is replaced by a "
+            "newly started one"
+        )
+        settings.register_option(
+            section=section,
+            key="warm_max_tasks",
+            default=100,
+            key_type=int,
+            help_msg=help_msg,
+        )
+
+
 class ProcessSpawnerHandle:
     def __init__(self, process):
         self.process = process
@@ -27,6 +68,118 @@ class ProcessSpawnerHandle:
         self.create_wait_task()
         return self._wait_task
 
+    def terminate(self):
+        self.process.terminate()
+
+    def kill(self):
+        self.process.kill()
+
+    async def wait(self):
+        return await self.process.wait()
+
+
+class WarmRunner:
+    """
+    A warm runner process, which runs tasks on processes forked from it.
+
+    See :mod:`avocado.core.nrunner.warm` for its implementation.
+    """
+
+    def __init__(self, process):
+        self.process = process
+        #: Number of tasks run so far
+        self.tasks_run = 0
+
+    @classmethod
+    async def start(cls, kind):
+        """Starts a warm runner for tasks of the given kind.
+
+        :returns: the warm runner, or None if it failed to start
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "avocado.core.nrunner.warm",
+                kind,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=get_python_path_env_if_egg(),
+            )
+        except (FileNotFoundError, PermissionError):
+            return None
+        warm_runner = cls(process)
+        if await process.stdout.readline() != b"ready\n":
+            await warm_runner.close()
+            return None
+        return warm_runner
+
+    @property
+    def alive(self):
+        return self.process.returncode is None
+
+    async def run(self, args):
+        """Starts a task on a process forked from this warm runner.
+
+        :param args: the arguments for the "task-run" command
+        :type args: list
+        :returns: the PID of the task process, or None on failure
+        """
+        try:
+            self.process.stdin.write(json.dumps(args).encode() + b"\n")
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            return None
+        line = (await self.process.stdout.readline()).split()
+        if len(line) != 2 or line[0] != b"started":
+            return None
+        return int(line[1])
+
+    async def wait(self):
+        """Waits for the task started last to finish.
+
+        :returns: the return code of the task process, or None if the
+                  warm runner ended before reporting it
+        """
+        line = (await self.process.stdout.readline()).split()
+        if len(line) != 3 or line[0] != b"finished":
+            return None
+        self.tasks_run += 1
+        return int(line[2])
+
+    async def close(self):
+        if self.alive:
+            self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), 5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+
+
+class WarmTaskHandle:
+    """Handle for a task running on a process forked from a warm runner."""
+
+    def __init__(self, pid, wait_task):
+        self.pid = pid
+        self.wait_task = wait_task
+
+    def _signal(self, signum):
+        # the PID may have been reused after the task process finished
+        if self.wait_task.done():
+            raise ProcessLookupError(self.pid)
+        os.kill(self.pid, signum)
+
+    def terminate(self):
+        self._signal(signal.SIGTERM)
+
+    def kill(self):
+        self._signal(signal.SIGKILL)
+
+    async def wait(self):
+        return await asyncio.shield(self.wait_task)
+
 
 class ProcessSpawner(Spawner, SpawnerMixin):
 
@@ -38,6 +191,16 @@ class ProcessSpawner(Spawner, SpawnerMixin):
         SpawnCapabilities.FILESYSTEM_SHARING,
     ]
 
+    def __init__(self, config=None, job=None):  # pylint: disable=W0231
+        SpawnerMixin.__init__(self, config, job)
+        #: Warm runners waiting for tasks, by the kind of the tasks
+        self._warm_idle = defaultdict(list)
+        #: All warm runners that have been started, and not yet closed
+        self._warm_runners = set()
+        #: The start of an additional warm runner, by the kind of the tasks
+        self._warm_starting = {}
+        self._requirement_cache = AsyncRequirementCache()
+
     def is_operational(self):
         return True
 
@@ -49,9 +212,75 @@ class ProcessSpawner(Spawner, SpawnerMixin):
             return False
         return True
 
+    async def _start_warm_runner(self, kind):
+        warm_runner = await WarmRunner.start(kind)
+        if warm_runner is not None:
+            self._warm_runners.add(warm_runner)
+        return warm_runner
+
+    async def _start_spare_warm_runner(self, kind):
+        try:
+            warm_runner = await self._start_warm_runner(kind)
+            if warm_runner is not None:
+                self._warm_idle[kind].append(warm_runner)
+        finally:
+            del self._warm_starting[kind]
+
+    async def _get_warm_runner(self, kind):
+        """Returns a warm runner for the kind, starting one if needed.
+
+        To have a warm runner ready for the next task, another one is
+        started in the background, if none is waiting for tasks.
+        """
+        warm_runner = None
+        while self._warm_idle[kind] and warm_runner is None:
+            warm_runner = self._warm_idle[kind].pop()
+            if not warm_runner.alive:
+                self._warm_runners.discard(warm_runner)
+                warm_runner = None
+        if warm_runner is None:
+            if kind in self._warm_starting:
+                await asyncio.shield(self._warm_starting[kind])
+                return await self._get_warm_runner(kind)
+            warm_runner = await self._start_warm_runner(kind)
+        if not self._warm_idle[kind] and kind not in self._warm_starting:
+            self._warm_starting[kind] = asyncio.ensure_future(
+                self._start_spare_warm_runner(kind)
+            )
+        return warm_runner
+
+    async def _release_warm_runner(self, kind, warm_runner):
+        returncode = await warm_runner.wait()
+        max_tasks = self.config.get("spawner.process.warm_max_tasks")
+        if returncode is None or warm_runner.tasks_run >= max_tasks:
+            self._warm_runners.discard(warm_runner)
+            await warm_runner.close()
+        else:
+            self._warm_idle[kind].append(warm_runner)
+        return returncode
+
+    async def _spawn_task_warm(self, runtime_task):
+        kind = runtime_task.task.runnable.kind
+        warm_runner = await self._get_warm_runner(kind)
+        if warm_runner is None:
+            return False
+        pid = await warm_runner.run(runtime_task.task.get_command_args())
+        if pid is None:
+            self._warm_runners.discard(warm_runner)
+            await warm_runner.close()
+            return False
+        wait_task = asyncio.ensure_future(self._release_warm_runner(kind, warm_runner))
+        runtime_task.spawner_handle = WarmTaskHandle(pid, wait_task)
+        return True
+
     async def spawn_task(self, runtime_task):
         self.create_task_output_dir(runtime_task)
         task = runtime_task.task
+        if (
+            self.config.get("spawner.process.warm")
+            and task.runnable.pick_runner_class() is not None
+        ):
+            return await self._spawn_task_warm(runtime_task)
         runner = task.runnable.runner_command()
         args = runner[1:] + ["task-run"] + task.get_command_args()
         runner = runner[0]
@@ -79,11 +308,14 @@ class ProcessSpawner(Spawner, SpawnerMixin):
 
     @staticmethod
     async def wait_task(runtime_task):  # pylint: disable=W0221
-        await runtime_task.spawner_handle.wait_task
+        # the task may still be running if the wait is cancelled (such as
+        # on a timeout), so its wait task must not be cancelled with it
+        await asyncio.shield(runtime_task.spawner_handle.wait_task)
 
     async def terminate_task(self, runtime_task):
+        handle = runtime_task.spawner_handle
         try:
-            runtime_task.spawner_handle.process.terminate()
+            handle.terminate()
         except ProcessLookupError:
             return True
         soft_interval = self.config.get(
@@ -91,25 +323,29 @@ class ProcessSpawner(Spawner, SpawnerMixin):
         )
         returncode = None
         try:
-            returncode = await asyncio.wait_for(
-                runtime_task.spawner_handle.process.wait(), soft_interval
-            )
+            returncode = await asyncio.wait_for(handle.wait(), soft_interval)
         except asyncio.TimeoutError:
             try:
-                runtime_task.spawner_handle.process.kill()
+                handle.kill()
             except ProcessLookupError:
                 return True
             hard_interval = self.config.get(
                 "runner.task.interval.from_hard_termination_to_verification"
             )
             try:
-                returncode = await asyncio.wait_for(
-                    runtime_task.spawner_handle.process.wait(), hard_interval
-                )
+                returncode = await asyncio.wait_for(handle.wait(), hard_interval)
             except asyncio.TimeoutError:
                 pass
         return returncode is not None
 
+    async def close(self):
+        for starting in list(self._warm_starting.values()):
+            await asyncio.shield(starting)
+        for warm_runner in list(self._warm_runners):
+            await warm_runner.close()
+        self._warm_runners.clear()
+        self._warm_idle.clear()
+
     @staticmethod
     async def check_task_requirements(runtime_task):
         """Check the runtime task requirements needed to be able to run"""
@@ -118,24 +354,33 @@ class ProcessSpawner(Spawner, SpawnerMixin):
             return False
         return True
 
-    @staticmethod
-    async def update_requirement_cache(runtime_task, result):
+    async def update_requirement_cache(
+        self, runtime_task, result
+    ):  # pylint: disable=W0221
         kind = runtime_task.task.runnable.kind
         name = runtime_task.task.runnable.kwargs.get("name")
-        cache.set_requirement(ENVIRONMENT_TYPE, ENVIRONMENT, kind, name)
+        await self._requirement_cache.set_requirement(
+            ENVIRONMENT_TYPE, ENVIRONMENT, kind, name
+        )
         if result in STATUSES_NOT_OK:
-            cache.delete_requirement(ENVIRONMENT_TYPE, ENVIRONMENT, kind, name)
+            await self._requirement_cache.delete_requirement(
+                ENVIRONMENT_TYPE, ENVIRONMENT, kind, name
+            )
             return
-        cache.update_requirement_status(ENVIRONMENT_TYPE, ENVIRONMENT, kind, name, True)
+        await self._requirement_cache.update_requirement_status(
+            ENVIRONMENT_TYPE, ENVIRONMENT, kind, name, True
+        )
 
-    @staticmethod
-    async def is_requirement_in_cache(runtime_task):
+    async def is_requirement_in_cache(self, runtime_task):  # pylint: disable=W0221
         kind = runtime_task.task.runnable.kind
         name = runtime_task.task.runnable.kwargs.get("name")
-        return cache.is_requirement_in_cache(ENVIRONMENT_TYPE, ENVIRONMENT, kind, name)
+        return await self._requirement_cache.is_requirement_in_cache(
+            ENVIRONMENT_TYPE, ENVIRONMENT, kind, name
+        )
 
-    @staticmethod
-    async def save_requirement_in_cache(runtime_task):
+    async def save_requirement_in_cache(self, runtime_task):  # pylint: disable=W0221
         kind = runtime_task.task.runnable.kind
         name = runtime_task.task.runnable.kwargs.get("name")
-        cache.set_requirement(ENVIRONMENT_TYPE, ENVIRONMENT, kind, name, False)
+        await self._requirement_cache.set_requirement(
+            ENVIRONMENT_TYPE, ENVIRONMENT, kind, name, False
+        )
@@ -16,9 +16,10 @@
 """xUnit module."""
 
 import datetime
+import io
 import os
 import string
-from xml.dom.minidom import Document
+from xml.sax.saxutils import escape
 
 from avocado.core.output import LOG_UI
 from avocado.core.parser import FileOrStdoutAction
@@ -28,6 +29,11 @@ from avocado.core.test_id import TestID
 from avocado.utils import astring
 from avocado.utils.data_structures import DataSize
 
+INDENT = "\t"
+
+#: Number of characters of the test logs read (and written) at a time
+LOG_CHUNK_SIZE = 2**16
+
 
 class XUnitResult(Result):
 
@@ -57,30 +63,60 @@ class XUnitResult(Result):
     def _format_time(time):
         return f"{float(time):.3f}"
 
-    def _create_testcase_element(self, document, state):
-        testcase = document.createElement("testcase")
-        testcase.setAttribute("classname", self._get_attr(state, "class_name"))
+    def _quote_attr(self, attrib):
+        return '"' + escape(self._escape_attr(attrib), {'"': "&quot;"}) + '"'
+
+    def _write_testcase_start(self, xunit_file, state, empty):
         name = state.get("name")
         if isinstance(name, TestID):
-            testcase.setAttribute(
-                "name",
-                f"{self._escape_attr(name.name)}{self._escape_attr(name.str_variant)}",
+            name = (
+                f"{self._escape_attr(name.name)}{self._escape_attr(name.str_variant)}"
             )
         else:
-            testcase.setAttribute("name", self._get_attr(state, "name"))
-        testcase.setAttribute(
-            "time", self._format_time(self._get_attr(state, "time_elapsed"))
+            name = self._get_attr(state, "name")
+        attributes = (
+            ("classname", self._get_attr(state, "class_name")),
+            ("name", name),
+            ("time", self._format_time(self._get_attr(state, "time_elapsed"))),
+        )
+        self._write_element_start(xunit_file, "testcase", attributes, 1, empty)
+
+    def _write_element_start(self, xunit_file, tag, attributes, level, empty=False):
+        attributes = "".join(
+            f" {key}={self._quote_attr(value)}" for key, value in attributes
         )
-        return testcase
-
-    def _create_failure_or_error(self, document, test, element_type, max_log_size=None):
-        element = document.createElement(element_type)
-        element.setAttribute("type", self._get_attr(test, "fail_class"))
-        element.setAttribute("message", self._get_attr(test, "fail_reason"))
-        traceback_content = self._escape_cdata(test.get("traceback", self.UNKNOWN))
-        traceback = document.createCDATASection(traceback_content)
-        element.appendChild(traceback)
-        system_out = document.createElement("system-out")
+        end = "/>\n" if empty else ">"
+        xunit_file.write(f"{INDENT * level}<{tag}{attributes}{end}".encode("UTF-8"))
+
+    def _write_cdata(self, xunit_file, chunks):
+        """
+        Writes text, given in chunks, as CDATA section(s).
+
+        A chunk is only written up to its trailing "]" characters, so
+        that a "]]>" sequence split between chunks is still escaped.
+        """
+        xunit_file.write(b"<![CDATA[")
+        pending = ""
+        for chunk in chunks:
+            data = pending + chunk
+            cut = len(data.rstrip("]"))
+            pending = data[cut:]
+            xunit_file.write(self._escape_cdata(data[:cut]).encode("UTF-8"))
+        xunit_file.write(self._escape_cdata(pending).encode("UTF-8"))
+        xunit_file.write(b"]]>")
+
+    @staticmethod
+    def _read_chunks(file_obj, size=None):
+        while size is None or size > 0:
+            chunk_size = LOG_CHUNK_SIZE if size is None else min(size, LOG_CHUNK_SIZE)
+            chunk = file_obj.read(chunk_size)
+            if not chunk:
+                break
+            if size is not None:
+                size -= len(chunk)
+            yield chunk
+
+    def _read_log(self, test, max_log_size=None):
         try:
             with open(test.get("logfile"), "r", encoding="utf-8") as logfile_obj:
                 if max_log_size is not None:
@@ -88,71 +124,84 @@ class XUnitResult(Result):
                     log_size = logfile_obj.tell()
                     logfile_obj.seek(0, 0)
                     if log_size < max_log_size:
-                        text_output = logfile_obj.read()
+                        yield from self._read_chunks(logfile_obj)
                     else:
                         size = int(max_log_size / 2)
-                        text_output = logfile_obj.read(size)
-                        text_output += (
-                            "\n\n--[ CUT DUE TO XML PER TEST " "LIMIT ]--\n\n"
-                        )
+                        yield from self._read_chunks(logfile_obj, size)
+                        yield "\n\n--[ CUT DUE TO XML PER TEST LIMIT ]--\n\n"
                         logfile_obj.seek(log_size - size, 0)
-                        text_output += logfile_obj.read()
+                        yield from self._read_chunks(logfile_obj)
                 else:
-                    text_output = logfile_obj.read()
+                    yield from self._read_chunks(logfile_obj)
         except (TypeError, IOError):
-            text_output = self.UNKNOWN
-        system_out_cdata_content = self._escape_cdata(text_output)
-        system_out_cdata = document.createCDATASection(system_out_cdata_content)
-        system_out.appendChild(system_out_cdata)
-        return element, system_out
-
-    def _render(self, result, max_test_log_size, job_name):
-        document = Document()
-        testsuite = document.createElement("testsuite")
-        if job_name:
-            testsuite.setAttribute("name", job_name)
-        else:
-            testsuite.setAttribute(
-                "name", os.path.basename(os.path.dirname(result.logfile))
-            )
-        testsuite.setAttribute("tests", self._escape_attr(result.tests_total))
-        testsuite.setAttribute(
-            "errors", self._escape_attr(result.errors + result.interrupted)
-        )
-        testsuite.setAttribute("failures", self._escape_attr(result.failed))
-        testsuite.setAttribute(
-            "skipped", self._escape_attr(result.skipped + result.cancelled)
+            yield self.UNKNOWN
+
+    def _write_failure_or_error(
+        self, xunit_file, test, element_type, max_log_size=None
+    ):
+        attributes = (
+            ("type", self._get_attr(test, "fail_class")),
+            ("message", self._get_attr(test, "fail_reason")),
         )
-        testsuite.setAttribute(
-            "time", self._escape_attr(self._format_time(result.tests_total_time))
-        )
-        testsuite.setAttribute(
-            "timestamp", self._escape_attr(datetime.datetime.now().isoformat())
+        self._write_element_start(xunit_file, element_type, attributes, 2)
+        self._write_cdata(xunit_file, (str(test.get("traceback", self.UNKNOWN)),))
+        xunit_file.write(f"</{element_type}>\n".encode("UTF-8"))
+        xunit_file.write(f"{INDENT * 2}<system-out>".encode("UTF-8"))
+        self._write_cdata(xunit_file, self._read_log(test, max_log_size))
+        xunit_file.write(b"</system-out>\n")
+
+    def _write_testcase(self, xunit_file, test, max_test_log_size):
+        status = test.get("status", "ERROR")
+        if status in ("PASS", "WARN"):
+            self._write_testcase_start(xunit_file, test, True)
+            return
+        self._write_testcase_start(xunit_file, test, False)
+        xunit_file.write(b"\n")
+        if status in ("SKIP", "CANCEL"):
+            self._write_element_start(xunit_file, "skipped", (), 2, True)
+        elif status == "FAIL":
+            self._write_failure_or_error(xunit_file, test, "failure", max_test_log_size)
+        else:
+            self._write_failure_or_error(xunit_file, test, "error", max_test_log_size)
+        xunit_file.write(f"{INDENT}</testcase>\n".encode("UTF-8"))
+
+    def dump(self, result, xunit_file, max_test_log_size=None, job_name=None):
+        """
+        Writes the xUnit results to a file, one test at a time.
+
+        The test logs embedded on the results are also read and written
+        in chunks, so there's no need to hold the document in memory.
+
+        :param result: the job result
+        :type result: :class:`avocado.core.result.Result`
+        :param xunit_file: a file object open for writing bytes
+        :param max_test_log_size: the maximum number of characters of
+                                  each test log to include
+        :param job_name: the name of the test suite, defaults to the
+                         name of the job results directory
+        """
+        if not job_name:
+            job_name = os.path.basename(os.path.dirname(result.logfile))
+        attributes = (
+            ("name", job_name),
+            ("tests", result.tests_total),
+            ("errors", result.errors + result.interrupted),
+            ("failures", result.failed),
+            ("skipped", result.skipped + result.cancelled),
+            ("time", self._format_time(result.tests_total_time)),
+            ("timestamp", datetime.datetime.now().isoformat()),
         )
-        document.appendChild(testsuite)
+        xunit_file.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._write_element_start(xunit_file, "testsuite", attributes, 0)
+        xunit_file.write(b"\n")
         for test in result.tests:
-            testcase = self._create_testcase_element(document, test)
-            status = test.get("status", "ERROR")
-            if status in ("PASS", "WARN"):
-                pass
-            elif status == "SKIP":
-                testcase.appendChild(document.createElement("skipped"))
-            elif status == "FAIL":
-                element, system_out = self._create_failure_or_error(
-                    document, test, "failure", max_test_log_size
-                )
-                testcase.appendChild(element)
-                testcase.appendChild(system_out)
-            elif status == "CANCEL":
-                testcase.appendChild(document.createElement("skipped"))
-            else:
-                element, system_out = self._create_failure_or_error(
-                    document, test, "error", max_test_log_size
-                )
-                testcase.appendChild(element)
-                testcase.appendChild(system_out)
-            testsuite.appendChild(testcase)
-        return document.toprettyxml(encoding="UTF-8")
+            self._write_testcase(xunit_file, test, max_test_log_size)
+        xunit_file.write(b"</testsuite>\n")
+
+    def _render(self, result, max_test_log_size, job_name):
+        xunit_file = io.BytesIO()
+        self.dump(result, xunit_file, max_test_log_size, job_name)
+        return xunit_file.getvalue()
 
     def render(self, result, job):
         xunit_enabled = job.config.get("job.run.result.xunit.enabled")
@@ -165,19 +214,19 @@ class XUnitResult(Result):
 
         max_test_log_size = job.config.get("job.run.result.xunit.max_test_log_chars")
         job_name = job.config.get("job.run.result.xunit.job_name")
-        content = self._render(result, max_test_log_size, job_name)
         if xunit_enabled:
             xunit_path = os.path.join(job.logdir, "results.xml")
             with open(xunit_path, "wb") as xunit_file:
-                xunit_file.write(content)
+                self.dump(result, xunit_file, max_test_log_size, job_name)
 
         xunit_path = xunit_output
         if xunit_path is not None:
             if xunit_path == "-":
+                content = self._render(result, max_test_log_size, job_name)
                 LOG_UI.debug(content.decode("UTF-8"))
             else:
                 with open(xunit_path, "wb") as xunit_file:
-                    xunit_file.write(content)
+                    self.dump(result, xunit_file, max_test_log_size, job_name)
 
 
 class XUnitInit(Init):
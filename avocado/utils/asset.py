@@ -24,11 +24,11 @@ import operator
 import os
 import re
 import shutil
+import sqlite3
 import stat
 import sys
 import time
-import uuid
-from datetime import datetime
+from collections import namedtuple
 from urllib.parse import urlparse
 
 from avocado.utils import astring, crypto
@@ -51,6 +51,25 @@ SUPPORTED_OPERATORS = {
     ">=": operator.ge,
 }
 
+#: The name of the catalog of the assets, kept on each cache directory
+CATALOG_FILENAME = ".assets-catalog.sqlite"
+
+#: The suffix of the files with assets still being downloaded
+PARTIAL_SUFFIX = ".part"
+
+#: The first field of the line with the signature of the hashed asset file,
+#: on its CHECKSUM file
+HASH_SIGNATURE_FIELD = "#signature"
+
+#: Seconds to wait for other processes holding a lock on a catalog
+CATALOG_TIMEOUT = 30.0
+
+#: An asset on a catalog, with its full path, size (in bytes), last access
+#: time, hashes (a dict of hashes by algorithm) and metadata (if any)
+CatalogEntry = namedtuple(
+    "CatalogEntry", ["path", "size", "atime", "hashes", "metadata"]
+)
+
 
 class UnsupportedProtocolError(OSError):
     """
@@ -58,6 +77,355 @@ class UnsupportedProtocolError(OSError):
     """
 
 
+def _is_asset_file(filename):
+    """Tells if a file on a cache directory is an asset itself."""
+    if filename.startswith(CATALOG_FILENAME):
+        return False
+    return not filename.endswith(
+        ("-CHECKSUM", "_metadata.json", ".lock", PARTIAL_SUFFIX)
+    )
+
+
+class AssetCatalog:
+    """
+    Catalog of the assets stored on a cache directory.
+
+    The catalog is a SQLite database kept on the cache directory itself.
+    It answers queries about the assets (by name, hash, metadata, size and
+    access time) without walking the cache directory tree.  It's built,
+    with a single walk of the tree, when first queried, and then updated
+    as assets are fetched, used and removed.  Changes to the cache
+    directory made by other means are only seen after :meth:`rebuild`.
+
+    The access time of an asset is the latest of the access time of its
+    file, when it was added to the catalog, and the last time the asset
+    was found in the cache (by :meth:`Asset.fetch`, for instance).
+    """
+
+    SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)",
+        (
+            "CREATE TABLE IF NOT EXISTS asset ("
+            "path TEXT PRIMARY KEY,"
+            "name TEXT,"
+            "size INTEGER,"
+            "atime REAL,"
+            "metadata TEXT"
+            ")"
+        ),
+        "CREATE INDEX IF NOT EXISTS asset_name_idx ON asset (name)",
+        (
+            "CREATE TABLE IF NOT EXISTS hash ("
+            "path TEXT,"
+            "algorithm TEXT,"
+            "hash TEXT,"
+            "PRIMARY KEY (path, algorithm)"
+            ")"
+        ),
+        "CREATE INDEX IF NOT EXISTS hash_idx ON hash (hash)",
+        "CREATE TABLE IF NOT EXISTS metadata (path TEXT, key TEXT, value TEXT)",
+        "CREATE INDEX IF NOT EXISTS metadata_idx ON metadata (key, value)",
+        "CREATE INDEX IF NOT EXISTS metadata_path_idx ON metadata (path)",
+    ]
+
+    def __init__(self, cache_dir, path=None):
+        """
+        :param cache_dir: the cache directory with the assets
+        :type cache_dir: str
+        :param path: the location of the catalog database, by default
+                     :data:`CATALOG_FILENAME` on the cache directory.
+                     With ":memory:", the catalog is built on memory,
+                     and discarded when closed.
+        :type path: str
+        """
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.path = path or os.path.join(self.cache_dir, CATALOG_FILENAME)
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        self.close()
+
+    @classmethod
+    def for_asset(cls, asset_path):
+        """Returns the existing catalog of the cache dir containing an asset.
+
+        :param asset_path: full path of the asset file.
+        :rtype: :class:`AssetCatalog` or None
+        """
+        directory = os.path.dirname(os.path.abspath(asset_path))
+        while True:
+            if os.path.isfile(os.path.join(directory, CATALOG_FILENAME)):
+                return cls(directory)
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+            directory = parent
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=CATALOG_TIMEOUT)
+            try:
+                with connection:
+                    for entry in self.SCHEMA:
+                        connection.execute(entry)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _relative(self, asset_path):
+        return os.path.relpath(os.path.abspath(asset_path), self.cache_dir)
+
+    def _walk(self):
+        for root, dirs, files in os.walk(self.cache_dir):
+            dirs.sort()
+            for filename in sorted(files):
+                if _is_asset_file(filename):
+                    yield os.path.join(root, filename)
+
+    @staticmethod
+    def _read_hashes(asset_path):
+        hashes = {}
+        try:
+            with open(Asset._get_hash_file(asset_path), encoding="utf-8") as hash_file:
+                for line in hash_file:
+                    fields = line.split()
+                    if len(fields) == 2:
+                        hashes.setdefault(fields[0], fields[1])
+        except OSError:
+            pass
+        return hashes
+
+    @staticmethod
+    def _read_metadata(asset_path):
+        metadata_path = f"{os.path.splitext(asset_path)[0]}_metadata.json"
+        try:
+            with open(metadata_path, encoding="utf-8") as metadata_file:
+                return json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+
+    def _insert(self, asset_path, used=False):
+        """Inserts the entry of an asset, from its files.
+
+        :param used: whether the asset is being used right now, and
+                     thus, its access time is the current time
+        """
+        try:
+            stats = os.stat(asset_path)
+        except OSError:
+            # a broken link or an asset removed meanwhile
+            return
+        relative = self._relative(asset_path)
+        atime = time.time() if used else stats.st_atime
+        metadata = self._read_metadata(asset_path)
+        self.connection.execute(
+            "INSERT INTO asset VALUES (?, ?, ?, ?, ?)",
+            (
+                relative,
+                os.path.basename(asset_path),
+                stats.st_size,
+                max(atime, stats.st_atime),
+                None if metadata is None else json.dumps(metadata),
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO hash VALUES (?, ?, ?)",
+            [
+                (relative, algorithm, value)
+                for algorithm, value in self._read_hashes(asset_path).items()
+            ],
+        )
+        if isinstance(metadata, dict):
+            self.connection.executemany(
+                "INSERT INTO metadata VALUES (?, ?, ?)",
+                [
+                    (relative, key, str(value))
+                    for key, value in metadata.items()
+                    if not isinstance(value, (dict, list))
+                ],
+            )
+
+    def _delete(self, asset_path):
+        relative = self._relative(asset_path)
+        for table in ("asset", "hash", "metadata"):
+            self.connection.execute(f"DELETE FROM {table} WHERE path = ?", (relative,))
+
+    def is_built(self):
+        """Tells if the catalog was built, that is, it has all assets."""
+        row = self.connection.execute(
+            "SELECT value FROM info WHERE key = 'built'"
+        ).fetchone()
+        return row is not None
+
+    def rebuild(self):
+        """Rebuilds the catalog from the files on the cache directory."""
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            for table in ("asset", "hash", "metadata"):
+                self.connection.execute(f"DELETE FROM {table}")
+            for asset_path in self._walk():
+                self._insert(asset_path)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO info VALUES ('built', ?)", (str(time.time()),)
+            )
+
+    def add(self, asset_path, used=True):
+        """Adds an asset, or updates its entry, on the catalog.
+
+        The size, hashes and metadata of the asset are read from its
+        files on the cache directory.
+
+        :param asset_path: full path of the asset file.
+        :param used: whether the asset is being used right now, and thus,
+                     its access time should be the current time
+        """
+        with self.connection:
+            self._delete(asset_path)
+            self._insert(asset_path, used)
+
+    def remove(self, asset_path):
+        """Removes an asset from the catalog.
+
+        :param asset_path: full path of the asset file.
+        """
+        with self.connection:
+            self._delete(asset_path)
+
+    def find(
+        self,
+        name=None,
+        asset_hash=None,
+        algorithm=None,
+        metadata=None,
+        size_filter=None,
+        accessed_before=None,
+        sort=True,
+    ):
+        """Returns the assets matching all the given criteria.
+
+        The catalog is built first, if that was not done yet.
+
+        :param name: the file name of the asset
+        :param asset_hash: a hash of the asset
+        :param algorithm: the algorithm of the given hash, by default any
+        :param metadata: fields (and their values) on the asset metadata
+        :type metadata: dict
+        :param size_filter: a comparison operator (one of
+                            :data:`SUPPORTED_OPERATORS`) and a size in bytes
+        :type size_filter: tuple of (str, int)
+        :param accessed_before: a time (in seconds since the epoch) after
+                                which the assets were not accessed
+        :type accessed_before: float
+        :param sort: whether to sort the assets by access time, the most
+                     recently accessed first
+        :rtype: list of :class:`CatalogEntry`
+        """
+        if not self.is_built():
+            self.rebuild()
+        conditions = []
+        parameters = []
+        if name is not None:
+            conditions.append("name = ?")
+            parameters.append(name)
+        if asset_hash is not None:
+            condition = "path IN (SELECT path FROM hash WHERE hash = ?"
+            parameters.append(asset_hash)
+            if algorithm is not None:
+                condition += " AND algorithm = ?"
+                parameters.append(algorithm)
+            conditions.append(f"{condition})")
+        for key, value in (metadata or {}).items():
+            conditions.append(
+                "path IN (SELECT path FROM metadata WHERE key = ? AND value = ?)"
+            )
+            parameters.extend((key, str(value)))
+        if size_filter is not None:
+            operator_name, size = size_filter
+            if operator_name not in SUPPORTED_OPERATORS:
+                raise ValueError(f"Operator not supported: {operator_name}")
+            conditions.append(f"size {operator_name} ?")
+            parameters.append(size)
+        if accessed_before is not None:
+            conditions.append("atime <= ?")
+            parameters.append(accessed_before)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        hashes = {}
+        for path, hash_algorithm, value in self.connection.execute(
+            f"SELECT path, algorithm, hash FROM hash WHERE path IN "
+            f"(SELECT path FROM asset{where})",
+            parameters,
+        ):
+            hashes.setdefault(path, {})[hash_algorithm] = value
+        query = f"SELECT path, size, atime, metadata FROM asset{where}"
+        if sort:
+            query += " ORDER BY atime DESC, path"
+        entries = []
+        removed = []
+        accessed = []
+        for path, size, atime, asset_metadata in self.connection.execute(
+            query, parameters
+        ).fetchall():
+            # the assets may have been used, or removed, by others than
+            # Avocado, so the files found are checked against the catalog
+            asset_path = os.path.join(self.cache_dir, path)
+            try:
+                stats = os.stat(asset_path)
+            except FileNotFoundError:
+                removed.append(path)
+                continue
+            if stats.st_atime > atime:
+                atime = stats.st_atime
+                accessed.append((atime, path))
+            if accessed_before is not None and atime > accessed_before:
+                continue
+            entries.append(
+                CatalogEntry(
+                    asset_path,
+                    size,
+                    atime,
+                    hashes.get(path, {}),
+                    None if asset_metadata is None else json.loads(asset_metadata),
+                )
+            )
+        if removed or accessed:
+            self._refresh(removed, accessed)
+        if sort and accessed:
+            entries.sort(key=lambda entry: (-entry.atime, entry.path))
+        return entries
+
+    def _refresh(self, removed, accessed):
+        """Updates the entries found to be outdated, if possible.
+
+        :param removed: the paths of the assets no longer on disk
+        :param accessed: the access times and paths of the assets
+                         accessed after they were last added
+        """
+        try:
+            with self.connection:
+                for table in ("asset", "hash", "metadata"):
+                    self.connection.executemany(
+                        f"DELETE FROM {table} WHERE path = ?",
+                        [(path,) for path in removed],
+                    )
+                self.connection.executemany(
+                    "UPDATE asset SET atime = ? WHERE path = ?", accessed
+                )
+        except sqlite3.Error:
+            pass
+
+
 class Asset:
     """
     Try to fetch/verify an asset file from multiple locations.
@@ -104,13 +472,16 @@ class Asset:
     def _create_hash_file(self, asset_path):
         """
         Compute the hash of the asset file and add it to the CHECKSUM
-        file.
+        file, unless it's already there (and the asset file unchanged).
 
         :param asset_path: full path of the asset file.
         """
+        if self._get_trusted_hash(asset_path, self.algorithm) is not None:
+            return
+        signature = self._get_file_signature(asset_path)
         result = crypto.hash_file(asset_path, algorithm=self.algorithm)
         hash_file = self._get_hash_file(asset_path)
-        self._add_hash_to_hash_file(hash_file, result, self.algorithm)
+        self._add_hash_to_hash_file(hash_file, result, self.algorithm, signature)
 
     def _create_metadata_file(self, asset_file):
         """
@@ -138,35 +509,50 @@ class Asset:
         :rtype: bool
         """
         timeout = timeout or DOWNLOAD_TIMEOUT
-        try:
-            # Temporary unique name to use while downloading
-            temp = f"{asset_path}.{str(uuid.uuid4())}"
-
-            # To avoid parallel downloads of the same asset, and errors during
-            # the write after download, let's get the lock before start the
-            # download.
-            with FileLock(asset_path, timeout):
-                try:
-                    self.find_asset_file(create_metadata=True)
-                    return True
-                except OSError:
-                    LOG.debug("Asset not in cache after lock, fetching it.")
-
-                url_download(url_obj.geturl(), temp, timeout=timeout)
-                shutil.copy(temp, asset_path)
-                self._create_hash_file(asset_path)
-                if not self._verify_hash(asset_path):
-                    msg = "Hash mismatch. Ignoring asset from the cache"
-                    raise OSError(msg)
+        # To avoid parallel downloads of the same asset, and errors during
+        # the write after download, let's get the lock before start the
+        # download.
+        with FileLock(asset_path, timeout):
+            try:
+                self.find_asset_file(create_metadata=True)
                 return True
-        finally:
+            except OSError:
+                LOG.debug("Asset not in cache after lock, fetching it.")
+
+            # The partial download is kept on failures, so that the next
+            # attempt (from this or from another location) can resume it.
+            # That's only done for assets with a known hash, which is then
+            # verified, as the contents of a location may change meanwhile.
+            partial = f"{asset_path}{PARTIAL_SUFFIX}"
+            resume = self.asset_hash is not None
+            # The hash is computed while downloading, saving another read
             try:
-                os.remove(temp)
-            except FileNotFoundError:
-                LOG.info(
-                    "Temporary asset file unavailable due to failed"
-                    " download attempt."
+                digests = url_download(
+                    url_obj.geturl(),
+                    partial,
+                    timeout=timeout,
+                    resume=resume,
+                    algorithms=[self.algorithm],
                 )
+            except OSError:
+                # it would never be resumed, nor purged from the cache
+                if not resume:
+                    try:
+                        os.remove(partial)
+                    except FileNotFoundError:
+                        pass
+                raise
+            os.replace(partial, asset_path)
+            self._add_hash_to_hash_file(
+                self._get_hash_file(asset_path),
+                digests[self.algorithm],
+                self.algorithm,
+                self._get_file_signature(asset_path),
+            )
+            if not self._verify_hash(asset_path):
+                msg = "Hash mismatch. Ignoring asset from the cache"
+                raise OSError(msg)
+            return True
 
     @staticmethod
     def _get_hash_file(asset_path):
@@ -193,6 +579,83 @@ class Asset:
 
         return Asset.read_hash_from_file(hash_file, self.algorithm)[1]
 
+    @staticmethod
+    def _get_file_signature(asset_path):
+        """
+        Returns the signature of an asset file, that is, its size,
+        modification time and inode number.
+
+        The hashes on the CHECKSUM file are trusted while the asset file
+        keeps the signature recorded along with them.
+
+        :param asset_path: full path of the asset file.
+        :rtype: str
+        """
+        stats = os.stat(asset_path)
+        return f"{stats.st_size} {stats.st_mtime_ns} {stats.st_ino}"
+
+    @staticmethod
+    def _parse_hash_file(hash_file):
+        """
+        Parses the CHECKSUM file, which should be locked by the caller.
+
+        :param hash_file: path to hash
+        :returns: the signature of the asset file when it was hashed (or
+                  None for files written by older versions) and a dict
+                  with the hashes by algorithm
+        :raises: OSError
+        """
+        signature = None
+        hashes = {}
+        with open(hash_file, "r", encoding="utf-8") as fp:
+            for line in fp:
+                fields = line.split()
+                if len(fields) == 4 and fields[0] == HASH_SIGNATURE_FIELD:
+                    signature = " ".join(fields[1:])
+                # md5 is 32 chars big and sha512 is 128 chars big.
+                # others supported algorithms are between those.
+                elif len(fields) == 2 and re.match(r"^[a-f0-9]{32,128}$", fields[1]):
+                    hashes.setdefault(fields[0], fields[1])
+        return signature, hashes
+
+    @staticmethod
+    def _write_hash_file(hash_file, signature, hashes):
+        """
+        Writes the CHECKSUM file, which should be locked by the caller.
+
+        :param hash_file: path to hash
+        :param signature: the signature of the asset file when it was hashed
+        :param hashes: dict with the hashes by algorithm
+        """
+        with open(hash_file, "w", encoding="utf-8") as fp:
+            if signature is not None:
+                fp.write(f"{HASH_SIGNATURE_FIELD} {signature}\n")
+            for algorithm, value in hashes.items():
+                fp.write(f"{algorithm} {value}\n")
+
+    @classmethod
+    def _get_trusted_hash(cls, asset_path, algorithm):
+        """
+        Returns the hash of an asset file from its CHECKSUM file, if the
+        asset file did not change since it was hashed.
+
+        :param asset_path: full path of the asset file.
+        :param algorithm: the algorithm of the hash.
+        :returns: the hash, or None if it has to be computed.
+        :rtype: str
+        """
+        hash_file = cls._get_hash_file(asset_path)
+        try:
+            with FileLock(hash_file, 30):
+                signature, hashes = cls._parse_hash_file(hash_file)
+            # CHECKSUM files written by older versions have no signature,
+            # so there's no telling whether the asset file changed since
+            if signature is None or signature != cls._get_file_signature(asset_path):
+                return None
+        except OSError:
+            return None
+        return hashes.get(algorithm)
+
     @classmethod
     def read_hash_from_file(cls, filename, algorithm=None):
         """Read the CHECKSUM file and return the hash.
@@ -202,40 +665,75 @@ class Asset:
 
         :rtype: list with algorithm and hash
         """
+        algorithm = algorithm or DEFAULT_HASH_ALGORITHM
         try:
             with FileLock(filename, 30):
-                with open(filename, "r", encoding="utf-8") as hash_file:
-                    algorithm = algorithm or DEFAULT_HASH_ALGORITHM
-                    for line in hash_file:
-                        # md5 is 32 chars big and sha512 is 128 chars big.
-                        # others supported algorithms are between those.
-                        if re.match(f"^{algorithm}\b.* [a-f0-9]{32,128}", line):
-                            return line.split()
-                    return [None, None]
+                _, hashes = cls._parse_hash_file(filename)
         except Exception:  # pylint: disable=W0703
             exc_type, exc_value = sys.exc_info()[:2]
             LOG.error("%s: %s", exc_type.__name__, exc_value)
             return [None, None]
+        if algorithm in hashes:
+            return [algorithm, hashes[algorithm]]
+        return [None, None]
 
     @staticmethod
-    def _add_hash_to_hash_file(hash_file, new_hash, algorithm):
+    def _add_hash_to_hash_file(hash_file, new_hash, algorithm, signature=None):
         """
         Adds new hash entry to the list inside hash file.
 
         :param hash_file: path to hash
         :param new_hash: hash value which will by added
         :param algorithm: algorithm which generated the new hash
+        :param signature: the signature of the asset file when it was
+                          hashed.  If it's not the one recorded, the
+                          hashes of the previous contents are discarded.
         """
         with FileLock(hash_file, 120):
             try:
-                with open(hash_file, "r", encoding="utf-8") as fp:
-                    for line in fp:
-                        if algorithm == line.split()[0]:
-                            return
+                recorded, hashes = Asset._parse_hash_file(hash_file)
             except FileNotFoundError:
-                pass
-            with open(hash_file, "a", encoding="utf-8") as fp:
-                fp.write(f"{algorithm} {new_hash}\n")
+                recorded, hashes = None, {}
+            if signature is None or signature == recorded:
+                if algorithm not in hashes:
+                    with open(hash_file, "a", encoding="utf-8") as fp:
+                        fp.write(f"{algorithm} {new_hash}\n")
+            else:
+                Asset._write_hash_file(hash_file, signature, {algorithm: new_hash})
+
+    @classmethod
+    def verify_asset_file(cls, asset_path):
+        """
+        Verifies the hashes on the CHECKSUM file of an asset, by hashing
+        its contents again, no matter if the asset file changed or not.
+
+        The CHECKSUM file is then updated with the hashes of the current
+        contents, so mismatching assets are not found on the cache by
+        their expected hashes anymore.
+
+        :param asset_path: full path of the asset file.
+        :returns: the algorithms whose hashes did not match the contents.
+        :rtype: list
+        :raises: OSError
+        """
+        hash_file = cls._get_hash_file(asset_path)
+        try:
+            with FileLock(hash_file, 120):
+                _, hashes = cls._parse_hash_file(hash_file)
+        except FileNotFoundError:
+            return []
+        signature = cls._get_file_signature(asset_path)
+        computed = {
+            algorithm: crypto.hash_file(asset_path, algorithm=algorithm)
+            for algorithm in hashes
+        }
+        with FileLock(hash_file, 120):
+            cls._write_hash_file(hash_file, signature, computed)
+        return [
+            algorithm
+            for algorithm, value in hashes.items()
+            if computed[algorithm] != value
+        ]
 
     def _get_local_file(self, url_obj, asset_path, _):
         """
@@ -310,6 +808,34 @@ class Asset:
 
         return os.path.join("by_location", base_url_hash.hexdigest())
 
+    @staticmethod
+    def _update_catalog(asset_path, cache_dir=None, remove=False):
+        """Updates the entry of an asset on the catalog of its cache dir.
+
+        Only catalogs that already exist are updated, as the others are
+        built (with all the assets) when first queried.
+
+        :param asset_path: full path of the asset file.
+        :param cache_dir: the cache dir with the asset, if known.
+        :param remove: whether the asset was removed.
+        """
+        if cache_dir is None:
+            catalog = AssetCatalog.for_asset(asset_path)
+        else:
+            catalog = AssetCatalog(cache_dir)
+            if not os.path.isfile(catalog.path):
+                catalog = None
+        if catalog is None:
+            return
+        try:
+            with catalog:
+                if remove:
+                    catalog.remove(asset_path)
+                else:
+                    catalog.add(asset_path)
+        except sqlite3.Error as exc:
+            LOG.debug("Could not update the assets catalog %s: %s", catalog.path, exc)
+
     def _get_writable_cache_dir(self):
         """
         Returns the first available writable cache directory
@@ -357,16 +883,15 @@ class Asset:
         if algorithm is None:
             algorithm = DEFAULT_HASH_ALGORITHM
 
-        hash_path = cls._get_hash_file(asset_path)
-        _, hash_from_file = cls.read_hash_from_file(hash_path, algorithm)
-        if not hash_from_file:
+        hash_from_file = cls._get_trusted_hash(asset_path, algorithm)
+        if hash_from_file is None:
+            # not hashed yet, or changed since it was
+            signature = cls._get_file_signature(asset_path)
             hash_from_file = crypto.hash_file(asset_path, algorithm=algorithm)
-            if hash_from_file == asset_hash:
-                cls._add_hash_to_hash_file(hash_path, asset_hash, algorithm)
-                return True
-        if hash_from_file == asset_hash:
-            return True
-        return False
+            cls._add_hash_to_hash_file(
+                cls._get_hash_file(asset_path), hash_from_file, algorithm, signature
+            )
+        return hash_from_file == asset_hash
 
     def _verify_hash(self, asset_path):
         """
@@ -399,7 +924,9 @@ class Asset:
 
         LOG.info("Fetching asset %s", self.name)
         try:
-            return self.find_asset_file(create_metadata=True)
+            asset_file = self.find_asset_file(create_metadata=True)
+            self._update_catalog(asset_file)
+            return asset_file
         except OSError:
             LOG.info("Asset not in cache, fetching it.")
 
@@ -433,6 +960,7 @@ class Asset:
                     LOG.info("Asset downloaded.")
                     if self.metadata is not None:
                         self._create_metadata_file(asset_file)
+                    self._update_catalog(asset_file, cache_dir)
                     return asset_file
             except Exception:  # pylint: disable=W0703
                 exc_type, exc_value = sys.exc_info()[:2]
@@ -522,21 +1050,55 @@ class Asset:
         return os.path.basename(self.parsed_name.path)
 
     @classmethod
-    def get_all_assets(cls, cache_dirs, sort=True):
-        """Returns all assets stored in all cache dirs."""
-        assets = []
+    def get_catalog_entries(cls, cache_dirs, sort=True, **criteria):
+        """Returns the assets on all cache dirs matching the given criteria.
+
+        The assets are looked up on the catalogs of the cache dirs (see
+        :class:`AssetCatalog`).  Cache dirs where a catalog can not be
+        kept, such as read only ones, are walked instead.
+
+        :param cache_dirs: list of directories to use during the search.
+        :param sort: whether to sort the assets by access time, the most
+                     recently accessed first
+        :param criteria: the criteria given to :meth:`AssetCatalog.find`
+        :rtype: list of :class:`CatalogEntry`
+        """
+        entries = []
         for cache_dir in cache_dirs:
-            expanded = os.path.expanduser(cache_dir)
-            for root, _, files in os.walk(expanded):
-                for f in files:
-                    if not f.endswith("-CHECKSUM") and not f.endswith("_metadata.json"):
-                        assets.append(os.path.join(root, f))
+            if not os.path.isdir(os.path.expanduser(cache_dir)):
+                continue
+            try:
+                with AssetCatalog(cache_dir) as catalog:
+                    entries.extend(catalog.find(sort=False, **criteria))
+            except sqlite3.Error as exc:
+                LOG.debug("Assets catalog not usable on %s: %s", cache_dir, exc)
+                with AssetCatalog(cache_dir, ":memory:") as catalog:
+                    entries.extend(catalog.find(sort=False, **criteria))
         if sort:
-            assets = {a: os.stat(a).st_atime for a in assets}
-            return [
-                a[0] for a in sorted(assets.items(), key=lambda x: x[1], reverse=True)
-            ]
-        return assets
+            entries.sort(key=lambda entry: entry.atime, reverse=True)
+        return entries
+
+    @classmethod
+    def rebuild_catalogs(cls, cache_dirs):
+        """Rebuilds the catalogs of all cache dirs, from their files.
+
+        :param cache_dirs: list of directories with assets.
+        :returns: the number of assets found on each cache dir
+        :rtype: dict
+        """
+        result = {}
+        for cache_dir in cache_dirs:
+            if not os.path.isdir(os.path.expanduser(cache_dir)):
+                continue
+            with AssetCatalog(cache_dir) as catalog:
+                catalog.rebuild()
+                result[cache_dir] = len(catalog.find(sort=False))
+        return result
+
+    @classmethod
+    def get_all_assets(cls, cache_dirs, sort=True):
+        """Returns all assets stored in all cache dirs."""
+        return [entry.path for entry in cls.get_catalog_entries(cache_dirs, sort)]
 
     @classmethod
     def get_asset_by_name(cls, name, cache_dirs, expire=None, asset_hash=None):
@@ -588,22 +1150,22 @@ class Asset:
                      the last 10 days.
         :param cache_dirs: list of directories to use during the search.
         """
-        result = []
-        for file_path in cls.get_all_assets(cache_dirs):
-            stats = os.stat(file_path)
-            diff = datetime.now() - datetime.fromtimestamp(stats.st_atime)
-            if diff.days >= days:
-                result.append(file_path)
-        return result
+        accessed_before = time.time() - days * 24 * 60 * 60
+        return [
+            entry.path
+            for entry in cls.get_catalog_entries(
+                cache_dirs, accessed_before=accessed_before
+            )
+        ]
 
-    @classmethod
-    def get_assets_by_size(cls, size_filter, cache_dirs):
-        """Return a list of all assets in cache based on its size in MB.
+    @staticmethod
+    def parse_size_filter(size_filter):
+        """Parses a size filter, such as ">=200", into operator and value.
 
         :param size_filter: a string with a filter (comparison operator +
-                            value). Ex ">20", "<=200". Supported operators:
-                            ==, <, >, <=, >=.
-        :param cache_dirs: list of directories to use during the search.
+                            value). Supported operators: ==, <, >, <=, >=.
+        :rtype: tuple of (str, int)
+        :raises: OSError
         """
         try:
             op = re.match("^(\\D+)(\\d+)$", size_filter).group(1)
@@ -615,21 +1177,29 @@ class Asset:
             )
             raise OSError(msg) from exc
 
-        try:
-            method = SUPPORTED_OPERATORS[op]
-        except KeyError as exc:
+        if op not in SUPPORTED_OPERATORS:
             msg = (
                 "Operator not supported. Currented valid values are: ",
                 ", ".join(SUPPORTED_OPERATORS),
             )
-            raise OSError(msg) from exc
+            raise OSError(msg)
+        return op, value
 
-        result = []
-        for file_path in cls.get_all_assets(cache_dirs):
-            file_size = os.path.getsize(file_path)
-            if method(file_size, value):
-                result.append(file_path)
-        return result
+    @classmethod
+    def get_assets_by_size(cls, size_filter, cache_dirs):
+        """Return a list of all assets in cache based on its size in MB.
+
+        :param size_filter: a string with a filter (comparison operator +
+                            value). Ex ">20", "<=200". Supported operators:
+                            ==, <, >, <=, >=.
+        :param cache_dirs: list of directories to use during the search.
+        """
+        return [
+            entry.path
+            for entry in cls.get_catalog_entries(
+                cache_dirs, size_filter=cls.parse_size_filter(size_filter)
+            )
+        ]
 
     @classmethod
     def remove_assets_by_overall_limit(cls, limit, cache_dirs):
@@ -647,10 +1217,10 @@ class Asset:
         :param cache_dirs: list of directories to use during the search.
         """
         size_sum = 0
-        for asset in cls.get_all_assets(cache_dirs):
-            size_sum += os.stat(asset).st_size
+        for entry in cls.get_catalog_entries(cache_dirs):
+            size_sum += entry.size
             if size_sum >= limit:
-                cls.remove_asset_by_path(asset)
+                cls.remove_asset_by_path(entry.path)
 
     @classmethod
     def remove_assets_by_size(cls, size_filter, cache_dirs):
@@ -706,6 +1276,7 @@ class Asset:
 
         :param asset_path: full path of the asset file.
         """
+        cls._update_catalog(asset_path, remove=True)
         try:
             os.remove(asset_path)
             filename = f"{asset_path}-CHECKSUM"
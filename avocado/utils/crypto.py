@@ -15,12 +15,15 @@
 """Cryptographic hash utilities for file verification."""
 
 import hashlib
-import io
 import logging
 import os
 
 LOG = logging.getLogger(__name__)
 
+#: The size of the reads while hashing a file, large enough to keep the
+#: overhead of each read small when hashing large files
+HASH_BUFFER_SIZE = 1024 * 1024
+
 
 def hash_file(filename, size=None, algorithm="md5"):
     """Calculate the hash value of a file.
@@ -53,7 +56,7 @@ def hash_file(filename, size=None, algorithm="md5"):
         >>> hash_file('/path/to/large_file', size=1024)
         'abc123...'
     """
-    chunksize = io.DEFAULT_BUFFER_SIZE
+    chunksize = HASH_BUFFER_SIZE
     fsize = os.path.getsize(filename)
 
     if not size or size > fsize:
@@ -17,13 +17,15 @@
 Methods to download URLs and regular files.
 """
 
+import hashlib
 import logging
 import os
 import shutil
 import socket
 import sys
 import urllib.parse
-from multiprocessing import Process
+import urllib.request
+from multiprocessing import Pipe, Process
 from urllib.error import HTTPError
 from urllib.request import urlopen
 
@@ -31,6 +33,9 @@ from avocado.utils import crypto, output
 
 log = logging.getLogger(__name__)
 
+#: The size of the reads (and writes) while downloading a file
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 def url_open(url, data=None, timeout=5):
     """
@@ -66,8 +71,51 @@ def url_open(url, data=None, timeout=5):
     return result
 
 
-def _url_download(url, filename, data):
-    src_file = url_open(url, data=data)
+def _open_resumed(url, data, offset):
+    """Opens an URL to read its contents starting from the given offset.
+
+    :returns: the file-like object, or None if the server can not send
+              the contents from that offset.
+    """
+    request = urllib.request.Request(url, data=data)
+    request.add_header("Range", f"bytes={offset}-")
+    try:
+        src_file = urlopen(request, timeout=5)  # pylint: disable=R1732
+    except OSError as ex:
+        log.debug("Could not resume download of %s: %s", url, ex)
+        return None
+    content_range = src_file.headers.get("Content-Range", "")
+    if src_file.status == 206 and content_range.startswith(f"bytes {offset}-"):
+        log.debug("Resuming download of %s from byte %s", url, offset)
+        return src_file
+    src_file.close()
+    return None
+
+
+def _hash_prefix(filename, length, hashes):
+    with open(filename, "rb") as prefix_file:
+        while length > 0:
+            data = prefix_file.read(min(COPY_BUFFER_SIZE, length))
+            if not data:
+                break
+            for hash_obj in hashes:
+                hash_obj.update(data)
+            length -= len(data)
+
+
+def _url_download(url, filename, data, resume=False, algorithms=None, digests=None):
+    src_file = None
+    offset = 0
+    if resume:
+        try:
+            offset = os.path.getsize(filename)
+        except OSError:
+            pass
+        if offset:
+            src_file = _open_resumed(url, data, offset)
+    if src_file is None:
+        offset = 0
+        src_file = url_open(url, data=data)
     if not src_file:
         msg = (
             "Failed to get file. Probably timeout was reached when "
@@ -76,14 +124,42 @@ def _url_download(url, filename, data):
         sys.stderr.write(msg)
         sys.exit(1)
 
+    hashes = [hashlib.new(algorithm) for algorithm in algorithms or []]
+    if hashes and offset:
+        _hash_prefix(filename, offset, hashes)
     try:
-        with open(filename, "wb") as dest_file:
-            shutil.copyfileobj(src_file, dest_file)
+        with open(filename, "ab" if offset else "wb") as dest_file:
+            buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+            while True:
+                read = src_file.readinto(buffer)
+                if not read:
+                    break
+                dest_file.write(buffer[:read])
+                for hash_obj in hashes:
+                    hash_obj.update(buffer[:read])
+            length = src_file.headers.get("Content-Length")
+            expected = dest_file.tell() if length is None else offset + int(length)
+            if dest_file.tell() < expected:
+                # the connection was closed before all the contents were sent
+                sys.stderr.write(
+                    f"Incomplete download of {url}: {dest_file.tell()} "
+                    f"out of {expected} bytes\n"
+                )
+                sys.exit(1)
     finally:
         src_file.close()
+    if digests is not None:
+        digests.send(
+            {
+                algorithm: hash_obj.hexdigest()
+                for algorithm, hash_obj in zip(algorithms, hashes)
+            }
+        )
 
 
-def url_download(url, filename, data=None, timeout=300):
+def url_download(  # pylint: disable=R0913
+    url, filename, data=None, timeout=300, resume=False, algorithms=None
+):
     """
     Retrieve a file from given url.
 
@@ -91,16 +167,38 @@ def url_download(url, filename, data=None, timeout=300):
     :param filename: destination path.
     :param data: (optional) data to post.
     :param timeout: (optional) default timeout in seconds.
-    :return: `None`.
+    :param resume: (optional) whether to resume the download into an
+                   existing (partial) destination file, if the server
+                   supports range requests.  Otherwise, the destination
+                   file is downloaded from the start.
+    :param algorithms: (optional) hash algorithms of the hashes of the
+                       destination file to compute while downloading it.
+    :type algorithms: list of str
+    :return: `None`, or a dict with the hashes by algorithm, if
+             `algorithms` were given.
+    :raises: OSError if the download failed or the timeout was reached.
     """
-    process = Process(target=_url_download, args=(url, filename, data))
+    receiver, sender = (None, None)
+    if algorithms:
+        receiver, sender = Pipe(duplex=False)
+    process = Process(
+        target=_url_download, args=(url, filename, data, resume, algorithms, sender)
+    )
     log.info("Fetching %s -> %s", url, filename)
     process.start()
+    if sender is not None:
+        sender.close()
     process.join(timeout)
     if process.is_alive():
         process.terminate()
         process.join()
         raise OSError("Aborting downloading. Timeout was reached.")
+    if process.exitcode != 0:
+        raise OSError(f"Failed downloading {url}")
+    if receiver is None:
+        return None
+    with receiver:
+        return receiver.recv()
 
 
 def url_download_interactive(url, output_file, title="", chunk_size=102400):
@@ -1530,6 +1530,34 @@ class AsyncPodman(_Podman):
                 f"Failed to execute command in container {container_id}."
             ) from ex
 
+    async def spawn_exec(self, container_id, command, env=None):
+        """Starts a command in a running container, without waiting for it.
+
+        :param str container_id: Container identification string.
+        :param list command: Command (and its arguments) to execute.
+        :param dict env: Optional dictionary of environment variables to set.
+        :returns: the (local) ``podman exec`` process
+        :rtype: :class:`asyncio.subprocess.Process`
+        """
+        args = ["exec"]
+        for key, value in (env or {}).items():
+            args.append(f"--env={key}={value}")
+        args.append(container_id)
+        args.extend(command)
+        try:
+            LOG.debug("Executing %s", args)
+            return await create_subprocess_exec(
+                self.podman_bin,
+                *args,
+                stdin=asyncio_subprocess.DEVNULL,
+                stdout=asyncio_subprocess.DEVNULL,
+                stderr=asyncio_subprocess.DEVNULL,
+            )
+        except (FileNotFoundError, PermissionError) as ex:
+            msg = "Could not execute the command."
+            LOG.error("%s: %s", msg, str(ex))
+            raise PodmanException(msg) from ex
+
     async def collect_container_aiu_metrics(
         self,
         container_id,
@@ -1867,6 +1895,48 @@ class AsyncPodman(_Podman):
         except PodmanException as ex:
             raise PodmanException("Failed to list containers.") from ex
 
+    async def events(self, filters=None, since=None):
+        """Yields the events reported by podman, as they happen.
+
+        A single ``podman events`` process is kept running for as long as
+        the events are consumed, and it's terminated when the generator
+        is closed (or the task consuming it is cancelled).
+
+        :param list filters: Optional filters (such as "type=container")
+                             given to ``podman events --filter``.
+        :param str since: Optional timestamp of the oldest event to report.
+        :rtype: asynchronous generator of dict, one for each event
+        """
+        args = ["events", "--format=json"]
+        if since is not None:
+            args.append(f"--since={since}")
+        for event_filter in filters or []:
+            args.append(f"--filter={event_filter}")
+        try:
+            LOG.debug("Executing %s", args)
+            proc = await create_subprocess_exec(
+                self.podman_bin,
+                *args,
+                stdin=asyncio_subprocess.DEVNULL,
+                stdout=asyncio_subprocess.PIPE,
+                stderr=asyncio_subprocess.DEVNULL,
+            )
+        except (FileNotFoundError, PermissionError) as ex:
+            msg = "Could not execute the command."
+            LOG.error("%s: %s", msg, str(ex))
+            raise PodmanException(msg) from ex
+
+        try:
+            async for line in proc.stdout:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    LOG.debug("Ignoring unexpected podman event: %s", line)
+        finally:
+            if proc.returncode is None:
+                proc.terminate()
+                await proc.wait()
+
     async def logs(self, container_id, follow=False, tail=None, user=None):
         """Get container logs.
 
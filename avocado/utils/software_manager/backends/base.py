@@ -43,6 +43,31 @@ class BaseBackend:
         log.warning("No package seems to provide %s", path)
         return False
 
+    def check_installed_batch(self, names):
+        """
+        Checks which of the packages [names] are installed.
+
+        Backends that can check many packages at once, with a single
+        query, override this.
+
+        :param names: Package names.
+        :type names: list of str
+        :returns: whether each one of the packages is installed
+        :rtype: dict
+        """
+        return {
+            name: self.check_installed(name) for name in names  # pylint: disable=E1101
+        }
+
+    def install_batch(self, names):
+        """
+        Installs packages [names] in a single transaction.
+
+        :param names: Package names.
+        :type names: list of str
+        """
+        return self.install(" ".join(names))  # pylint: disable=E1101
+
     @staticmethod
     def _run_cmd(cmd):
         """
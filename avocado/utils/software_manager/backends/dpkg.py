@@ -38,6 +38,28 @@ class DpkgBackend(BaseBackend):
             return True
         return False
 
+    def check_installed_batch(self, names):
+        """
+        Checks which of the packages [names] are installed, with a single
+        query.
+
+        :param names: Package names.
+        :type names: list of str
+        :returns: whether each one of the packages is installed
+        :rtype: dict
+        """
+        if any(os.path.isfile(name) for name in names):
+            return super().check_installed_batch(names)
+        i_cmd = self.lowlevel_base_cmd + " -s " + " ".join(names)
+        package_status = process.run(i_cmd, ignore_status=True).stdout_text
+        installed = set()
+        for stanza in package_status.split("\n\n"):
+            fields = dict(re.findall(r"^(\S+): (.*)$", stanza, re.M))
+            if self.INSTALLED_OUTPUT in fields.get("Status", ""):
+                installed.add(fields.get("Package"))
+                installed.add(f"{fields.get('Package')}:{fields.get('Architecture')}")
+        return {name: name in installed for name in names}
+
     @staticmethod
     def list_all():
         """
@@ -67,6 +67,23 @@ class RpmBackend(BaseBackend):
         except process.CmdError:
             return False
 
+    def check_installed_batch(self, names):
+        """
+        Checks which of the packages [names] are installed, with a single
+        query.
+
+        :param names: Package names.
+        :type names: list of str
+        :returns: whether each one of the packages is installed
+        :rtype: dict
+        """
+        cmd = self.lowlevel_base_cmd + " -q " + " ".join(names)
+        output = process.run(cmd, ignore_status=True).stdout_text
+        not_installed = set(
+            re.findall(r"^package (\S+) is not installed$", output, re.M)
+        )
+        return {name: name not in not_installed for name in names}
+
     def list_all(self, software_components=True):
         """
         List all installed packages.
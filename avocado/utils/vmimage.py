@@ -755,9 +755,8 @@ class Image:
         """
         Find a cached image using asset.py enhanced built-in functionality.
 
-        This version uses the enhanced Asset.get_metadata() method which supports
-        both normal asset names and direct file paths, maximizing utilization of
-        existing asset.py caching features.
+        This looks up the images by their metadata on the catalogs of the
+        cache dirs (see :class:`avocado.utils.asset.AssetCatalog`).
         """
 
         # pylint: disable-next=invalid-name
@@ -778,43 +777,46 @@ class Image:
                 and (not compatible_arches or metadata.get("arch") in compatible_arches)
             )
 
-        # Use Asset.get_all_assets() to find cached assets
-        for asset_path in asset.Asset.get_all_assets(cache_dirs, sort=False):
+        # The metadata of the cached assets is looked up on the catalogs
+        # of the cache dirs, instead of on every file of their trees
+        for entry in asset.Asset.get_catalog_entries(
+            cache_dirs, metadata={"type": "vmimage"}
+        ):
+            asset_path = entry.path
+            metadata = entry.metadata
             try:
-                temp_asset = asset.Asset(
-                    name=asset_path,
-                    asset_hash=checksum,
-                    algorithm=algorithm,
-                    cache_dirs=cache_dirs,
-                )
-
-                try:
-                    metadata = temp_asset.get_metadata()
-                    if not metadata:
-                        continue
-                except OSError:
-                    continue
-
-                if matches_image_criteria(
+                if not matches_image_criteria(
                     metadata, name, version, build, compatible_arches
                 ):
+                    continue
+                # The catalog may not know about images removed by other means
+                if not os.path.isfile(asset_path):
+                    continue
+
+                if checksum:
+                    temp_asset = asset.Asset(
+                        name=asset_path,
+                        asset_hash=checksum,
+                        algorithm=algorithm,
+                        cache_dirs=cache_dirs,
+                    )
                     # pylint: disable-next=W0212
-                    if checksum and not temp_asset._verify_hash(asset_path):
+                    if not temp_asset._verify_hash(asset_path):
                         LOG.debug("Hash mismatch for cached image: %s", asset_path)
                         continue
 
-                    LOG.info("Found matching cached image: %s", asset_path)
-                    return cls(
-                        name=metadata.get("name", name),
-                        url=asset_path,
-                        version=metadata.get("version", version),
-                        arch=metadata.get("arch", arch),
-                        build=metadata.get("build", build),
-                        checksum=checksum,
-                        algorithm=algorithm,
-                        cache_dir=cache_dirs[0],
-                        snapshot_dir=snapshot_dir,
-                    )
+                LOG.info("Found matching cached image: %s", asset_path)
+                return cls(
+                    name=metadata.get("name", name),
+                    url=asset_path,
+                    version=metadata.get("version", version),
+                    arch=metadata.get("arch", arch),
+                    build=metadata.get("build", build),
+                    checksum=checksum,
+                    algorithm=algorithm,
+                    cache_dir=cache_dirs[0],
+                    snapshot_dir=snapshot_dir,
+                )
 
             except (OSError, ValueError, KeyError, AttributeError) as e:
                 # Skip assets that can't be processed (common errors during metadata processing)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the time taken to find the tests on a tree of
+Python source files, as done by the "avocado-instrumented" and
+"python-unittest" resolvers, for every file of the tree.
+
+The test classes on every file inherit from a chain of base classes
+("--depth") each one on a module of its own, shared by all files.  The
+tests are found without any caching, with the parsed modules kept in
+memory, and with the persistent discovery cache (after it's populated).
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from avocado.core.safeloader import cache, core, module
+
+BASE = """from {parent_module} import {parent_class}
+
+
+class Base{index}({parent_class}):
+    def test_base_{index}(self):
+        pass
+"""
+
+TEST = """from base{depth} import Base{depth}
+
+
+class Test{index}(Base{depth}):
+    def test_{index}(self):
+        pass
+"""
+
+
+def create_tree(base_dir, number_of_files, depth):
+    for index in range(1, depth + 1):
+        if index == 1:
+            parent_module, parent_class = "avocado", "Test"
+        else:
+            parent_module, parent_class = f"base{index - 1}", f"Base{index - 1}"
+        with open(
+            os.path.join(base_dir, f"base{index}.py"), "w", encoding="utf-8"
+        ) as base_file:
+            base_file.write(
+                BASE.format(
+                    parent_module=parent_module, parent_class=parent_class, index=index
+                )
+            )
+    paths = []
+    for index in range(number_of_files):
+        path = os.path.join(base_dir, f"test_{index}.py")
+        with open(path, "w", encoding="utf-8") as test_file:
+            test_file.write(TEST.format(depth=depth, index=index))
+        paths.append(path)
+    return paths
+
+
+def find(paths, use_cache):
+    tests = 0
+    for path in paths:
+        found, _ = core.find_avocado_tests(path, cache=use_cache)
+        tests += sum(len(methods) for methods in found.values())
+        tests += sum(
+            len(methods)
+            for methods in core.find_python_unittests(path, cache=use_cache).values()
+        )
+    return tests
+
+
+def timed(function, *args):
+    start = time.monotonic()
+    function(*args)
+    return time.monotonic() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        paths = create_tree(base_dir, args.files, args.depth)
+        cache.CACHE_DIR = os.path.join(base_dir, "cache")
+        # pylint: disable=W0212
+        parse = module._parse
+        module._parse = parse.__wrapped__
+        uncached = timed(find, paths, False)
+        module._parse = parse
+        memo = timed(find, paths, False)
+        parse.cache_clear()
+        populate = timed(find, paths, True)
+        parse.cache_clear()
+        persistent = timed(find, paths, True)
+
+    print(
+        f"{args.files} files: {uncached:.2f}s without caching, "
+        f"{memo:.2f}s with parsed modules in memory, "
+        f"{populate:.2f}s populating and {persistent:.2f}s with "
+        f"the discovery cache"
+    )
+
+
+if __name__ == "__main__":
+    main()
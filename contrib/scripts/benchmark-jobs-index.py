@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the time taken to list the jobs in a job results
+directory with many jobs, and to find a job by a partial ID, by reading
+every job results directory (as done without an index) and by using the
+jobs index, both when it's built and when it's up to date.
+"""
+
+import argparse
+import glob
+import json
+import os
+import tempfile
+import time
+
+from avocado.core import jobindex
+from avocado.core.data_dir import _find_job_results_dirs
+from avocado.core.job_id import create_unique_job_id
+
+
+def create_jobs(logs_dir, number):
+    job_ids = []
+    for _ in range(number):
+        job_id = create_unique_job_id()
+        job_dir = os.path.join(logs_dir, f"job-2026-01-01T00.00-{job_id[:7]}")
+        os.mkdir(job_dir)
+        with open(os.path.join(job_dir, "id"), "w", encoding="utf-8") as id_file:
+            id_file.write(f"{job_id}\n")
+        results = {"job_id": job_id, "start": "2026-01-01 00:00:00", "total": 1}
+        results["tests"] = [{"id": f"1-test-{i}", "status": "PASS"} for i in range(50)]
+        with open(
+            os.path.join(job_dir, "results.json"), "w", encoding="utf-8"
+        ) as results_file:
+            json.dump(results, results_file)
+        job_ids.append(job_id)
+    return job_ids
+
+
+def list_without_index(logs_dir):
+    jobs = []
+    for path in glob.glob(os.path.join(logs_dir, "*/results.json")):
+        with open(path, "r", encoding="utf-8") as results_file:
+            jobs.append(json.load(results_file)["job_id"])
+    return jobs
+
+
+def measure(function, *args):
+    start = time.monotonic()
+    function(*args)
+    return time.monotonic() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as logs_dir:
+        job_ids = create_jobs(logs_dir, args.jobs)
+        partial_id = job_ids[-1][:4]
+        print(f"{args.jobs} jobs:")
+        print(f"  list, without index: {measure(list_without_index, logs_dir):.3f}s")
+        print(
+            f"  find, without index: "
+            f"{measure(_find_job_results_dirs, logs_dir, partial_id):.3f}s"
+        )
+        print(f"  list, building index: {measure(jobindex.load, logs_dir):.3f}s")
+        print(f"  list, with index: {measure(jobindex.load, logs_dir):.3f}s")
+        print(
+            f"  find, with index: "
+            f"{measure(jobindex.find, logs_dir, partial_id):.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the latency of probes to the requirements cache,
+with a number of concurrent jobs (processes) probing the same cache.
+
+Each job probes the cache for requirements (half of them saved on the
+cache, half of them not), and also saves a requirement of its own every
+"--write-every" probes.  Probes are done through the asynchronous access
+to the cache, as done by the spawners.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+from avocado.core.dependencies.requirements.cache import AsyncRequirementCache
+from avocado.core.dependencies.requirements.cache.backends import sqlite
+
+ENVIRONMENT_TYPE = "local"
+ENVIRONMENT = "benchmark"
+
+
+async def probe(number_of_probes, write_every, job):
+    cache = AsyncRequirementCache()
+    latencies = []
+    for index in range(number_of_probes):
+        start = time.perf_counter()
+        await cache.is_requirement_in_cache(
+            ENVIRONMENT_TYPE, ENVIRONMENT, "package", f"package-{index % 100}"
+        )
+        latencies.append(time.perf_counter() - start)
+        if write_every and not index % write_every:
+            await cache.set_requirement(
+                ENVIRONMENT_TYPE, ENVIRONMENT, "job", f"{job}-{index}"
+            )
+    return latencies
+
+
+def run_job(database_path, number_of_probes, write_every, job):
+    sqlite.CACHE_DATABASE_PATH = database_path
+    return asyncio.run(probe(number_of_probes, write_every, job))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--probes", type=int, default=2000)
+    parser.add_argument("--write-every", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        database_path = os.path.join(base_dir, "requirements.sqlite")
+        sqlite.CACHE_DATABASE_PATH = database_path
+        sqlite.set_requirements(
+            ENVIRONMENT_TYPE,
+            ENVIRONMENT,
+            [("package", f"package-{index}") for index in range(0, 100, 2)],
+        )
+        sqlite.close()
+
+        start = time.monotonic()
+        with multiprocessing.Pool(args.jobs) as pool:
+            results = pool.starmap(
+                run_job,
+                [
+                    (database_path, args.probes, args.write_every, job)
+                    for job in range(args.jobs)
+                ],
+            )
+        wall = time.monotonic() - start
+
+    latencies = sorted(latency for result in results for latency in result)
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(
+        f"{len(latencies)} probes by {args.jobs} jobs in {wall:.2f}s: "
+        f"mean {statistics.mean(latencies) * 1e6:.0f}us, "
+        f"median {statistics.median(latencies) * 1e6:.0f}us, "
+        f"p99 {p99 * 1e6:.0f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the memory taken by the runnables of a large test
+suite, along with the tasks and runtime tasks created for them when the
+suite is run, as done by the "nrunner" runner.
+
+The runnables are created as done for the tests found by the resolvers,
+that is, with their default configuration filtered from the suite
+configuration.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.task import Task
+from avocado.core.settings import settings
+from avocado.core.task.runtime import RuntimeTask
+
+
+def create(number, kind, config):
+    runtime_tasks = []
+    for index in range(number):
+        runnable = Runnable(kind, f"/bin/true-{index}", tags={"fast": None})
+        runnable.default_config = Runnable.filter_runnable_config(kind, config)
+        runtime_tasks.append(RuntimeTask(Task(runnable, identifier=str(index))))
+    return runtime_tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runnables", type=int, default=100000)
+    parser.add_argument("--kind", default="exec-test")
+    args = parser.parse_args()
+
+    config = settings.as_dict()
+    # populates the caches (such as the one of the settings) before measuring
+    create(1, args.kind, config)
+
+    tracemalloc.start()
+    runtime_tasks = create(args.runnables, args.kind, config)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    configs = {id(rt.task.runnable.default_config) for rt in runtime_tasks}
+    print(
+        f"{len(runtime_tasks)} runnables ({len(configs)} distinct configs): "
+        f"{current / 2**20:.1f} MiB ({current / len(runtime_tasks):.0f} bytes "
+        f"per runnable), with a peak of {peak / 2**20:.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the CPU time spent by runners while monitoring
+tasks that do nothing but wait (that is, the overhead of a running
+task), for "exec-test" and "avocado-instrumented" tests, along with the
+number of messages produced.
+
+The runners are run on this process, so the CPU time of the tests
+themselves (run on child processes) is not accounted for.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from avocado.core.nrunner.runnable import Runnable
+
+INSTRUMENTED = """import time
+
+from avocado import Test
+
+
+class Idle(Test):
+    def test(self):
+        time.sleep({duration})
+"""
+
+
+def measure(runnable):
+    runner = runnable.pick_runner_class()()
+    start = time.monotonic()
+    start_cpu = time.process_time()
+    count = sum(1 for _ in runner.run(runnable))
+    cpu = time.process_time() - start_cpu
+    return cpu, time.monotonic() - start, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as base_dir:
+        test_path = os.path.join(base_dir, "idle.py")
+        with open(test_path, "w", encoding="utf-8") as test_file:
+            test_file.write(INSTRUMENTED.format(duration=args.duration))
+        runnables = [
+            Runnable("exec-test", "/bin/sleep", str(args.duration)),
+            Runnable("avocado-instrumented", f"{test_path}:Idle.test"),
+        ]
+        for runnable in runnables:
+            cpu, elapsed, count = measure(runnable)
+            print(
+                f"{runnable.kind}: {cpu / elapsed:.2%} of a CPU "
+                f"({cpu:.3f}s in {elapsed:.2f}s), {count} messages"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the overhead of the task schedulers (state machine
+and workers implementations selectable with "run.scheduler").
+
+Tasks are "run" by a spawner that performs no real operation, so the
+measured time is the time spent by the scheduler itself moving tasks
+through their life cycle.  Optionally, every test can depend on a
+pre-test task, to also exercise the handling of dependencies.
+"""
+
+import argparse
+import asyncio
+import time
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.task import Task
+from avocado.core.spawners.mock import MockSpawner
+from avocado.core.status.repo import StatusRepo
+from avocado.core.task.runtime import PreRuntimeTask, RuntimeTask
+from avocado.core.task.statemachine import SCHEDULERS
+from avocado.core.utils import messages
+
+JOB_ID = "benchmark"
+
+
+class InstantSpawner(MockSpawner):
+    """Spawner whose tasks finish, with a "pass" result, as soon as spawned."""
+
+    def __init__(self, status_repo):
+        super().__init__()
+        self._status_repo = status_repo
+
+    def is_task_alive(self, runtime_task):  # pylint: disable=W0221
+        return False
+
+    async def spawn_task(self, runtime_task):
+        task_id = str(runtime_task.task.identifier)
+        self._status_repo.process_message(
+            messages.StartedMessage.get(output_dir="", id=task_id, job_id=JOB_ID)
+        )
+        self._status_repo.process_message(
+            messages.FinishedMessage.get("pass", id=task_id, job_id=JOB_ID)
+        )
+        return True
+
+
+def create_tasks(number_of_tasks, with_dependencies):
+    runnable = Runnable("noop", "noop")
+    tasks = []
+    for index in range(number_of_tasks):
+        test = RuntimeTask(Task(runnable, f"test-{index}", job_id=JOB_ID))
+        if with_dependencies:
+            pre = PreRuntimeTask(
+                Task(runnable, f"pre-{index}", category="pre_test", job_id=JOB_ID)
+            )
+            test.dependencies.append(pre)
+            tasks.append(pre)
+        tasks.append(test)
+    return tasks
+
+
+async def run_scheduler(name, tasks, number_of_workers):
+    state_machine_class, worker_class = SCHEDULERS[name]
+    status_repo = StatusRepo(JOB_ID)
+    spawner = InstantSpawner(status_repo)
+    state_machine = state_machine_class(tasks, status_repo)
+    workers = [
+        worker_class(state_machine, spawner, max_running=number_of_workers).run()
+        for _ in range(number_of_workers)
+    ]
+    await asyncio.gather(*workers)
+    return len(state_machine.finished)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--dependencies", action="store_true")
+    parser.add_argument(
+        "--scheduler",
+        action="append",
+        choices=tuple(SCHEDULERS),
+        help="Scheduler to benchmark (may be given multiple times, defaults to all)",
+    )
+    args = parser.parse_args()
+
+    for name in args.scheduler or SCHEDULERS:
+        tasks = create_tasks(args.tasks, args.dependencies)
+        start = time.monotonic()
+        cpu_start = time.process_time()
+        finished = asyncio.run(run_scheduler(name, tasks, args.workers))
+        wall = time.monotonic() - start
+        cpu = time.process_time() - cpu_start
+        print(
+            f"{name:>8}: {finished} tasks finished in {wall:.2f}s "
+            f"(cpu {cpu:.2f}s, {finished / wall:.0f} tasks/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
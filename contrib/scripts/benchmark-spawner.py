@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the time taken by the process spawner to run tasks,
+with runner processes started for each task ("cold") or with warm runners
+("warm", see "spawner.process.warm").
+
+Tasks are run without a status server, so the measured time is the time
+spent starting the runners and running the tasks themselves.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.task import Task
+from avocado.core.settings import settings
+from avocado.core.task.runtime import RuntimeTask
+from avocado.plugins.spawners.process import ProcessSpawner
+
+MODES = {"cold": False, "warm": True}
+
+
+async def run_tasks(spawner, runnable, number_of_tasks, parallel, base_dir):
+    queue = asyncio.Queue()
+    for index in range(number_of_tasks):
+        task = Task(Runnable(runnable.kind, runnable.uri), f"{index}-task")
+        task.setup_output_dir(os.path.join(base_dir, str(index)))
+        queue.put_nowait(RuntimeTask(task))
+
+    async def worker():
+        while not queue.empty():
+            runtime_task = queue.get_nowait()
+            if not await spawner.spawn_task(runtime_task):
+                raise RuntimeError(f"Failed to spawn {runtime_task}")
+            await spawner.wait_task(runtime_task)
+
+    await asyncio.gather(*[worker() for _ in range(parallel)])
+    await spawner.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--parallel", type=int, default=4)
+    parser.add_argument("--kind", default="exec-test")
+    parser.add_argument("--uri", default="/bin/true")
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=tuple(MODES),
+        help="Spawner mode to benchmark (may be given multiple times, defaults to all)",
+    )
+    args = parser.parse_args()
+
+    runnable = Runnable(args.kind, args.uri)
+    for mode in args.mode or MODES:
+        config = settings.as_dict()
+        config["spawner.process.warm"] = MODES[mode]
+        spawner = ProcessSpawner(config)
+        with tempfile.TemporaryDirectory() as base_dir:
+            start = time.monotonic()
+            asyncio.run(
+                run_tasks(spawner, runnable, args.tasks, args.parallel, base_dir)
+            )
+            wall = time.monotonic() - start
+        print(
+            f"{mode:>5}: {args.tasks} tasks run in {wall:.2f}s "
+            f"({args.tasks / wall:.1f} tasks/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
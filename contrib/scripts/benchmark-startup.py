@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the time taken by short lived Avocado commands,
+which is dominated by their startup (the discovery and loading of
+plugins): "avocado --help", "avocado list" and "avocado run" of a single
+test, and the "runnable-run" and "task-run" commands of a runner.
+
+Each command is run a number of times, on new processes, and the best
+and the median wall clock times are reported.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PASSTEST = os.path.join(BASE_DIR, "examples", "tests", "passtest.py")
+
+
+def get_commands(results_dir):
+    avocado = [sys.executable, "-m", "avocado"]
+    runner = [sys.executable, "-m", "avocado.plugins.runners.exec_test"]
+    return {
+        "avocado --help": avocado + ["--help"],
+        "avocado list": avocado + ["list", PASSTEST],
+        "avocado run": avocado
+        + [
+            "run",
+            "--disable-sysinfo",
+            f"--job-results-dir={results_dir}",
+            PASSTEST,
+        ],
+        "runner runnable-run": runner
+        + ["runnable-run", "-k", "exec-test", "-u", "/bin/true"],
+        "runner task-run": runner
+        + ["task-run", "-i", "1", "-k", "exec-test", "-u", "/bin/true"],
+    }
+
+
+def measure(command, runs):
+    times = []
+    for _ in range(runs):
+        start = time.monotonic()
+        subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            cwd=BASE_DIR,
+        )
+        times.append(time.monotonic() - start)
+    return min(times), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as results_dir:
+        for name, command in get_commands(results_dir).items():
+            best, median = measure(command, args.runs)
+            print(f"{name}: best {best:.3f}s, median {median:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the time taken to build a large graph of runtime
+tasks, to compute its topological order, and to drain it (finishing
+all tasks, in order, while checking if their dependents are ready).
+
+By default, every test depends on a pre-test task of its own, so the
+graph has twice as many nodes as tests.  With "--chain", tasks are
+instead put into a single chain, each one depending on the previous.
+"""
+
+import argparse
+import time
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.task import Task
+from avocado.core.task.runtime import (
+    PreRuntimeTask,
+    RuntimeTask,
+    RuntimeTaskGraph,
+    RuntimeTaskStatus,
+)
+
+
+def build_graph(number_of_tests, chain):
+    runnable = Runnable("noop", "noop")
+    graph = RuntimeTaskGraph([], "benchmark", None, "benchmark", "")
+    previous = None
+    for index in range(number_of_tests):
+        test = RuntimeTask(Task(runnable, f"test-{index}"))
+        if chain:
+            if previous is None:
+                graph.graph[test] = test
+            else:
+                # pylint: disable=W0212
+                graph._connect_tasks([previous], [test], [])
+            previous = test
+        else:
+            pre = PreRuntimeTask(Task(runnable, f"pre-{index}", category="pre_test"))
+            graph._connect_tasks([pre], [test], [])  # pylint: disable=W0212
+    return graph
+
+
+def drain(tasks):
+    ready = 0
+    for runtime_task in tasks:
+        runtime_task.status = RuntimeTaskStatus.FINISHED
+        for dependent in runtime_task.dependents:
+            if dependent.are_dependencies_finished():
+                ready += 1
+    return ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tests", type=int, default=100000)
+    parser.add_argument("--chain", action="store_true")
+    args = parser.parse_args()
+
+    start = time.monotonic()
+    graph = build_graph(args.tests, args.chain)
+    built = time.monotonic()
+    tasks = graph.get_tasks_in_topological_order()
+    ordered = time.monotonic()
+    drain(tasks)
+    drained = time.monotonic()
+    print(
+        f"{len(tasks)} tasks: built in {built - start:.2f}s, "
+        f"ordered in {ordered - built:.2f}s, drained in {drained - ordered:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
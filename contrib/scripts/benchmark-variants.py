@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""
+Script that measures the time and memory taken to expand the tests of a
+test suite into one runnable per test and variant, as done when a job
+is created with variants (here given by the "dict_variants" varianter).
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.suite import TestSuite
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tests", type=int, default=500)
+    parser.add_argument("--variants", type=int, default=200)
+    args = parser.parse_args()
+
+    tests = [
+        Runnable(
+            "exec-test",
+            f"/bin/true-{index}",
+            config={"runner.identifier_format": "{uri}"},
+            tags={"fast": None},
+        )
+        for index in range(args.tests)
+    ]
+    config = {
+        "run.dict_variants": [
+            {"index": index, "name": f"variant-{index}"}
+            for index in range(args.variants)
+        ]
+    }
+    suite = TestSuite("benchmark", config=config, tests=tests)
+    # parses the variants before measuring
+    suite.variants.itertests()
+
+    start = time.monotonic()
+    expanded = suite._get_test_variants()  # pylint: disable=W0212
+    elapsed = time.monotonic() - start
+    del expanded
+
+    # the memory is measured apart, as tracing slows down the expansion
+    tracemalloc.start()
+    expanded = suite._get_test_variants()  # pylint: disable=W0212
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{len(expanded)} runnables ({args.tests} tests x {args.variants} "
+        f"variants) in {elapsed:.2f}s, with a peak of {peak / 2**20:.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from multiprocessing import Process, SimpleQueue
 
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import BaseRunner
+from avocado.core.nrunner.runner import BaseRunner, get_queue_waiter
 from avocado.core.utils import messages
 from avocado.utils.process import CmdError, run
 
@@ -53,7 +53,9 @@ class AnsibleModuleRunner(BaseRunner):
         queue = SimpleQueue()
         process = Process(target=self._run_ansible_module, args=(runnable, queue))
         process.start()
-        yield from self.running_loop(lambda: not queue.empty())
+        yield from self.running_loop(
+            lambda: not queue.empty(), wait=get_queue_waiter(queue)
+        )
 
         status = queue.get()
         yield messages.StdoutMessage.get(status["stdout"])
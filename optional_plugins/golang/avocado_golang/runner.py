@@ -3,7 +3,7 @@ import subprocess
 from avocado_golang.golang import GO_BIN
 
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import BaseRunner
+from avocado.core.nrunner.runner import BaseRunner, process_waiter
 from avocado.core.utils import messages
 
 
@@ -67,7 +67,8 @@ class GolangRunner(BaseRunner):
         def poll_proc():
             return process.poll() is not None
 
-        yield from self.running_loop(poll_proc)
+        with process_waiter(process.pid) as wait:
+            yield from self.running_loop(poll_proc, wait=wait)
 
         result = "pass" if process.returncode == 0 else "fail"
         yield messages.StdoutMessage.get(process.stdout.read())
@@ -16,14 +16,13 @@ HTML output module.
 """
 
 import base64
+import importlib.util
 import os
 import platform
 import subprocess
 import sys
 import time
 
-import jinja2 as jinja
-
 from avocado.core import exit_codes
 from avocado.core.output import LOG_UI
 from avocado.core.plugin_interfaces import CLI, Init, Result
@@ -31,6 +30,11 @@ from avocado.core.settings import settings
 from avocado.utils import astring
 from avocado.utils.path import find_command
 
+# jinja2 is slow to import, and it's only needed when rendering.  Still,
+# without it, this plugin fails to load.
+if importlib.util.find_spec("jinja2") is None:
+    raise ImportError("No module named 'jinja2'")
+
 
 class ReportModel:
     """
@@ -221,6 +225,8 @@ class HTMLResult(Result):
 
     @staticmethod
     def _render(result, output_path):
+        import jinja2 as jinja
+
         # Workaround for systems with older versions of jinja2 (before version 3)
         try:
             env = jinja.Environment(
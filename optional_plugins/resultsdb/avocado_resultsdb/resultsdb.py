@@ -16,15 +16,19 @@
 Avocado Plugin to propagate Job results to Resultsdb
 """
 
+import importlib.util
 import os
 import time
 
-import resultsdb_api
-
 from avocado.core.output import LOG_UI
 from avocado.core.plugin_interfaces import CLI, Result, ResultEvents
 from avocado.core.settings import settings
 
+# resultsdb_api is slow to import, so it's only imported when results
+# are to be sent.  Still, without it, this plugin fails to load.
+if importlib.util.find_spec("resultsdb_api") is None:
+    raise ImportError("No module named 'resultsdb_api'")
+
 
 class ResultsdbResultEvent(ResultEvents):
     """
@@ -38,6 +42,8 @@ class ResultsdbResultEvent(ResultEvents):
         self.rdbapi = None
         resultsdb_api_url = config.get("plugins.resultsdb.api_url")
         if resultsdb_api_url is not None:
+            import resultsdb_api
+
             self.rdbapi = resultsdb_api.ResultsDBapi(resultsdb_api_url)
 
         self.rdblogs = config.get("plugins.resultsdb.logs_url")
@@ -16,8 +16,7 @@
 Plugin to run Robot Framework tests in Avocado
 """
 
-from robot.api import TestSuite, get_model
-from robot.output.logger import LOGGER
+import importlib.util
 
 from avocado.core.nrunner.runnable import Runnable
 from avocado.core.plugin_interfaces import Resolver
@@ -27,14 +26,15 @@ from avocado.core.resolver import (
     check_file,
 )
 
-LOGGER.unregister_console_logger()
+# Robot Framework is only imported when there are Robot Framework tests
+# to be found, because importing it is slow, and this plugin is loaded
+# by every command that resolves references.  Still, without it, this
+# plugin fails to load.
+if importlib.util.find_spec("robot") is None:
+    raise ImportError("No module named 'robot'")
 
 
-def find_tests(reference, test_suite):
-
-    model = get_model(reference)
-    data = TestSuite.from_model(model)
-
+def _find_suite_tests(data, test_suite):
     test_suite[data.name] = []
     # data.tests is a list
     for test_case in data.tests:  # pylint: disable=E1133
@@ -44,10 +44,19 @@ def find_tests(reference, test_suite):
 
     # data.suites is a list
     for child_data in data.suites:  # pylint: disable=E1133
-        find_tests(child_data, test_suite)
+        _find_suite_tests(child_data, test_suite)
     return test_suite
 
 
+def find_tests(reference, test_suite):
+    from robot.api import TestSuite, get_model
+    from robot.output.logger import LOGGER
+
+    LOGGER.unregister_console_logger()
+    model = get_model(reference)
+    return _find_suite_tests(TestSuite.from_model(model), test_suite)
+
+
 class RobotResolver(Resolver):
 
     name = "robot"
@@ -23,7 +23,7 @@ import tempfile
 from robot import run
 
 from avocado.core.nrunner.app import BaseRunnerApp
-from avocado.core.nrunner.runner import BaseRunner
+from avocado.core.nrunner.runner import BaseRunner, get_queue_waiter
 from avocado.core.utils import messages
 
 
@@ -95,7 +95,9 @@ class RobotRunner(BaseRunner):
         )
         process.start()
         yield messages.StartedMessage.get()
-        yield from self.running_loop(lambda: not queue.empty())
+        yield from self.running_loop(
+            lambda: not queue.empty(), wait=get_queue_waiter(queue)
+        )
 
         status = queue.get()
         yield messages.StdoutMessage.get(status["stdout"])
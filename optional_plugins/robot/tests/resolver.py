@@ -1,5 +1,6 @@
+import importlib
 import os
-import unittest
+import unittest.mock
 from importlib.metadata import PackageNotFoundError, distribution
 
 import avocado_robot.robot
@@ -53,3 +54,9 @@ class Resolver(unittest.TestCase):
         self.assertEqual(
             sleep.uri, os.path.join(THIS_DIR, "avocado.robot:Avocado.Sleep")
         )
+
+    def test_not_loaded_without_robot(self):
+        with unittest.mock.patch("importlib.util.find_spec", return_value=None):
+            with self.assertRaises(ImportError):
+                importlib.reload(avocado_robot.robot)
+        importlib.reload(avocado_robot.robot)
@@ -1,19 +1,24 @@
 import asyncio
 import contextlib
+import importlib.util
 import json
 import logging
 import os
 import shlex
 import time
 
-from aexpect import exceptions, remote
-
 from avocado.core.plugin_interfaces import Init, Spawner
 from avocado.core.settings import settings
 from avocado.core.spawners.common import SpawnerMixin, SpawnMethod
 
 LOG = logging.getLogger("avocado.job." + __name__)
 
+# aexpect is only imported when actually spawning, because this plugin
+# is loaded by most commands.  Still, without it, this plugin fails to
+# load.
+if importlib.util.find_spec("aexpect") is None:
+    raise ImportError("No module named 'aexpect'")
+
 
 class RemoteSpawnerException(Exception):
     """Errors more closely related to the spawner functionality"""
@@ -87,6 +92,8 @@ class RemoteSpawner(Spawner, SpawnerMixin):
 
     @staticmethod
     def run_remote_cmd(session, command, timeout):
+        from aexpect import exceptions
+
         try:
             status, output = session.cmd_status_output(command, timeout, safe=True)
         except exceptions.ShellTimeoutError:
@@ -112,6 +119,8 @@ class RemoteSpawner(Spawner, SpawnerMixin):
         schedulers to make their own decisions on which hosts to run and when.
         """
         if len(RemoteSpawner.slots_cache) == 0:
+            from aexpect import remote
+
             # TODO: consider whether to provide persistence across runs via external storage
             for session_slot in self.config.get("spawner.remote.slots"):
                 if not session_slot:
@@ -221,6 +230,8 @@ class RemoteSpawner(Spawner, SpawnerMixin):
             await asyncio.sleep(0.1)
 
     async def terminate_task(self, runtime_task):
+        from aexpect import exceptions
+
         session = runtime_task.spawner_handle
         session.sendcontrol("c")
         try:
@@ -27,14 +27,14 @@ TEST_SIZE = {
     "job-api-check-tmp-directory-exists": 1,
     "nrunner-interface": 90,
     "nrunner-requirement": 28,
-    "unit": 1016,
+    "unit": 1111,
     "jobs": 11,
-    "functional-parallel": 368,
+    "functional-parallel": 378,
     "functional-serial": 7,
     "optional-plugins": 0,
     "optional-plugins-golang": 2,
     "optional-plugins-html": 3,
-    "optional-plugins-robot": 3,
+    "optional-plugins-robot": 4,
     "optional-plugins-varianter_cit": 40,
     "optional-plugins-varianter_yaml_to_mux": 50,
     "vmimage-variants": 256,
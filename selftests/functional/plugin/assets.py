@@ -156,6 +156,32 @@ class AssetsFetchSuccess(TestCaseTmpDir):
         result = process.run(cmd_line)
         self.assertIn(name, result.stdout_text)
 
+    def test_asset_verify(self):
+        """Make sure that assets changed behind our back are found."""
+        asset_file = tempfile.NamedTemporaryFile(dir=self.base_dir.name, delete=False)
+        asset_file.write(b"\xff")
+        asset_file.close()
+
+        config = self.config_file.name
+        cmd_line = (
+            f"{AVOCADO} --config {config} assets register verified "
+            f"{asset_file.name}"
+        )
+        process.run(cmd_line)
+        cmd_line = f"{AVOCADO} --config {config} assets verify"
+        result = process.run(cmd_line)
+        self.assertIn("Verified 2 assets, 0 failed", result.stdout_text)
+
+        # changes the contents, but not the size or the modification time
+        stats = os.stat(asset_file.name)
+        with open(asset_file.name, "r+b") as changed_file:
+            changed_file.write(b"\xfe")
+        os.utime(asset_file.name, ns=(stats.st_atime_ns, stats.st_mtime_ns))
+        result = process.run(cmd_line, ignore_status=True)
+        self.assertEqual(result.exit_status, exit_codes.AVOCADO_FAIL)
+        self.assertIn("verified: hash mismatch (sha1)", result.stderr_text)
+        self.assertIn("Verified 2 assets, 1 failed", result.stdout_text)
+
     def test_asset_purge_by_overall_cache_size(self):
         """Make sure that we can set cache limits."""
         # creates a single byte asset
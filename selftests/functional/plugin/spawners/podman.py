@@ -118,6 +118,22 @@ class PodmanSpawnerTest(Test):
         self.assertIn("use_data.sh: STARTED", result.stdout_text)
         self.assertIn("use_data.sh:  PASS", result.stdout_text)
 
+    def test_pool(self):
+        with script.Script(
+            os.path.join(self.workdir, "passtest.py"), TEST_INSTRUMENTED_PASS
+        ) as test:
+            result = process.run(
+                f"{AVOCADO} run "
+                f"--job-results-dir {self.workdir} "
+                f"--disable-sysinfo --spawner=podman "
+                f"--spawner-podman-image=fedora:38 --spawner-podman-pool "
+                f"--max-parallel-tasks=1 -- "
+                f"{test} {test} {test} /bin/true",
+                ignore_status=True,
+            )
+        self.assertEqual(result.exit_status, 0)
+        self.assertIn("RESULTS    : PASS 4 |", result.stdout_text)
+
 
 class OperationalTest(Test):
     def test_not_operational(self):
@@ -34,6 +34,43 @@ class ProcessSpawnerTest(TestCaseTmpDir):
             expected = f"logdir is: {testdir}"
             self.assertIn(expected, debug_file.read())
 
+    def test_warm(self):
+        config = {
+            "resolver.references": [
+                "examples/tests/passtest.py",
+                "examples/tests/failtest.py",
+                "examples/tests/passtest.py",
+                "/bin/true",
+            ],
+            "run.results_dir": self.tmpdir.name,
+            "spawner.process.warm": True,
+            "spawner.process.warm_max_tasks": 2,
+            "sysinfo.collect.enabled": False,
+        }
+
+        with Job.from_config(job_config=config) as job:
+            job.run()
+
+        self.assertEqual(3, job.result.passed)
+        self.assertEqual(1, job.result.failed)
+
+    def test_warm_timeout(self):
+        config = {
+            "resolver.references": ["examples/tests/sleeptenmin.py"],
+            "run.results_dir": self.tmpdir.name,
+            "task.timeout.running": 2,
+            "spawner.process.warm": True,
+            "sysinfo.collect.enabled": False,
+        }
+
+        with Job.from_config(job_config=config) as job:
+            job.run()
+
+        self.assertEqual(1, job.result.interrupted)
+        self.assertEqual(
+            "Test interrupted: Timeout reached", job.result.tests[0]["fail_reason"]
+        )
+
     @unittest.skipUnless(
         python_module_available("avocado-rogue"), "avocado-rogue not available"
     )
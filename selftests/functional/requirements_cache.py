@@ -1,3 +1,4 @@
+import asyncio
 import os
 import unittest.mock
 
@@ -106,3 +107,36 @@ class Cache(TestCaseTmpDir):
                 ],
             }
             self.assertEqual(all_requirements, expected_data)
+
+    def test_cleared(self):
+        with unittest.mock.patch(
+            "avocado.core.dependencies.requirements.cache.backends.sqlite.CACHE_DATABASE_PATH",
+            os.path.join(self.tmpdir.name, "requirements.sqlite"),
+        ):
+            cache.set_requirement(*ENTRIES[0])
+            self.assertTrue(cache.is_requirement_in_cache(*ENTRIES[0]))
+            cache.clear()
+            self.assertFalse(cache.is_requirement_in_cache(*ENTRIES[0]))
+            cache.set_requirement(*ENTRIES[1])
+            self.assertFalse(cache.is_requirement_in_cache(*ENTRIES[0]))
+            self.assertTrue(cache.is_requirement_in_cache(*ENTRIES[1]))
+
+    def test_async(self):
+        async def check(requirement_cache):
+            entry = ENTRIES[1]
+            self.assertFalse(await requirement_cache.is_requirement_in_cache(*entry))
+            await requirement_cache.set_requirement(*entry, False)
+            self.assertIsNone(await requirement_cache.is_requirement_in_cache(*entry))
+            await requirement_cache.update_requirement_status(*entry, True)
+            self.assertTrue(await requirement_cache.is_requirement_in_cache(*entry))
+            # saved requirements are remembered, even if gone from the cache
+            cache.delete_requirement(*entry)
+            self.assertTrue(await requirement_cache.is_requirement_in_cache(*entry))
+            await requirement_cache.delete_requirement(*entry)
+            self.assertFalse(await requirement_cache.is_requirement_in_cache(*entry))
+
+        with unittest.mock.patch(
+            "avocado.core.dependencies.requirements.cache.backends.sqlite.CACHE_DATABASE_PATH",
+            os.path.join(self.tmpdir.name, "requirements.sqlite"),
+        ):
+            asyncio.run(check(cache.AsyncRequirementCache()))
@@ -1,6 +1,10 @@
+import glob
+import hashlib
+import http.server
 import os
 import tempfile
-import unittest
+import threading
+import unittest.mock
 
 from avocado.utils import asset
 from avocado.utils.filelock import FileLock
@@ -214,5 +218,112 @@ class TestAsset(TestCaseTmpDir):
             a.get_metadata()
 
 
+class RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serves CONTENT, supporting range requests, under "/good/".
+
+    Under "/broken/", the connection is closed midway the contents.
+    """
+
+    CONTENT = os.urandom(256 * 1024)
+
+    def do_GET(self):  # pylint: disable=C0103
+        self.server.ranges.append(self.headers.get("Range"))
+        if self.path.startswith("/broken/"):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(self.CONTENT)))
+            self.end_headers()
+            self.wfile.write(self.CONTENT[: len(self.CONTENT) // 2])
+            return
+        start = 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"][len("bytes=") :].rstrip("-"))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {start}-{len(self.CONTENT) - 1}/{len(self.CONTENT)}",
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(self.CONTENT) - start))
+        self.end_headers()
+        self.wfile.write(self.CONTENT[start:])
+
+    def log_message(self, *args):  # pylint: disable=W0221
+        pass
+
+
+class Download(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), RangeRequestHandler
+        )
+        self.server.ranges = []
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.cache_dir = os.path.join(self.tmpdir.name, "cache")
+        self.asset_hash = hashlib.sha1(RangeRequestHandler.CONTENT).hexdigest()
+
+    def test_resume_from_mirror(self):
+        fetched = asset.Asset(
+            "foo.tgz",
+            asset_hash=self.asset_hash,
+            locations=[
+                f"{self.base_url}/broken/foo.tgz",
+                f"{self.base_url}/good/foo.tgz",
+            ],
+            cache_dirs=[self.cache_dir],
+        ).fetch()
+        with open(fetched, "rb") as fetched_file:
+            self.assertEqual(fetched_file.read(), RangeRequestHandler.CONTENT)
+        self.assertEqual(
+            self.server.ranges,
+            [None, f"bytes={len(RangeRequestHandler.CONTENT) // 2}-"],
+        )
+        self.assertFalse(os.path.exists(f"{fetched}{asset.PARTIAL_SUFFIX}"))
+
+    def test_hashed_while_downloading(self):
+        with unittest.mock.patch("avocado.utils.crypto.hash_file") as hash_file:
+            fetched = asset.Asset(
+                f"{self.base_url}/good/foo.tgz",
+                asset_hash=self.asset_hash,
+                cache_dirs=[self.cache_dir],
+            ).fetch()
+        hash_file.assert_not_called()
+        self.assertEqual(
+            asset.Asset.read_hash_from_file(f"{fetched}-CHECKSUM"),
+            ["sha1", self.asset_hash],
+        )
+
+    def test_no_resume_without_hash(self):
+        fetched = asset.Asset(
+            "foo.tgz",
+            locations=[
+                f"{self.base_url}/broken/foo.tgz",
+                f"{self.base_url}/good/foo.tgz",
+            ],
+            cache_dirs=[self.cache_dir],
+        ).fetch()
+        with open(fetched, "rb") as fetched_file:
+            self.assertEqual(fetched_file.read(), RangeRequestHandler.CONTENT)
+        self.assertEqual(self.server.ranges, [None, None])
+
+    def test_no_partial_without_hash(self):
+        with self.assertRaises(OSError):
+            asset.Asset(
+                "foo.tgz",
+                locations=[f"{self.base_url}/broken/foo.tgz"],
+                cache_dirs=[self.cache_dir],
+            ).fetch()
+        partials = glob.glob(
+            os.path.join(self.cache_dir, "**", f"*{asset.PARTIAL_SUFFIX}"),
+            recursive=True,
+        )
+        self.assertEqual(partials, [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+from avocado.core.utils import entry_points
+from selftests.utils import TestCaseTmpDir
+
+GROUP = "avocado.plugins.selftests"
+
+
+class EntryPointsIndex(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.site_dir = os.path.join(self.tmpdir.name, "site")
+        os.mkdir(self.site_dir)
+        patches = (
+            mock.patch.object(sys, "path", [self.site_dir] + sys.path),
+            mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmpdir.name}),
+            mock.patch.dict(entry_points._INDEXES, clear=True),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _install(self, name, entries):
+        dist_info = os.path.join(self.site_dir, f"{name}-1.0.dist-info")
+        os.makedirs(dist_info, exist_ok=True)
+        with open(
+            os.path.join(dist_info, "METADATA"), "w", encoding="utf-8"
+        ) as metadata:
+            metadata.write(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+        path = os.path.join(dist_info, "entry_points.txt")
+        with open(path, "w", encoding="utf-8") as entry_points_file:
+            entry_points_file.write(f"[{GROUP}]\n")
+            for entry in entries:
+                entry_points_file.write(f"{entry}\n")
+        return path
+
+    def _get_entries(self):
+        return [(ep.name, ep.value) for ep in entry_points.get_entry_points_for(GROUP)]
+
+    def test_cache(self):
+        path = self._install("first", ["one = os.path:join"])
+        self.assertEqual(self._get_entries(), [("one", "os.path:join")])
+        self.assertIn(GROUP, entry_points.get_entry_point_groups())
+        entry_points._INDEXES.clear()
+        with mock.patch.object(entry_points, "_eps_raw", side_effect=AssertionError):
+            self.assertEqual(self._get_entries(), [("one", "os.path:join")])
+
+        # a changed distribution invalidates the index on disk
+        entry_points._INDEXES.clear()
+        self._install("first", ["one = os.path:join", "two = os.path:split"])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        self.assertEqual(
+            self._get_entries(), [("one", "os.path:join"), ("two", "os.path:split")]
+        )
+
+    def test_dedup(self):
+        self._install("first", ["one = os.path:join"])
+        self._install("second", ["one = os.path:join", "two = os.path:split"])
+        self.assertEqual(
+            sorted(self._get_entries()),
+            [("one", "os.path:join"), ("two", "os.path:split")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
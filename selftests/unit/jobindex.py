@@ -0,0 +1,108 @@
+import json
+import os
+import shutil
+import types
+import unittest
+
+from avocado.core import jobindex
+from avocado.core.result import Result
+from selftests.utils import TestCaseTmpDir
+
+
+class JobIndex(TestCaseTmpDir):
+    def _create_job_dir(self, job_id, results=None):
+        name = f"job-2026-01-01T00.00-{job_id[:7]}"
+        job_dir = os.path.join(self.tmpdir.name, name)
+        os.mkdir(job_dir)
+        with open(os.path.join(job_dir, "id"), "w", encoding="utf-8") as id_file:
+            id_file.write(f"{job_id}\n")
+        if results is not None:
+            with open(
+                os.path.join(job_dir, "results.json"), "w", encoding="utf-8"
+            ) as results_file:
+                json.dump(results, results_file)
+        return job_dir
+
+    def _finished_job(self, job_id):
+        result = Result(job_id, None, "2026-01-01 00:00:00")
+        result.tests_total = 2
+        result.check_test({"status": "PASS"})
+        result.check_test({"status": "FAIL"})
+        return types.SimpleNamespace(
+            unique_id=job_id,
+            logdir=self._create_job_dir(job_id),
+            result=result,
+        )
+
+    def test_load_from_disk(self):
+        self._create_job_dir("a" * 40, {"start": "yesterday", "total": 1, "pass": 1})
+        self._create_job_dir("b" * 40)
+        entries = jobindex.load(self.tmpdir.name)
+        self.assertEqual([entry["id"] for entry in entries], ["a" * 40, "b" * 40])
+        self.assertEqual(entries[0]["start"], "yesterday")
+        self.assertEqual(entries[0]["pass"], 1)
+        self.assertIsNone(entries[0]["failures"])
+        self.assertNotIn("total", entries[1])
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.tmpdir.name, jobindex.INDEX_FILENAME))
+        )
+
+    def test_record(self):
+        job = self._finished_job("a" * 40)
+        jobindex.record(job)
+        # there's no index to append to, so the job dir is read instead
+        self.assertNotIn("total", jobindex.load(self.tmpdir.name)[0])
+        jobindex.record(job)
+        job = self._finished_job("b" * 40)
+        jobindex.record(job)
+        entries = jobindex.load(self.tmpdir.name)
+        self.assertEqual(len(entries), 2)
+        for entry in entries:
+            self.assertEqual(entry["total"], 2)
+            self.assertEqual(entry["pass"], 1)
+            self.assertEqual(entry["failures"], 1)
+
+    def test_refresh(self):
+        first = self._create_job_dir("a" * 40)
+        self.assertEqual(len(jobindex.load(self.tmpdir.name)), 1)
+        self._create_job_dir("b" * 40)
+        shutil.rmtree(first)
+        entries = jobindex.load(self.tmpdir.name)
+        self.assertEqual([entry["id"] for entry in entries], ["b" * 40])
+
+    def test_rebuild(self):
+        self._create_job_dir("a" * 40)
+        index_path = os.path.join(self.tmpdir.name, jobindex.INDEX_FILENAME)
+        with open(index_path, "w", encoding="utf-8") as index:
+            index.write('{"id": "c", "path": "job-2026-01-01T00.00-aaaaaaa"}\n')
+            index.write("not json\n")
+        os.utime(index_path)
+        self.assertEqual(jobindex.load(self.tmpdir.name)[0]["id"], "c")
+        entries = jobindex.load(self.tmpdir.name, rebuild=True)
+        self.assertEqual([entry["id"] for entry in entries], ["a" * 40])
+
+    def test_record_keeps_unindexed(self):
+        self._create_job_dir("a" * 40)
+        jobindex.load(self.tmpdir.name)
+        index_path = os.path.join(self.tmpdir.name, jobindex.INDEX_FILENAME)
+        stat = os.stat(index_path)
+        # the index must look older than the directory created next
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        second = self._create_job_dir("b" * 40)
+        jobindex.record(self._finished_job("c" * 40))
+        self.assertEqual(jobindex.find(self.tmpdir.name, "bbbb"), [second])
+        entries = jobindex.load(self.tmpdir.name)
+        self.assertEqual(
+            sorted(entry["id"] for entry in entries), ["a" * 40, "b" * 40, "c" * 40]
+        )
+
+    def test_find(self):
+        first = self._create_job_dir("abc" + "0" * 37)
+        second = self._create_job_dir("abd" + "0" * 37)
+        self.assertEqual(jobindex.find(self.tmpdir.name, "ab"), [first, second])
+        self.assertEqual(jobindex.find(self.tmpdir.name, "abd"), [second])
+        self.assertEqual(jobindex.find(self.tmpdir.name, "abe"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
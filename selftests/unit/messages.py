@@ -0,0 +1,102 @@
+import os
+import unittest
+
+from avocado.core.messages import (
+    MAX_LINE_BUFFER_SIZE,
+    FileHandlePool,
+    StdoutMessageHandler,
+)
+from selftests.utils import TestCaseTmpDir
+
+
+class FileHandlePoolTest(TestCaseTmpDir):
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def _read(self, name):
+        with open(self._path(name), "rb") as fp:
+            return fp.read()
+
+    def test_reuse(self):
+        pool = FileHandlePool()
+        for _ in range(3):
+            pool.write("task", self._path("debug.log"), b"line\n")
+        self.assertEqual((pool.hits, pool.misses), (2, 1))
+        self.assertAlmostEqual(pool.hit_ratio, 2 / 3)
+        pool.close()
+        self.assertEqual(self._read("debug.log"), b"line\n" * 3)
+
+    def test_eviction(self):
+        pool = FileHandlePool(max_size=2)
+        for name in ("a", "b", "c", "a"):
+            pool.write("task", self._path(name), name.encode())
+        self.assertEqual(pool.evictions, 2)
+        self.assertEqual(self._read("b"), b"b")
+        pool.close()
+        self.assertEqual(self._read("a"), b"aa")
+
+    def test_close_task(self):
+        pool = FileHandlePool()
+        pool.write("task1", self._path("a"), b"a")
+        pool.write("task2", self._path("b"), b"b")
+        pool.close_task("task1")
+        self.assertEqual(self._read("a"), b"a")
+        self.assertEqual(self._read("b"), b"")
+        pool.close()
+        self.assertEqual(self._read("b"), b"b")
+
+
+class Task:
+    def __init__(self, identifier, task_path):
+        self.identifier = identifier
+        self.metadata = {"task_path": task_path}
+
+
+class LineBufferTest(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.handler = StdoutMessageHandler()
+        self.tasks = []
+        for identifier in ("1", "2"):
+            task_path = os.path.join(self.tmpdir.name, identifier)
+            os.mkdir(task_path)
+            self.tasks.append(Task(identifier, task_path))
+
+    def _stdout(self, task, log):
+        message = {"status": "running", "type": "stdout", "log": log}
+        self.handler.handle(message, task, None)
+
+    def _read(self, task, name="debug.log"):
+        with open(os.path.join(task.metadata["task_path"], name), "rb") as fp:
+            return fp.read()
+
+    def test_interleaved_tasks(self):
+        task1, task2 = self.tasks
+        self._stdout(task1, b"first ")
+        self._stdout(task2, b"other ")
+        self._stdout(task1, b"line\n")
+        self._stdout(task2, b"line\n")
+        self.assertEqual(self._read(task1), b"[stdout] first line\n")
+        self.assertEqual(self._read(task2), b"[stdout] other line\n")
+
+    def test_flush_task(self):
+        task = self.tasks[0]
+        self._stdout(task, b"complete\nincomplete")
+        self.assertEqual(self._read(task), b"[stdout] complete\n")
+        self.handler.flush_task(task)
+        self.assertEqual(self._read(task), b"[stdout] complete\n[stdout] incomplete\n")
+        self.assertEqual(self.handler.line_buffers, {})
+
+    def test_long_line(self):
+        task = self.tasks[0]
+        self._stdout(task, b"x" * MAX_LINE_BUFFER_SIZE)
+        self.assertEqual(self.handler.line_buffers, {"1": b"x" * MAX_LINE_BUFFER_SIZE})
+        self._stdout(task, b"x")
+        self.assertEqual(self.handler.line_buffers, {})
+        self.assertEqual(
+            self._read(task), b"[stdout] " + b"x" * (MAX_LINE_BUFFER_SIZE + 1) + b"\n"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
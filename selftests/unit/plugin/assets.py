@@ -3,7 +3,7 @@ Assets plugin unit tests
 """
 
 import ast
-import unittest
+import unittest.mock
 from unittest.mock import mock_open, patch
 
 from avocado.plugins import assets
@@ -104,6 +104,28 @@ class AssetsPlugin(unittest.TestCase):
         self.assertEqual(expected_success, success)
         self.assertEqual(expected_fail, fail)
 
+    def test_fetch_asset_calls_unique(self):
+        """
+        Exercise the fetch of the same asset by different calls.
+        """
+        call = {
+            "name": "success.tar.gz",
+            "locations": ["https://localhost/success.tar.gz"],
+            "asset_hash": None,
+            "algorithm": None,
+            "expire": None,
+        }
+        other = dict(call, name="other.tar.gz")
+        logger = unittest.mock.Mock()
+        with patch("avocado.plugins.assets.Asset") as mocked_asset:
+            success, fail = assets.fetch_asset_calls(
+                [call, other, dict(call)], workers=2, logger=logger
+            )
+        self.assertEqual(sorted(success), ["other.tar.gz", "success.tar.gz"])
+        self.assertEqual(fail, [])
+        self.assertEqual(mocked_asset.return_value.fetch.call_count, 2)
+        self.assertEqual(logger.info.call_count, 3)
+
 
 TEST_CLASS_SOURCE = r"""
 from avocado import Test
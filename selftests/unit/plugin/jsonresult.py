@@ -1,11 +1,12 @@
+import io
 import json
 import os
 import unittest
 
 from avocado import Test
-from avocado.core import job
+from avocado.core import exit_codes, job
 from avocado.core.result import Result
-from avocado.plugins import jsonresult
+from avocado.plugins import jobs, jsonresult
 from selftests.utils import TestCaseTmpDir, setup_avocado_loggers
 
 setup_avocado_loggers()
@@ -109,6 +110,84 @@ class JSONResultTest(TestCaseTmpDir):
         check_item("[skip]", res["skip"], 0)
         check_item("[pass]", res["pass"], 1)
 
+    def test_dump(self):
+        self.test_result.tests_total = 2
+        self.test_result.start_test(self.test1)
+        self.test_result.check_test(self.test1.get_state())
+        self.test_result.check_test({"status": "FAIL", "fail_reason": "a\nb"})
+        self.test_result.end_tests()
+        json_file = io.StringIO()
+        jsonresult.JSONResult.dump(self.test_result, json_file)
+        self.assertEqual(
+            json_file.getvalue(), jsonresult.JSONResult._render(self.test_result)
+        )
+
+    def test_dump_no_tests(self):
+        self.test_result.end_tests()
+        json_file = io.StringIO()
+        jsonresult.JSONResult.dump(self.test_result, json_file)
+        self.assertEqual(
+            json_file.getvalue(), jsonresult.JSONResult._render(self.test_result)
+        )
+
+    def test_stream(self):
+        self.job.config["job.run.result.jsonl.enabled"] = True
+        self.job.result.tests_total = 3
+        stream = jsonresult.JSONLinesResult(self.job.config)
+        stream.pre_tests(self.job)
+        for status in ("PASS", "FAIL"):
+            state = self.test1.get_state()
+            state["status"] = status
+            self.job.result.check_test(state)
+            stream.end_test(self.job.result, state)
+        stream.post_tests(self.job)
+        self.job.result.end_tests()
+
+        path = os.path.join(self.job.logdir, jsonresult.JSON_LINES_FILENAME)
+        loaded = jsonresult.load_results_stream(path)
+        self.assertEqual(
+            jsonresult.JSONResult._render(loaded),
+            jsonresult.JSONResult._render(self.job.result),
+        )
+        self.assertEqual(loaded.tests[1]["class_name"], "SimpleTest")
+
+        # a stream whose last record was not completely written
+        with open(path, "r+", encoding="utf-8") as stream_file:
+            stream_file.truncate(os.path.getsize(path) - 10)
+        loaded = jsonresult.load_results_stream(path)
+        self.assertEqual(len(loaded.tests), 1)
+        self.assertEqual(loaded.tests_total, 3)
+        self.assertEqual(loaded.passed, 1)
+        self.assertEqual(loaded.skipped, 2)
+
+    def test_stream_no_header(self):
+        path = os.path.join(self.job.logdir, jsonresult.JSON_LINES_FILENAME)
+        with open(
+            os.path.join(self.job.logdir, "id"), "w", encoding="utf-8"
+        ) as id_file:
+            id_file.write(f"{self.job.unique_id}\n")
+        config = {"jobs.regenerate.job_id": self.job.logdir}
+        for content in ("", '{"job_id": "'):
+            with open(path, "w", encoding="utf-8") as stream_file:
+                stream_file.write(content)
+            with self.assertRaises(ValueError):
+                jsonresult.load_results_stream(path)
+            self.assertEqual(
+                jobs.Jobs.handle_regenerate_command(config),
+                exit_codes.AVOCADO_GENERIC_CRASH,
+            )
+        self.assertFalse(os.path.exists(os.path.join(self.job.logdir, "results.xml")))
+
+    def test_stream_disabled(self):
+        self.job.config["job.run.result.jsonl.enabled"] = False
+        self.job.result.tests_total = 1
+        stream = jsonresult.JSONLinesResult(self.job.config)
+        stream.pre_tests(self.job)
+        stream.end_test(self.job.result, self.test1.get_state())
+        stream.post_tests(self.job)
+        path = os.path.join(self.job.logdir, jsonresult.JSON_LINES_FILENAME)
+        self.assertFalse(os.path.exists(path))
+
     def tearDown(self):
         self.job.cleanup()
         super().tearDown()
@@ -1,10 +1,17 @@
 import asyncio
+import json
 import unittest
 
 from avocado.core.nrunner.runnable import Runnable
 from avocado.core.nrunner.task import Task
+from avocado.core.settings import settings
 from avocado.core.spawners.mock import MockRandomAliveSpawner, MockSpawner
 from avocado.core.task.runtime import RuntimeTask
+from avocado.plugins.spawners.podman import (
+    ContainerStateTracker,
+    PodmanSpawner,
+    PooledContainer,
+)
 from avocado.plugins.spawners.process import ProcessSpawner, ProcessSpawnerHandle
 
 
@@ -97,5 +104,144 @@ class RandomMock(Mock):
         self.assertTrue(finished)
 
 
+class FakePodman:
+    """Reports the given events, and lists the given containers."""
+
+    def __init__(self, events=None, containers=None):
+        self._events = events or []
+        self.containers = containers or []
+        self.executed = []
+
+    async def events(self, filters=None, since=None):  # pylint: disable=W0613
+        for event in self._events:
+            await asyncio.sleep(0)
+            yield event
+        await asyncio.sleep(float("inf"))
+
+    async def execute(self, *args):
+        self.executed.append(args)
+        return 0, json.dumps(self.containers).encode(), b""
+
+
+class PodmanContainerStates(unittest.TestCase):
+    def _run(self, podman, coroutine):
+        tracker = ContainerStateTracker(podman)
+        tracker.RECONCILE_INTERVAL = 0.01
+        tracker.RECONCILE_INTERVAL_NO_EVENTS = 0.01
+
+        async def run():
+            try:
+                return await asyncio.wait_for(coroutine(tracker), 5)
+            finally:
+                await tracker.close()
+
+        return asyncio.run(run())
+
+    def test_events(self):
+        podman = FakePodman(
+            [
+                {"ID": "other", "Status": "died"},
+                {"ID": "c1", "Status": "start"},
+                {"ID": "c1", "Status": "died"},
+            ],
+            # reconciliation alone would never see it exiting
+            [{"Id": "c1", "State": "running"}],
+        )
+
+        async def follow(tracker):
+            tracker.add("c1")
+            tracker.start()
+            self.assertFalse(tracker.is_running("c1"))
+            await tracker.wait("c1")
+            return tracker.is_running("c1")
+
+        self.assertFalse(self._run(podman, follow))
+
+    def test_running(self):
+        podman = FakePodman([{"ID": "c1", "Status": "start"}])
+
+        async def follow(tracker):
+            tracker.add("c1")
+            tracker.start()
+            while not tracker.is_running("c1"):
+                await asyncio.sleep(0)
+            return tracker.is_running("c1")
+
+        self.assertTrue(self._run(podman, follow))
+        self.assertEqual(podman.executed, [])
+
+    def test_reconcile(self):
+        podman = FakePodman(
+            containers=[
+                {"Id": "c1", "State": "exited"},
+                {"Id": "c2", "State": "running"},
+            ]
+        )
+
+        async def follow(tracker):
+            for container_id in ("c1", "c2", "c3"):
+                tracker.add(container_id)
+            await tracker.wait("c1")
+            await tracker.wait("c3")
+            return tracker.is_running("c2")
+
+        self.assertTrue(self._run(podman, follow))
+        # the state of all containers is asked for at once
+        self.assertEqual(
+            sorted(podman.executed[0][3:]),
+            ["--filter=id=c1", "--filter=id=c2", "--filter=id=c3"],
+        )
+
+
+class PodmanPool(unittest.TestCase):
+    def setUp(self):
+        config = settings.as_dict()
+        config["spawner.podman.pool"] = True
+        config["spawner.podman.pool_size"] = 1
+        config["spawner.podman.pool_max_tasks"] = 2
+        self.spawner = PodmanSpawner(config)
+        self.podman = FakePodman()
+        self.spawner._podman = self.podman  # pylint: disable=W0212
+
+    def _container(self, container_id):
+        container = PooledContainer(container_id, "key")
+        self.spawner._pool_containers.add(container)  # pylint: disable=W0212
+        return container
+
+    def test_reuse(self):
+        first = self._container("c1")
+        second = self._container("c2")
+
+        async def run():
+            # pylint: disable=W0212
+            first.tasks_run = 1
+            await self.spawner._release_pooled_container(first, True)
+            # the pool is full
+            await self.spawner._release_pooled_container(second, True)
+            return await self.spawner._get_pooled_container("key", {})
+
+        self.assertIs(asyncio.run(run()), first)
+        self.assertEqual(self.podman.executed, [("rm", "--force", "c2")])
+
+    def test_recycle(self):
+        used = self._container("c1")
+        failed = self._container("c2")
+        idle = self._container("c3")
+
+        async def run():
+            # pylint: disable=W0212
+            used.tasks_run = 2
+            await self.spawner._release_pooled_container(used, True)
+            await self.spawner._release_pooled_container(failed, False)
+            await self.spawner._release_pooled_container(idle, True)
+            await self.spawner.close()
+
+        asyncio.run(run())
+        self.assertEqual(
+            self.podman.executed,
+            [("rm", "--force", "c1"), ("rm", "--force", "c2"), ("rm", "--force", "c3")],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
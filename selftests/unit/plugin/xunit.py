@@ -1,6 +1,6 @@
 import os
 import tempfile
-import unittest
+import unittest.mock
 from xml.dom import minidom
 
 from avocado import Test
@@ -163,6 +163,26 @@ class xUnitSucceedTest(unittest.TestCase):
         self.assertNotIn(b"0987654321", limited)
         self.assertIn(b"54321", limited)
 
+    def test_log_cdata(self):
+        log = tempfile.NamedTemporaryFile(dir=self.tmpdir.name, delete=False)
+        log_content = b"a]]>b]]]>c]]"
+        log.write(log_content)
+        log.close()
+        self.test1._Test__status = "ERROR"
+        self.test1._Test__logfile = log.name
+        self.test_result.start_test(self.test1)
+        self.test_result.end_test(self.test1.get_state())
+        self.test_result.end_tests()
+        for chunk_size in (1, 2, 3, 2**16):
+            with unittest.mock.patch.object(xunit, "LOG_CHUNK_SIZE", chunk_size):
+                xml = xunit.XUnitResult()._render(self.test_result, None, None)
+            dom = minidom.parseString(xml)
+            system_out = dom.getElementsByTagName("system-out")[0]
+            self.assertEqual(
+                "".join(node.data for node in system_out.childNodes),
+                log_content.decode(),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,10 @@
 import os
+import pickle
 import stat
 import unittest.mock
 
 from avocado.core import resolver
+from avocado.core.settings import settings
 from avocado.utils import script
 
 #: What is commonly known as "0664" or "u=rw,g=rw,o=r"
@@ -248,6 +250,62 @@ class PassTest(Test):
             self.assertEqual(len(result[0].resolutions), 0)
 
 
+class ParallelResolution(unittest.TestCase):
+    @staticmethod
+    def _summarize(resolutions):
+        return [
+            (
+                resolution.reference,
+                resolution.result,
+                resolution.origin,
+                [runnable.uri for runnable in resolution.resolutions],
+            )
+            for resolution in resolutions
+        ]
+
+    def test_same_as_sequential(self):
+        references = [
+            os.path.join("selftests", ".data", "safeloader", "data"),
+            os.path.join("examples", "tests", "passtest.py"),
+            os.path.join("examples", "tests", "passtest.py:PassTest.test"),
+            "/does/not/exist",
+        ]
+        sequential = resolver.resolve(references, config={"resolver.workers": 1})
+        parallel = resolver.resolve(references, config={"resolver.workers": 2})
+        self.assertEqual(self._summarize(parallel), self._summarize(sequential))
+        self.assertEqual(
+            parallel[-1].result, resolver.ReferenceResolutionResult.NOTFOUND
+        )
+
+    def test_number_of_workers(self):
+        # pylint: disable=W0212
+        self.assertEqual(resolver._get_number_of_workers(None, 1000), 1)
+        self.assertEqual(resolver._get_number_of_workers({}, 1000), 1)
+        config = {"resolver.workers": 4}
+        self.assertEqual(resolver._get_number_of_workers(config, 1000), 4)
+        self.assertEqual(resolver._get_number_of_workers(config, 2), 2)
+        config = {"resolver.workers": 0}
+        with unittest.mock.patch("os.cpu_count", return_value=8):
+            self.assertEqual(resolver._get_number_of_workers(config, 1000), 8)
+            self.assertEqual(resolver._get_number_of_workers(config, 32), 2)
+            self.assertEqual(resolver._get_number_of_workers(config, 10), 1)
+
+    def test_serial_by_default(self):
+        config = settings.as_dict()
+        self.assertEqual(config.get("resolver.workers"), 1)
+        references = [os.path.join("examples", "tests", "passtest.py")] * 64
+        with unittest.mock.patch(
+            "avocado.core.resolver.ProcessPoolExecutor"
+        ) as executor:
+            resolutions = resolver.resolve(references, config=config)
+        executor.assert_not_called()
+        self.assertEqual(len(resolutions), 64)
+
+    def test_pickled_result(self):
+        for result in resolver.ReferenceResolutionResult:
+            self.assertIs(pickle.loads(pickle.dumps(result)), result)
+
+
 class Resolver(unittest.TestCase):
     def _check(self, exps, runnables):
         len_msg = (
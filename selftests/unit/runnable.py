@@ -67,7 +67,8 @@ class RunnableFromAPI(unittest.TestCase):
             "-u",
             "uri",
             "-c",
-            '{"runner.identifier_format": "{uri}"}',
+            '{"run.status_server_protocol": "json", '
+            '"runner.identifier_format": "{uri}"}',
             "-a",
             "arg1",
             "-a",
@@ -83,7 +84,10 @@ class RunnableFromAPI(unittest.TestCase):
                 "kind": "noop",
                 "uri": "_uri_",
                 "args": ("arg1", "arg2"),
-                "config": {"runner.identifier_format": "{uri}"},
+                "config": {
+                    "run.status_server_protocol": "json",
+                    "runner.identifier_format": "{uri}",
+                },
                 "identifier": "_uri_",
             },
         )
@@ -93,7 +97,8 @@ class RunnableFromAPI(unittest.TestCase):
         expected = (
             '{"kind": "noop", '
             '"uri": "_uri_", '
-            '"config": {"runner.identifier_format": "{uri}"}, '
+            '"config": {"run.status_server_protocol": "json", '
+            '"runner.identifier_format": "{uri}"}, '
             '"identifier": "_uri_", '
             '"args": ["arg1", "arg2"]}'
         )
@@ -153,6 +158,7 @@ class RunnableFromRecipe(unittest.TestCase):
             set(
                 [
                     "run.keep_tmp",
+                    "run.status_server_protocol",
                     "runner.exectest.exitcodes.skip",
                     "runner.exectest.clear_env",
                     "runner.identifier_format",
@@ -184,6 +190,36 @@ class RunnableFromRecipe(unittest.TestCase):
             runnable.default_config.get("runner.identifier_format"), "{uri}"
         )
 
+    def test_default_config_interned(self):
+        first = Runnable("exec-test", "/bin/true")
+        second = Runnable("exec-test", "/bin/false")
+        self.assertIs(first.default_config, second.default_config)
+        self.assertIsNot(first.default_config, Runnable("noop", "noop").default_config)
+        changed = Runnable.filter_runnable_config(
+            "exec-test", {"runner.identifier_format": "{uri}-{args}"}
+        )
+        self.assertIsNot(first.default_config, changed)
+        self.assertEqual(changed["runner.identifier_format"], "{uri}-{args}")
+
+    def test_interned_configs_bounded(self):
+        with unittest.mock.patch.object(
+            runnable_mod, "INTERNED_CONFIGS_MAX", 2
+        ), unittest.mock.patch.dict(runnable_mod._INTERNED_CONFIGS, clear=True):
+            first = Runnable.filter_runnable_config(
+                "exec-test", {"runner.identifier_format": "1"}
+            )
+            for identifier_format in ("2", "3"):
+                Runnable.filter_runnable_config(
+                    "exec-test", {"runner.identifier_format": identifier_format}
+                )
+            self.assertEqual(len(runnable_mod._INTERNED_CONFIGS), 2)
+            self.assertIsNot(
+                Runnable.filter_runnable_config(
+                    "exec-test", {"runner.identifier_format": "1"}
+                ),
+                first,
+            )
+
     def test_identifier(self):
         open_mocked = unittest.mock.mock_open(
             read_data=(
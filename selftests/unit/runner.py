@@ -1,7 +1,11 @@
+import multiprocessing
+import subprocess
 import sys
+import time
 import unittest
 
 from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.runner import get_queue_waiter, process_waiter
 from selftests.utils import skipUnlessPathExists
 
 
@@ -52,6 +56,23 @@ class Runner(unittest.TestCase):
         self.assertEqual(last_result["returncode"], 0)
         self.assertIn("time", last_result)
 
+    def test_runner_exec_test_output_chunks(self):
+        runnable = Runnable(
+            "exec-test",
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.write('x' * (2 ** 17 + 1))",
+        )
+        runner_klass = runnable.pick_runner_class()
+        runner = runner_klass()
+        results = [status for status in runner.run(runnable)]
+        stdout_chunks = [
+            result["log"] for result in results if result.get("type") == "stdout"
+        ]
+        self.assertEqual(b"".join(stdout_chunks), b"x" * (2**17 + 1))
+        self.assertTrue(all(len(chunk) <= 2**16 for chunk in stdout_chunks))
+        self.assertEqual(results[-1]["result"], "pass")
+
     @skipUnlessPathExists("/bin/false")
     def test_runner_exec_test_fail(self):
         runnable = Runnable("exec-test", "/bin/false")
@@ -164,6 +185,41 @@ class Runner(unittest.TestCase):
 
 
 @skipUnlessPathExists("/bin/sh")
+class Waiters(unittest.TestCase):
+    def test_process(self):
+        with subprocess.Popen([sys.executable, "-c", "pass"]) as process:
+            with process_waiter(process.pid) as wait:
+                start = time.monotonic()
+                wait(60)
+                self.assertLess(time.monotonic() - start, 30)
+            self.assertEqual(process.wait(), 0)
+
+    def test_queue(self):
+        queue = multiprocessing.SimpleQueue()
+        wait = get_queue_waiter(queue)
+        self.assertFalse(wait(0.01))
+        queue.put({"status": "finished"})
+        self.assertTrue(wait(60))
+
+    def test_queue_loop(self):
+        queue = multiprocessing.SimpleQueue()
+        queue.put({"status": "running", "type": "stdout", "log": b"foo"})
+        queue.put({"status": "finished", "result": "pass"})
+        runner = Runnable("noop", None).pick_runner_class()()
+        messages = [
+            message
+            for message in runner.queue_loop(queue)
+            if message.get("type") == "stdout" or message["status"] == "finished"
+        ]
+        self.assertEqual(
+            messages,
+            [
+                {"status": "running", "type": "stdout", "log": b"foo"},
+                {"status": "finished", "result": "pass"},
+            ],
+        )
+
+
 class RunnerCommandSelection(unittest.TestCase):
     def setUp(self):
         self.kind = "mykind"
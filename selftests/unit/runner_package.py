@@ -94,6 +94,27 @@ class ActionTests(unittest.TestCase):
         stdout = b"Package foo already installed"
         self.assertIn(stdout, messages[-3]["log"])
 
+    def test_batch_install(self):
+
+        self.mock_sm.return_value.check_installed_batch = lambda names: {
+            name: name == "foo" for name in names
+        }
+        self.mock_sm.return_value.install_batch = lambda names: names == ["bar", "baz"]
+        runnable = Runnable(
+            kind="package", uri=None, **{"action": "install", "name": "foo bar baz"}
+        )
+        runner = PackageRunner()
+        status = runner.run(runnable)
+        messages = []
+        while True:
+            try:
+                messages.append(next(status))
+            except StopIteration:
+                break
+        self.assertEqual(messages[-1]["result"], "pass")
+        stdout = b"Package(s) bar baz installed successfully"
+        self.assertIn(stdout, messages[-3]["log"])
+
     def test_fail_install(self):
 
         self.mock_sm.return_value.check_installed = lambda check_installed: False
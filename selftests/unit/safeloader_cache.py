@@ -0,0 +1,98 @@
+import os
+import unittest.mock
+
+from avocado.core.safeloader import cache
+from avocado.core.safeloader.core import find_avocado_tests
+from avocado.core.safeloader.module import PythonModule
+from selftests.utils import TestCaseTmpDir
+
+BASE = """from avocado import Test
+
+
+class Base(Test):
+    def test_base(self):
+        pass
+"""
+
+TEST = """from base import Base
+
+
+class MyTest(Base):
+    '''
+    :avocado: tags=fast,arch:x86_64
+    '''
+
+    def test_mine(self):
+        pass
+"""
+
+
+class ParsedModules(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmpdir.name, "base.py")
+        with open(self.path, "w", encoding="utf-8") as base_file:
+            base_file.write(BASE)
+
+    def test_shared(self):
+        self.assertIs(PythonModule(self.path).mod, PythonModule(self.path).mod)
+
+    def test_changed(self):
+        module = PythonModule(self.path)
+        with open(self.path, "a", encoding="utf-8") as base_file:
+            base_file.write("\n\nclass Other(Base):\n    pass\n")
+        changed = PythonModule(self.path)
+        self.assertIsNot(module.mod, changed.mod)
+        self.assertNotEqual(module.signature, changed.signature)
+        self.assertEqual(len(list(changed.iter_classes())), 2)
+
+
+class DiscoveryCache(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.base_path = os.path.join(self.tmpdir.name, "base.py")
+        with open(self.base_path, "w", encoding="utf-8") as base_file:
+            base_file.write(BASE)
+        self.path = os.path.join(self.tmpdir.name, "test.py")
+        with open(self.path, "w", encoding="utf-8") as test_file:
+            test_file.write(TEST)
+        cache_dir = os.path.join(self.tmpdir.name, "cache")
+        patcher = unittest.mock.patch.object(cache, "CACHE_DIR", cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_saved(self):
+        found = find_avocado_tests(self.path, cache=True)
+        self.assertEqual(cache.load("avocado", "Test", self.path), found)
+        self.assertEqual(
+            found[0]["MyTest"][0], ("test_mine", {"fast": None, "arch": {"x86_64"}}, [])
+        )
+        entries = cache.get_entries()
+        self.assertEqual(entries, [("avocado.Test", self.path, 2)])
+        cache.clear()
+        self.assertEqual(cache.get_entries(), [])
+
+    def test_touched(self):
+        find_avocado_tests(self.path, cache=True)
+        stat = os.stat(self.base_path)
+        os.utime(self.base_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertIsNotNone(cache.load("avocado", "Test", self.path))
+
+    def test_parent_changed(self):
+        find_avocado_tests(self.path, cache=True)
+        with open(self.base_path, "w", encoding="utf-8") as base_file:
+            base_file.write(BASE.replace("test_base", "test_other"))
+        self.assertIsNone(cache.load("avocado", "Test", self.path))
+        found, _ = find_avocado_tests(self.path, cache=True)
+        self.assertEqual(
+            [method for method, _, _ in found["MyTest"]], ["test_mine", "test_other"]
+        )
+
+    def test_parent_not_found(self):
+        os.unlink(self.base_path)
+        self.assertEqual(find_avocado_tests(self.path, cache=True), ({}, set()))
+        self.assertIsNone(cache.load("avocado", "Test", self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
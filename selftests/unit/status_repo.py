@@ -1,6 +1,8 @@
+import asyncio
 from unittest import TestCase
 
 from avocado.core.status import repo, utils
+from avocado.core.test_id import TestID
 
 
 class StatusRepo(TestCase):
@@ -52,7 +54,22 @@ class StatusRepo(TestCase):
         self.assertEqual(
             self.status_repo.get_all_task_data("1-foo"), [{"status": "finished"}]
         )
-        self.assertEqual(self.status_repo._by_result.get(None), ["1-foo"])
+        self.assertEqual(self.status_repo._by_result.get(None), {"1-foo"})
+
+    def test_get_result_set_for_tasks(self):
+        self.status_repo._handle_task_finished(
+            {"id": "1-foo", "status": "finished", "result": "fail"}
+        )
+        self.status_repo._handle_task_finished(
+            {"id": "2-bar", "status": "finished", "result": "pass"}
+        )
+        self.assertEqual(
+            self.status_repo.get_result_set_for_tasks([TestID(1, "foo")]), {"fail"}
+        )
+        self.assertEqual(
+            self.status_repo.get_result_set_for_tasks(["1-foo", "2-bar"]),
+            {"fail", "pass"},
+        )
 
     def test_handle_task_finished_result(self):
         msg = {"id": "1-foo", "status": "finished", "result": "pass"}
@@ -61,7 +78,7 @@ class StatusRepo(TestCase):
             self.status_repo.get_all_task_data("1-foo"),
             [{"status": "finished", "result": "pass"}],
         )
-        self.assertEqual(self.status_repo._by_result.get("pass"), ["1-foo"])
+        self.assertEqual(self.status_repo._by_result.get("pass"), {"1-foo"})
 
     def test_process_message_running(self):
         msg = {
@@ -211,3 +228,105 @@ class StatusRepo(TestCase):
         )
         with self.assertRaises(IndexError):
             self.status_repo.status_journal_summary_pop()
+
+    def test_wait_task_finished(self):
+        msg = {
+            "id": "1-foo",
+            "status": "finished",
+            "time": 1000000001.0,
+            "result": "pass",
+            "job_id": "0000000000000000000000000000000000000000",
+        }
+
+        async def finish_later():
+            await asyncio.sleep(0)
+            self.status_repo.process_message(msg)
+
+        async def wait():
+            waiter = asyncio.ensure_future(self.status_repo.wait_task_finished("1-foo"))
+            await finish_later()
+            return await asyncio.wait_for(waiter, 5)
+
+        data = asyncio.run(wait())
+        self.assertEqual(data["result"], "pass")
+        # an already finished task returns immediately
+        data = asyncio.run(self.status_repo.wait_task_finished("1-foo"))
+        self.assertEqual(data["result"], "pass")
+
+    def test_status_journal_summary_get(self):
+        msg = {
+            "id": "1-foo",
+            "status": "started",
+            "time": 1000000001.0,
+            "output_dir": "/fake/path",
+            "job_id": "0000000000000000000000000000000000000000",
+        }
+
+        async def get():
+            getter = asyncio.ensure_future(
+                self.status_repo.status_journal_summary_get()
+            )
+            await asyncio.sleep(0)
+            self.assertFalse(getter.done())
+            self.status_repo.process_message(msg)
+            return await asyncio.wait_for(getter, 5)
+
+        self.assertEqual(asyncio.run(get()), (1000000001.0, "1-foo", "started", 0))
+        self.assertEqual(self.status_repo.status_journal_summary_size, 0)
+
+    def test_wait_status_journal_empty(self):
+        for status, time in (("started", 1000000001.0), ("running", 1000000002.0)):
+            msg = {
+                "id": "1-foo",
+                "status": status,
+                "time": time,
+                "output_dir": "/fake/path",
+                "job_id": "0000000000000000000000000000000000000000",
+            }
+            self.status_repo.process_message(msg)
+
+        async def wait():
+            waiter = asyncio.ensure_future(self.status_repo.wait_status_journal_empty())
+            await self.status_repo.status_journal_summary_get()
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+            await self.status_repo.status_journal_summary_get()
+            await asyncio.wait_for(waiter, 5)
+
+        asyncio.run(wait())
+        self.assertEqual(self.status_repo.status_journal_summary_size, 0)
+        # an empty journal returns immediately
+        asyncio.run(self.status_repo.wait_status_journal_empty())
+
+
+class CompactStatusRepo(StatusRepo):
+    def setUp(self):
+        job_id = "0000000000000000000000000000000000000000"
+        self.status_repo = repo.StatusRepo(job_id, compact=True)
+
+    def tearDown(self):
+        self.status_repo.close()
+
+    def test_set_task_data(self):
+        self.status_repo._set_task_data({"id": "1-foo", "status": "started"})
+        (record,) = self.status_repo._all_data["1-foo"]
+        self.assertIsInstance(record, repo.StatusRecord)
+        self.assertEqual(record.status, "started")
+        self.assertEqual(
+            self.status_repo.get_all_task_data("1-foo"), [{"status": "started"}]
+        )
+
+    def test_log_kept_on_store(self):
+        log = b"x" * 1024 * 1024
+        msg = {
+            "id": "1-foo",
+            "status": "running",
+            "type": "stdout",
+            "log": log,
+            "time": 1597894378.6080744,
+            "job_id": "0000000000000000000000000000000000000000",
+        }
+        self.status_repo.process_message(msg)
+        self.assertGreater(self.status_repo.store_size, len(log))
+        self.assertLess(self.status_repo.memory_footprint, len(log))
+        self.assertEqual(self.status_repo.get_task_data("1-foo", 0)["log"], log)
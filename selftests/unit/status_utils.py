@@ -17,3 +17,28 @@ class JSON(TestCase):
     def test_loads_base64(self):
         data = '{"__base64_encoded__": "dGhpcyBpcyBob3cgd2UgZW5jb2RlIGJ5dGVz"}'
         self.assertEqual(utils.json_loads(data), b"this is how we encode bytes")
+
+
+class Frame(TestCase):
+    def _roundtrip(self, message):
+        frame = utils.frame_encode(message)
+        header_size, payload_size = utils.FRAME_PREFIX.unpack_from(frame)
+        start = utils.FRAME_PREFIX.size
+        header = frame[start : start + header_size]
+        payload = frame[start + header_size :]
+        self.assertEqual(len(payload), payload_size)
+        return utils.frame_decode(header, payload)
+
+    def test_roundtrip(self):
+        message = {"status": "started", "id": "1-foo", "time": 1.5}
+        self.assertEqual(self._roundtrip(message), message)
+
+    def test_roundtrip_bytes(self):
+        message = {
+            "status": "running",
+            "type": "stdout",
+            "log": b"\x00\xffbinary\n",
+            "other": b"",
+            "id": "1-foo",
+        }
+        self.assertEqual(self._roundtrip(message), message)
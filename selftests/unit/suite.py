@@ -96,6 +96,26 @@ class TestSuiteTest(unittest.TestCase):
         runnable = suite.tests[0]
         self.assertEqual(runnable.config.get("runner.identifier_format"), "nothing-op")
 
+    def test_variants(self):
+        config = {
+            "resolver.references": [
+                "examples/nrunner/recipes/runnable/noop.json",
+                "examples/nrunner/recipes/runnable/noop_config.json",
+            ],
+            "run.dict_variants": [{"foo": "bar"}, {"foo": "baz"}],
+            "run.execution_order": "tests-per-variant",
+        }
+        suite = TestSuite.from_config(config)
+        self.assertEqual(len(suite.tests), 4)
+        first, second, third, _ = suite.tests
+        self.assertEqual(first.uri, third.uri)
+        self.assertIsNot(first, third)
+        self.assertIs(first.kwargs, third.kwargs)
+        self.assertIs(first.variant, second.variant)
+        self.assertNotEqual(first.variant, third.variant)
+        first.output_dir = "/foo"
+        self.assertIsNone(third.output_dir)
+
     def tearDown(self):
         self.tmpdir.cleanup()
 
@@ -1,7 +1,8 @@
 import unittest
 
 from avocado.core.nrunner.runnable import Runnable
-from avocado.core.nrunner.task import Task
+from avocado.core.nrunner.task import Task, TaskStatusService
+from avocado.core.status.utils import FRAME_PREFIX, frame_decode
 
 
 class TaskTest(unittest.TestCase):
@@ -14,3 +15,64 @@ class TaskTest(unittest.TestCase):
         runnable = Runnable("noop", "noop_uri")
         task = Task(runnable, "task_id", category="new_category")
         self.assertEqual(task.category, "new_category")
+
+    def test_compact(self):
+        task = Task(Runnable("noop", "noop_uri"), "task_id")
+        self.assertFalse(hasattr(task, "__dict__"))
+        self.assertFalse(hasattr(task.runnable, "__dict__"))
+        with self.assertRaises(AttributeError):
+            task.unknown = True
+
+
+class TaskStatusServiceFramed(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        self.service = TaskStatusService("/nonexistent", protocol="framed")
+        self.service._send = self.sent.append
+
+    def _received(self):
+        data = b"".join(self.sent)
+        messages = []
+        while data:
+            header_size, payload_size = FRAME_PREFIX.unpack_from(data)
+            start = FRAME_PREFIX.size
+            end = start + header_size + payload_size
+            messages.append(
+                frame_decode(
+                    data[start : start + header_size], data[start + header_size : end]
+                )
+            )
+            data = data[end:]
+        return messages
+
+    def test_coalesce_output(self):
+        for log in (b"a", b"b", b"c"):
+            self.service.post(
+                {"status": "running", "type": "stdout", "log": log, "id": "1"}
+            )
+        self.service.post(
+            {"status": "running", "type": "stderr", "log": b"d", "id": "1"}
+        )
+        self.assertEqual(self.sent, [])
+        self.service.post({"status": "finished", "result": "pass", "id": "1"})
+        self.assertEqual(
+            self._received(),
+            [
+                {"status": "running", "type": "stdout", "log": b"abc", "id": "1"},
+                {"status": "running", "type": "stderr", "log": b"d", "id": "1"},
+                {"status": "finished", "result": "pass", "id": "1"},
+            ],
+        )
+
+    def test_no_coalesce_encoded(self):
+        message = {
+            "status": "running",
+            "type": "stdout",
+            "log": b"a",
+            "encoding": "utf-8",
+            "id": "1",
+        }
+        self.service.post(message)
+        self.service.post(message)
+        self.service.post({"status": "finished", "result": "pass", "id": "1"})
+        self.assertEqual(len(self._received()), 3)
@@ -4,7 +4,11 @@ from unittest import TestCase
 from avocado.core.nrunner.runnable import Runnable
 from avocado.core.nrunner.task import Task
 from avocado.core.suite import TestSuite
-from avocado.core.task.runtime import RuntimeTask, RuntimeTaskGraph
+from avocado.core.task.runtime import (
+    RuntimeTask,
+    RuntimeTaskGraph,
+    RuntimeTaskStatus,
+)
 from avocado.utils import script
 from selftests.utils import TestCaseTmpDir
 
@@ -57,6 +61,33 @@ class Runtime(TestCase):
         self.assertEqual(self.runtime_task.status, "LOST CONTACT")
 
 
+class Dependencies(TestCase):
+    def _task(self, name):
+        return RuntimeTask(Task(Runnable("noop", "noop"), name))
+
+    def test_finished(self):
+        test = self._task("test")
+        first = self._task("first")
+        second = self._task("second")
+        test.add_dependency(first)
+        # added without add_dependency(), still accounted for
+        test.dependencies.append(second)
+        self.assertFalse(test.are_dependencies_finished())
+        self.assertEqual(first.dependents, [test])
+        first.status = RuntimeTaskStatus.FINISHED
+        self.assertFalse(test.are_dependencies_finished())
+        self.assertEqual(test.get_finished_dependencies(), [first])
+        second.status = RuntimeTaskStatus.FAIL_TRIAGE
+        self.assertTrue(test.are_dependencies_finished())
+
+    def test_already_finished(self):
+        test = self._task("test")
+        dependency = self._task("dependency")
+        dependency.status = RuntimeTaskStatus.IN_CACHE
+        test.add_dependency(dependency)
+        self.assertTrue(test.are_dependencies_finished())
+
+
 class DependencyGraph(TestCaseTmpDir):
     def test_one_dependency(self):
         with script.Script(
@@ -68,11 +99,11 @@ class DependencyGraph(TestCaseTmpDir):
             tests = suite.tests
             graph = RuntimeTaskGraph(tests, suite.name, 1, "", "")
             runtime_tests = graph.get_tasks_in_topological_order()
+            self.assertEqual(len(runtime_tests), 4)
             self.assertTrue(runtime_tests[0].task.identifier.name.endswith("test_a"))
             self.assertTrue(runtime_tests[1].task.identifier.name.endswith("hello"))
             self.assertTrue(runtime_tests[2].task.identifier.name.endswith("test_b"))
-            self.assertTrue(runtime_tests[3].task.identifier.name.endswith("hello"))
-            self.assertTrue(runtime_tests[4].task.identifier.name.endswith("test_c"))
+            self.assertTrue(runtime_tests[3].task.identifier.name.endswith("test_c"))
 
     def test_multiple_dependencies(self):
         with script.Script(
@@ -84,9 +115,78 @@ class DependencyGraph(TestCaseTmpDir):
             tests = suite.tests
             graph = RuntimeTaskGraph(tests, suite.name, 1, "", "")
             runtime_tests = graph.get_tasks_in_topological_order()
+            self.assertEqual(len(runtime_tests), 5)
             self.assertTrue(runtime_tests[0].task.identifier.name.endswith("hello"))
             self.assertTrue(runtime_tests[1].task.identifier.name.endswith("test_a"))
             self.assertTrue(runtime_tests[2].task.identifier.name.endswith("test_b"))
-            self.assertTrue(runtime_tests[3].task.identifier.name.endswith("hello"))
-            self.assertTrue(runtime_tests[4].task.identifier.name.endswith("-foo-bar-"))
-            self.assertTrue(runtime_tests[5].task.identifier.name.endswith("test_c"))
+            self.assertTrue(runtime_tests[3].task.identifier.name.endswith("-foo-bar-"))
+            self.assertTrue(runtime_tests[4].task.identifier.name.endswith("test_c"))
+
+    def test_shared_dependency(self):
+        with script.Script(
+            os.path.join(self.tmpdir.name, "test_single_dependency.py"),
+            SINGLE_REQUIREMENT,
+        ) as test:
+            config = {"resolver.references": [test.path]}
+            suite = TestSuite.from_config(config=config)
+            graph = RuntimeTaskGraph(suite.tests, suite.name, 1, "", "")
+            _, hello, test_b, test_c = graph.get_tasks_in_topological_order()
+            self.assertEqual(test_b.dependencies, [hello])
+            self.assertIs(test_c.dependencies[0], hello)
+            # each dependent test still gets its own link to the dependency
+            self.assertEqual(
+                hello.task.metadata["symlinks"],
+                [
+                    os.path.join(
+                        test_b.task.runnable.output_dir, "dependencies", "package-hello"
+                    ),
+                    os.path.join(
+                        test_c.task.runnable.output_dir, "dependencies", "package-hello"
+                    ),
+                ],
+            )
+
+    def test_batch_packages(self):
+        with script.Script(
+            os.path.join(self.tmpdir.name, "test_multiple_dependencies.py"),
+            MULTIPLE_REQUIREMENT,
+        ) as test:
+            config = {"resolver.references": [test.path]}
+            suite = TestSuite.from_config(config=config)
+            graph = RuntimeTaskGraph(
+                suite.tests, suite.name, 1, "", "", batch_packages=True
+            )
+            runtime_tests = graph.get_tasks_in_topological_order()
+            self.assertEqual(len(runtime_tests), 6)
+            batch = runtime_tests[0]
+            self.assertEqual(batch.task.identifier.name, "package-batch")
+            self.assertEqual(batch.task.runnable.kwargs["name"], "hello -foo-bar-")
+            packages = [task for task in runtime_tests if batch in task.dependencies]
+            self.assertEqual(
+                [task.task.runnable.kwargs["name"] for task in packages],
+                ["hello", "-foo-bar-"],
+            )
+            # the packages are still installed one by one if the batch fails
+            self.assertIn("error", packages[0].satisfiable_deps_execution_statuses)
+
+    def _chain(self, length):
+        graph = RuntimeTaskGraph([], "suite", 1, "", "")
+        tasks = [
+            RuntimeTask(Task(Runnable("noop", "noop"), str(index)))
+            for index in range(length)
+        ]
+        graph.graph[tasks[0]] = tasks[0]
+        for dependency, task in zip(tasks, tasks[1:]):
+            graph._connect_tasks([dependency], [task], [])  # pylint: disable=W0212
+        return graph, tasks
+
+    def test_deep_chain(self):
+        # a lot deeper than the recursion limit
+        graph, tasks = self._chain(5000)
+        self.assertEqual(graph.get_tasks_in_topological_order(), tasks)
+
+    def test_circular(self):
+        graph, tasks = self._chain(3)
+        tasks[0].add_dependency(tasks[2])
+        with self.assertRaises(ValueError):
+            graph.get_tasks_in_topological_order()
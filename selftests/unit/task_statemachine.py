@@ -0,0 +1,135 @@
+import asyncio
+from unittest import TestCase
+
+from avocado.core.nrunner.runnable import Runnable
+from avocado.core.nrunner.task import Task
+from avocado.core.spawners.mock import MockSpawner
+from avocado.core.status.repo import StatusRepo
+from avocado.core.task.runtime import PreRuntimeTask, RuntimeTask, RuntimeTaskStatus
+from avocado.core.task.statemachine import SCHEDULERS
+from avocado.core.utils import messages
+
+JOB_ID = "job"
+
+
+class InstantSpawner(MockSpawner):
+    """Spawner whose tasks finish as soon as spawned, with a chosen result."""
+
+    def __init__(self, status_repo, results=None):
+        super().__init__()
+        self._status_repo = status_repo
+        self._results = results or {}
+        self.spawned = []
+        self.cached = []
+
+    def is_task_alive(self, runtime_task):  # pylint: disable=W0221
+        return False
+
+    async def spawn_task(self, runtime_task):
+        task_id = str(runtime_task.task.identifier)
+        self.spawned.append(task_id)
+        result = self._results.get(task_id, "pass")
+        self._status_repo.process_message(
+            messages.StartedMessage.get(output_dir="", id=task_id, job_id=JOB_ID)
+        )
+        self._status_repo.process_message(
+            messages.FinishedMessage.get(result, id=task_id, job_id=JOB_ID)
+        )
+        return True
+
+    async def is_requirement_in_cache(self, runtime_task):
+        return False
+
+    async def update_requirement_cache(self, runtime_task, result):
+        self.cached.append(str(runtime_task.task.identifier))
+
+
+class EventScheduler(TestCase):
+    def setUp(self):
+        self.runnable = Runnable("noop", "noop")
+        self.runnable.output_dir = "output_dir"
+        self.status_repo = StatusRepo(JOB_ID)
+
+    def _run(self, tasks, spawner, number_of_workers=4, added=None):
+        state_machine_class, worker_class = SCHEDULERS["event"]
+        state_machine = state_machine_class(tasks, self.status_repo)
+
+        async def add_new_tasks():
+            # once the given tasks are waiting for the ones to be added
+            while len(state_machine.waiting_dependencies) < len(tasks):
+                await asyncio.sleep(0.01)
+            for runtime_task in added:
+                await state_machine.add_new_task(runtime_task)
+
+        async def run():
+            workers = [
+                worker_class(
+                    state_machine, spawner, max_running=number_of_workers
+                ).run()
+                for _ in range(number_of_workers)
+            ]
+            if added:
+                workers.append(add_new_tasks())
+            await asyncio.gather(*workers)
+
+        asyncio.run(asyncio.wait_for(run(), 30))
+        return state_machine
+
+    def _test(self, name):
+        return RuntimeTask(Task(self.runnable, name, job_id=JOB_ID))
+
+    def _pre(self, name):
+        return PreRuntimeTask(
+            Task(self.runnable, name, category="pre_test", job_id=JOB_ID)
+        )
+
+    def test_all_finished(self):
+        tasks = [self._test(f"{_:03}") for _ in range(100)]
+        spawner = InstantSpawner(self.status_repo)
+        state_machine = self._run(tasks, spawner)
+        self.assertEqual(len(state_machine.finished), 100)
+        self.assertTrue(
+            all(task.status == RuntimeTaskStatus.FINISHED for task in tasks)
+        )
+
+    def test_dependency_before_dependent(self):
+        pre = self._pre("pre")
+        test = self._test("test")
+        test.dependencies.append(pre)
+        spawner = InstantSpawner(self.status_repo)
+        # the dependent task is requested first, and has to wait
+        state_machine = self._run([test, pre], spawner)
+        self.assertEqual(len(state_machine.finished), 2)
+        self.assertEqual(spawner.spawned, ["pre", "test"])
+        self.assertEqual(test.result, "pass")
+
+    def test_dependency_added(self):
+        pre = self._pre("pre")
+        test = self._test("test")
+        test.dependencies.append(pre)
+        spawner = InstantSpawner(self.status_repo)
+        state_machine = self._run([test], spawner, added=[pre])
+        self.assertEqual(len(state_machine.finished), 2)
+        self.assertEqual(spawner.spawned, ["pre", "test"])
+        self.assertEqual(pre.dependents, [test])
+
+    def test_only_cacheable_cached(self):
+        cacheable = self._pre("cacheable")
+        cacheable.is_cacheable = True
+        pre = self._pre("pre")
+        test = self._test("test")
+        test.dependencies.extend([cacheable, pre])
+        spawner = InstantSpawner(self.status_repo)
+        self._run([cacheable, pre, test], spawner)
+        self.assertEqual(spawner.cached, ["cacheable"])
+
+    def test_dependency_failed(self):
+        pre = self._pre("pre")
+        test = self._test("test")
+        test.dependencies.append(pre)
+        spawner = InstantSpawner(self.status_repo, {"pre": "fail"})
+        state_machine = self._run([test, pre], spawner)
+        self.assertEqual(len(state_machine.finished), 2)
+        self.assertEqual(spawner.spawned, ["pre"])
+        self.assertEqual(test.status, RuntimeTaskStatus.FAIL_TRIAGE)
+        self.assertEqual(self.status_repo.get_task_status("test"), "finished")
@@ -1,8 +1,15 @@
 import os
+import sqlite3
 import tempfile
-import unittest
+import time
+import unittest.mock
 
-from avocado.utils.asset import Asset
+from avocado.utils.asset import (
+    CATALOG_FILENAME,
+    HASH_SIGNATURE_FIELD,
+    Asset,
+    AssetCatalog,
+)
 from selftests.utils import TestCaseTmpDir, setup_avocado_loggers
 
 setup_avocado_loggers()
@@ -61,5 +68,154 @@ class TestAsset(TestCaseTmpDir):
         self.assertEqual(result, 2, msg)
 
 
+class HashFile(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.asset_path = os.path.join(self.tmpdir.name, "foo.tgz")
+        with open(self.asset_path, "w", encoding="utf-8") as asset_file:
+            asset_file.write("Test!")
+        self.asset_hash = "3a033a8938c1af56eeb793669db83bcbd0c17ea5"
+        Asset(name=self.asset_path)._create_hash_file(self.asset_path)
+
+    def test_trusted(self):
+        with unittest.mock.patch("avocado.utils.crypto.hash_file") as hash_file:
+            self.assertTrue(Asset._has_valid_hash(self.asset_path, self.asset_hash))
+        hash_file.assert_not_called()
+
+    def test_legacy_rehashed(self):
+        hash_file_path = Asset._get_hash_file(self.asset_path)
+        with open(hash_file_path, "w", encoding="utf-8") as f:
+            f.write(f"sha1 {self.asset_hash}\n")
+        with open(self.asset_path, "a", encoding="utf-8") as asset_file:
+            asset_file.write("Corrupted!")
+        self.assertFalse(Asset._has_valid_hash(self.asset_path, self.asset_hash))
+        with open(hash_file_path, "r", encoding="utf-8") as f:
+            self.assertTrue(f.readline().startswith(HASH_SIGNATURE_FIELD))
+        with unittest.mock.patch("avocado.utils.crypto.hash_file") as hash_file:
+            self.assertFalse(Asset._has_valid_hash(self.asset_path, self.asset_hash))
+        hash_file.assert_not_called()
+
+    def test_changed(self):
+        with open(self.asset_path, "a", encoding="utf-8") as asset_file:
+            asset_file.write("Changed!")
+        self.assertFalse(Asset._has_valid_hash(self.asset_path, self.asset_hash))
+        self.assertEqual(
+            Asset.read_hash_from_file(Asset._get_hash_file(self.asset_path)),
+            ["sha1", "bcf8c2b7b38a920ab7b4ff054e336ee5977bb838"],
+        )
+
+    def test_verify(self):
+        self.assertEqual(Asset.verify_asset_file(self.asset_path), [])
+        stats = os.stat(self.asset_path)
+        with open(self.asset_path, "w", encoding="utf-8") as asset_file:
+            asset_file.write("Test?")
+        os.utime(self.asset_path, ns=(stats.st_atime_ns, stats.st_mtime_ns))
+        self.assertTrue(Asset._has_valid_hash(self.asset_path, self.asset_hash))
+        self.assertEqual(Asset.verify_asset_file(self.asset_path), ["sha1"])
+        self.assertFalse(Asset._has_valid_hash(self.asset_path, self.asset_hash))
+
+
+class Catalog(TestCaseTmpDir):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = os.path.join(self.tmpdir.name, "cache")
+        self.image = self._create_asset(
+            "by_name",
+            "image.qcow2",
+            b"image",
+            {"type": "vmimage", "name": "Fedora", "version": 42},
+        )
+        self.tarball = self._create_asset("by_location", "foo.tgz", b"tarball" * 100)
+
+    def _create_asset(self, relative_dir, name, content, metadata=None):
+        directory = os.path.join(self.cache_dir, relative_dir)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, name)
+        with open(path, "wb") as asset_file:
+            asset_file.write(content)
+        Asset(name=path)._create_hash_file(path)
+        if metadata is not None:
+            Asset(name=path, metadata=metadata)._create_metadata_file(path)
+        return path
+
+    def test_find(self):
+        with AssetCatalog(self.cache_dir) as catalog:
+            self.assertEqual(
+                [entry.path for entry in catalog.find(sort=False)],
+                [self.tarball, self.image],
+            )
+            (entry,) = catalog.find(metadata={"type": "vmimage", "version": 42})
+            self.assertEqual(entry.path, self.image)
+            self.assertEqual(entry.size, 5)
+            self.assertEqual(entry.metadata["name"], "Fedora")
+            self.assertEqual(
+                entry.hashes, {"sha1": "0e76292794888d4f1fa75fb3aff4ca27c58f56a6"}
+            )
+            (entry,) = catalog.find(asset_hash=entry.hashes["sha1"])
+            self.assertEqual(entry.path, self.image)
+            self.assertEqual(catalog.find(name="foo.tgz")[0].path, self.tarball)
+            self.assertEqual(catalog.find(size_filter=(">", 100))[0].path, self.tarball)
+            self.assertEqual(catalog.find(metadata={"type": "other"}), [])
+        self.assertTrue(os.path.isfile(os.path.join(self.cache_dir, CATALOG_FILENAME)))
+
+    def test_updated(self):
+        self.assertEqual(len(Asset.get_all_assets([self.cache_dir])), 2)
+        # not seen, as not added by Avocado
+        other = self._create_asset("by_name", "other", b"other")
+        self.assertEqual(len(Asset.get_all_assets([self.cache_dir])), 2)
+        fetched = Asset(
+            name="fetched", locations=[other, other], cache_dirs=[self.cache_dir]
+        ).fetch()
+        self.assertEqual(Asset.get_all_assets([self.cache_dir])[0], fetched)
+        Asset.remove_asset_by_path(self.image)
+        self.assertEqual(
+            Asset.get_all_assets([self.cache_dir]), [fetched, self.tarball]
+        )
+        self.assertEqual(Asset.rebuild_catalogs([self.cache_dir]), {self.cache_dir: 3})
+
+    def test_unused_for_days(self):
+        past = time.time() - 3 * 24 * 60 * 60
+        os.utime(self.tarball, (past, past))
+        self.assertEqual(
+            Asset.get_assets_unused_for_days(2, [self.cache_dir]), [self.tarball]
+        )
+        self.assertEqual(
+            Asset.get_assets_by_size(">=700", [self.cache_dir]), [self.tarball]
+        )
+        self.assertEqual(
+            Asset.get_assets_by_size("<700", [self.cache_dir]), [self.image]
+        )
+
+    def test_used_by_others(self):
+        past = time.time() - 3 * 24 * 60 * 60
+        os.utime(self.tarball, (past, past))
+        os.utime(self.image, (past, past))
+        self.assertEqual(len(Asset.get_assets_unused_for_days(2, [self.cache_dir])), 2)
+        # read (and removed) by something other than Avocado
+        os.utime(self.tarball, (time.time(), past))
+        os.remove(self.image)
+        self.assertEqual(Asset.get_assets_unused_for_days(2, [self.cache_dir]), [])
+        with AssetCatalog(self.cache_dir) as catalog:
+            (entry,) = catalog.find()
+            self.assertEqual(entry.path, self.tarball)
+            (atime,) = catalog.connection.execute("SELECT atime FROM asset").fetchone()
+            self.assertGreater(atime, past)
+
+    def test_not_writable(self):
+        connect = sqlite3.connect
+
+        def only_in_memory(path, *args, **kwargs):
+            if path != ":memory:":
+                raise sqlite3.OperationalError("unable to open database file")
+            return connect(path, *args, **kwargs)
+
+        with unittest.mock.patch("sqlite3.connect", side_effect=only_in_memory):
+            self.assertEqual(
+                Asset.get_all_assets([self.cache_dir], sort=False),
+                [self.tarball, self.image],
+            )
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, CATALOG_FILENAME)))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import os
+import shutil
 import unittest
 
 from avocado.utils import distro
@@ -46,6 +47,15 @@ class Dpkg(unittest.TestCase):
         dpkg = backends.dpkg.DpkgBackend
         self.assertFalse(dpkg.is_valid(not_deb_path))
 
+    @unittest.skipUnless(shutil.which("dpkg"), "dpkg is not available")
+    def test_check_installed_batch(self):
+        self.assertEqual(
+            backends.dpkg.DpkgBackend().check_installed_batch(
+                ["dpkg", "avocado-nonexistent-package"]
+            ),
+            {"dpkg": True, "avocado-nonexistent-package": False},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -393,12 +393,14 @@ if __name__ == "__main__":
                 "dict_variants = avocado.plugins.dict_variants:DictVariantsInit",
                 "json_variants = avocado.plugins.json_variants:JsonVariantsInit",
                 "run = avocado.plugins.run:RunInit",
+                "process = avocado.plugins.spawners.process:ProcessSpawnerInit",
                 "podman = avocado.plugins.spawners.podman:PodmanSpawnerInit",
                 "lxc = avocado.plugins.spawners.lxc:LXCSpawnerInit",
                 "nrunner = avocado.plugins.runner_nrunner:RunnerInit",
                 "testlogsui = avocado.plugins.testlogs:TestLogsUIInit",
                 "human = avocado.plugins.human:HumanInit",
                 "exec-runnables-recipe = avocado.plugins.resolvers:ExecRunnablesRecipeInit",
+                "python-resolvers = avocado.plugins.resolvers:PythonResolverInit",
             ],
             "avocado.plugins.cli": [
                 "xunit = avocado.plugins.xunit:XUnitCLI",
@@ -450,6 +452,7 @@ if __name__ == "__main__":
             "avocado.plugins.result_events": [
                 "human = avocado.plugins.human:Human",
                 "tap = avocado.plugins.tap:TAPResult",
+                "jsonl = avocado.plugins.jsonresult:JSONLinesResult",
                 "journal = avocado.plugins.journal:JournalResult",
                 "fetchasset = avocado.plugins.assets:FetchAssetJob",
                 "sysinfo = avocado.plugins.sysinfo:SysInfoJob",
@@ -497,6 +500,7 @@ if __name__ == "__main__":
             ],
             "avocado.plugins.cache": [
                 "requirement = avocado.plugins.requirement_cache:RequirementCache",
+                "discovery = avocado.plugins.discovery_cache:DiscoveryCache",
             ],
         },
         zip_safe=False,